@@ -0,0 +1,121 @@
+// app.js
+const path = require("path");
+const express = require("express");
+const cors = require("cors");
+const helmet = require("helmet");
+const morgan = require("morgan");
+require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
+
+const { sequelize } = require("./config/db");       // Sequelize instance
+const redisClient = require("./config/redis");       // Redis client
+const { hashPool } = require("./helpers/hashPool");
+const { register } = require("./helpers/metrics");
+const { metricsText } = require("./helpers/clusterMetrics");
+const logger = require("./helpers/logger");
+require("./models");
+
+// Middlewares
+const metricsMiddleware = require("./middlewares/metricsMiddleware");
+
+// Routes
+const authRoutes = require("./routes/auth");
+const businessRoutes = require("./routes/businesses");
+const reviewRoutes = require("./routes/reviews");
+const serviceRoutes = require("./routes/services");
+
+const SWAGGER_PATH = process.env.SWAGGER_PATH || path.join(__dirname, "swagger.yml");
+
+// Express app
+const app = express();
+app.locals.draining = false; // set by server.js during shutdown
+
+// Security & CORS
+app.use(helmet());
+app.use(cors());
+
+// While draining, ask keep-alive clients to reconnect elsewhere
+app.use((req, res, next) => {
+  if (app.locals.draining) res.set("Connection", "close");
+  next();
+});
+
+// Parsers
+app.use(express.json({ limit: "1mb" }));
+app.use(express.urlencoded({ extended: true }));
+
+// Logging (sampled; see helpers/logger.js)
+if (process.env.NODE_ENV !== "test") {
+  app.use(morgan("combined", { stream: logger.stream, skip: () => !logger.sampled() }));
+}
+
+// Request metrics
+app.use(metricsMiddleware);
+
+// Swagger docs, parsed on first use instead of at boot
+let docsRouter = null;
+const loadDocsRouter = () => {
+  try {
+    const swaggerUi = require("swagger-ui-express");
+    const YAML = require("yamljs");
+    const router = express.Router();
+    router.use(swaggerUi.serve, swaggerUi.setup(YAML.load(SWAGGER_PATH)));
+    return router;
+  } catch (err) {
+    console.error(`❌ API docs unavailable (${SWAGGER_PATH}):`, err.message);
+    return false;
+  }
+};
+
+app.use("/api-docs", (req, res, next) => {
+  if (docsRouter === null) docsRouter = loadDocsRouter();
+  if (!docsRouter) return res.status(404).json({ error: "API docs are not available" });
+  docsRouter(req, res, next);
+});
+
+// API routes
+app.use("/api/v1/auth", authRoutes);
+app.use("/api/v1/businesses", businessRoutes);
+app.use("/api/v1/reviews", reviewRoutes);
+app.use("/api/v1/services", serviceRoutes);
+
+// Prometheus metrics
+app.get("/metrics", async (req, res) => {
+  try {
+    res.set("Content-Type", register.contentType);
+    res.end(await metricsText(register));
+  } catch (err) {
+    res.status(500).end(err.message);
+  }
+});
+
+// Health check
+app.get("/health", async (req, res) => {
+  let dbStatus = "down";
+  let redisStatus = "down";
+
+  try {
+    await sequelize.authenticate();
+    dbStatus = "ok";
+  } catch (_) {}
+
+  try {
+    const ping = await redisClient.ping();
+    if (ping === "PONG") redisStatus = "ok";
+  } catch (_) {}
+
+  const status = app.locals.draining
+    ? "draining"
+    : dbStatus === "ok" && redisStatus === "ok" ? "ok" : "degraded";
+
+  // 503 while draining so load balancers stop routing here
+  res.status(app.locals.draining ? 503 : 200).json({
+    status,
+    database: dbStatus,
+    redis: redisStatus,
+    hashPool: hashPool.stats(),
+    uptime: process.uptime(),
+    timestamp: Date.now(),
+  });
+});
+
+module.exports = app;
@@ -0,0 +1,116 @@
+// cluster.js
+// Cluster primary: forks WORKERS HTTP workers (see config/cluster.js), which
+// share the listening port, and supervises them.
+//
+//   SIGHUP           rolling restart: each worker is replaced by a fresh one,
+//                    which must be listening before the old one drains
+//   SIGTERM/SIGINT   drain every worker, then exit
+//
+// Workers that die unexpectedly are replaced. Every worker's GET /metrics
+// returns the aggregate across all workers, collected here (see
+// helpers/clusterMetrics.js); with METRICS_PORT set, the primary also serves
+// it on that port.
+const cluster = require("cluster");
+const http = require("http");
+const { WORKERS } = require("./config/cluster");
+const { serveClusterMetrics } = require("./helpers/clusterMetrics");
+
+const RESTART_DELAY_MS = 1000; // for workers that die right after starting
+const MIN_HEALTHY_UPTIME_MS = 5000;
+
+const waitFor = (worker, event) => new Promise((resolve) => worker.once(event, resolve));
+
+function startPrimary() {
+  let shuttingDown = false;
+  let reloading = false;
+
+  const fork = () => {
+    const startedAt = Date.now();
+    const worker = cluster.fork({ CLUSTER_WORKER_COUNT: String(WORKERS) });
+    worker.startedAt = startedAt;
+    worker.once("listening", () => {
+      console.log(`👷 Worker ${worker.process.pid} listening ${Date.now() - startedAt}ms after fork`);
+    });
+    return worker;
+  };
+
+  // Keep WORKERS workers running (cluster.workers no longer lists the dead one)
+  cluster.on("exit", (worker, code, signal) => {
+    if (shuttingDown || worker.retiring) return;
+    console.error(`❌ Worker ${worker.process.pid} exited (${signal || code})`);
+    if (Object.keys(cluster.workers).length >= WORKERS) return;
+    const delay = Date.now() - worker.startedAt < MIN_HEALTHY_UPTIME_MS ? RESTART_DELAY_MS : 0;
+    setTimeout(() => {
+      if (!shuttingDown && Object.keys(cluster.workers).length < WORKERS) fork();
+    }, delay);
+  });
+
+  const rollingRestart = async () => {
+    if (reloading || shuttingDown) return;
+    reloading = true;
+    const started = Date.now();
+    console.log(`🔄 Rolling restart of ${Object.keys(cluster.workers).length} worker(s)...`);
+
+    for (const old of Object.values(cluster.workers)) {
+      if (shuttingDown) break;
+      if (!old || old.isDead()) continue;
+
+      const replacement = fork();
+      const ready = await Promise.race([
+        waitFor(replacement, "listening").then(() => true),
+        waitFor(replacement, "exit").then(() => false),
+      ]);
+      if (!ready) {
+        console.error("❌ Replacement worker failed to start; keeping the remaining workers");
+        break;
+      }
+
+      old.retiring = true;
+      const exited = waitFor(old, "exit");
+      old.process.kill("SIGTERM");
+      await exited;
+    }
+
+    reloading = false;
+    console.log(`✅ Rolling restart finished in ${Date.now() - started}ms`);
+  };
+
+  const shutdown = (signal) => {
+    if (shuttingDown) return;
+    shuttingDown = true;
+    console.log(`⚠️  Primary shutting down due to ${signal}, draining workers...`);
+
+    const exitWhenDone = () => {
+      if (Object.keys(cluster.workers).length === 0) process.exit(0);
+    };
+    cluster.on("exit", exitWhenDone);
+    Object.values(cluster.workers).forEach((worker) => worker.process.kill("SIGTERM"));
+    exitWhenDone();
+  };
+
+  // Aggregated metrics across workers
+  const registry = serveClusterMetrics();
+  if (process.env.METRICS_PORT) {
+    http.createServer(async (req, res) => {
+      if (req.url !== "/metrics") {
+        res.writeHead(404).end();
+        return;
+      }
+      try {
+        const body = await registry.clusterMetrics();
+        res.writeHead(200, { "Content-Type": registry.contentType }).end(body);
+      } catch (err) {
+        res.writeHead(500).end(err.message);
+      }
+    }).listen(process.env.METRICS_PORT);
+  }
+
+  process.on("SIGHUP", () => rollingRestart());
+  process.on("SIGTERM", () => shutdown("SIGTERM"));
+  process.on("SIGINT", () => shutdown("SIGINT"));
+
+  console.log(`🧭 Primary ${process.pid} starting ${WORKERS} worker(s)`);
+  for (let i = 0; i < WORKERS; i++) fork();
+}
+
+module.exports = { startPrimary };
@@ -0,0 +1,15 @@
+const os = require("os");
+require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
+
+const cpuCount = () => (os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+
+// HTTP worker processes: WEB_CONCURRENCY, else one per available CPU in
+// production and a single process everywhere else. 1 disables clustering.
+const defaultWorkers = process.env.NODE_ENV === "production" ? cpuCount() : 1;
+const WORKERS = Math.max(1, parseInt(process.env.WEB_CONCURRENCY || String(defaultWorkers), 10) || 1);
+
+// Number of sibling processes sharing per-host budgets (DB connections,
+// hashing threads). The primary passes it to every worker it forks.
+const PROCESS_COUNT = Math.max(1, parseInt(process.env.CLUSTER_WORKER_COUNT || "1", 10) || 1);
+
+module.exports = { cpuCount, WORKERS, PROCESS_COUNT };
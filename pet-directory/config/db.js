@@ -1,5 +1,8 @@
 const fs = require("fs");
 const { Sequelize } = require("sequelize");
+const { observeQuery, instrumentSequelize } = require("../helpers/metrics");
+const { log, sampled } = require("../helpers/logger");
+const { PROCESS_COUNT } = require("./cluster");
 require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
 
 // Helper to read env or Docker secret
@@ -19,18 +22,26 @@ const DB_PASS = getSecret("DB_PASS", "DB_PASS_FILE", "Lamberto75");
 const DB_HOST = process.env.DB_HOST || "localhost";
 const DB_PORT = process.env.DB_PORT || 5432;
 
+// Connection budget for the whole host, split between cluster workers so
+// adding workers doesn't multiply Postgres connections
+const DB_POOL_MAX = parseInt(process.env.DB_POOL_MAX || "20", 10);
+
 const sequelizeConfig = {
   host: DB_HOST,
   port: DB_PORT,
   dialect: "postgres",
-  logging: isTest ? false : (msg) => console.log(`[Sequelize] ${msg}`),
+  // Every query feeds the duration histogram; only a sample is logged
+  logging: isTest ? false : (msg, durationMs) => {
+    observeQuery(msg, durationMs);
+    if (sampled()) log(`[Sequelize] ${msg} (${durationMs}ms)`);
+  },
   pool: { 
-    max: isTest ? 1 : 20, 
+    max: isTest ? 1 : Math.max(1, Math.floor(DB_POOL_MAX / PROCESS_COUNT)),
     min: 0, 
     acquire: 30000, 
     idle: 10000 
   },
-  // Disable SQL logging in test environment
+  // Query timings for db_query_duration_seconds (SQL logging is off in test)
   benchmark: !isTest,
   define: {
     timestamps: true,
@@ -52,16 +63,10 @@ const sequelize = new Sequelize(
   sequelizeConfig
 );
 
-// Only authenticate in non-test environments
-if (!isTest) {
-  sequelize
-    .authenticate()
-    .then(() => console.log("✅ Database connection established"))
-    .catch((err) => {
-      console.error("❌ Database connection failed:", err);
-      process.exit(1);
-    });
-}
+instrumentSequelize(sequelize);
+
+// No authenticate() here: the pool connects on first use, and server.js
+// checks connectivity once at startup.
 
 module.exports = { 
   sequelize,
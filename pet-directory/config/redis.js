@@ -1,5 +1,6 @@
 const Redis = require("ioredis");
 const fs = require("fs");
+const { instrumentRedis } = require("../helpers/metrics");
 require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
 
 // Helper to read env or Docker secret
@@ -31,6 +32,8 @@ if (REDIS_URL) {
   });
 }
 
+instrumentRedis(redisClient);
+
 // Event listeners
 redisClient.on("connect", () => console.log("✅ Redis connected"));
 redisClient.on("error", (err) => console.error("❌ Redis error", err));
@@ -0,0 +1,11 @@
+// Connection settings for sequelize-cli (npm run db:migrate / db:seed), taken
+// from the app's own Sequelize instance so both use the same database,
+// credentials and Docker secrets.
+const { sequelize } = require('./db');
+
+module.exports = {
+  ...sequelize.options,
+  database: sequelize.config.database,
+  username: sequelize.config.username,
+  password: sequelize.config.password,
+};
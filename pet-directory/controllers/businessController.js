@@ -1,16 +1,9 @@
 const { Business } = require('../models');
-const { Op } = require('sequelize');
-const redis = require('../config/redis');
-
-// Helper: Generate cache key
-const getCacheKey = (search, page, limit) =>
-  `businesses:${search || 'all'}:page:${page}:limit:${limit}`;
-
-// Helper: Invalidate all business-related cache keys
-const invalidateCache = async () => {
-  const keys = await redis.keys('businesses:*');
-  if (keys.length > 0) await redis.del(keys);
-};
+const { tags, businessKey, invalidateBusiness } = require('../helpers/cacheHelpers');
+const { sendCached } = require('../helpers/responseCache');
+const { paginate, pageSuffix } = require('../helpers/pagination');
+const { cellTags, findNearby } = require('../helpers/geoHelpers');
+const { searchBusinesses } = require('../helpers/searchHelpers');
 
 // Create a new business
 exports.createBusiness = async (req, res) => {
@@ -21,7 +14,7 @@ exports.createBusiness = async (req, res) => {
     });
 
     // Invalidate cache
-    await invalidateCache();
+    await invalidateBusiness(undefined, { extraTags: cellTags(business.geohash) });
 
     res.status(201).json({ business });
   } catch (err) {
@@ -38,10 +31,11 @@ exports.updateBusiness = async (req, res) => {
     const business = await Business.findByPk(id);
     if (!business) return res.status(404).json({ error: 'Business not found' });
 
+    const previousGeohash = business.geohash;
     await business.update(req.body);
 
-    // Invalidate cache
-    await invalidateCache();
+    // Invalidate cache (both the old and the new location cells)
+    await invalidateBusiness(id, { extraTags: [...cellTags(previousGeohash), ...cellTags(business.geohash)] });
 
     res.json({ business });
   } catch (err) {
@@ -61,7 +55,7 @@ exports.deleteBusiness = async (req, res) => {
     await business.destroy();
 
     // Invalidate cache
-    await invalidateCache();
+    await invalidateBusiness(id, { cascade: true, extraTags: cellTags(business.geohash) });
 
     res.status(204).send();
   } catch (err) {
@@ -70,33 +64,48 @@ exports.deleteBusiness = async (req, res) => {
   }
 };
 
-// Get businesses with optional search, pagination, and caching
+// Sort options for the business listing (offset pagination)
+const SORT_ORDERS = {
+  rating: [['ratingAverage', 'DESC'], ['ratingCount', 'DESC'], ['id', 'DESC']],
+};
+
+// Get businesses with optional search/type filter, sorting, offset or cursor pagination, and caching
 exports.getBusinesses = async (req, res) => {
   try {
-    const { page = 1, limit = 10, search } = req.query;
-    const offset = (page - 1) * limit;
-    const cacheKey = getCacheKey(search, page, limit);
-
-    // Check Redis cache
-    const cached = await redis.get(cacheKey);
-    if (cached) return res.json(JSON.parse(cached));
-
-    // Query DB
-    const where = search ? { name: { [Op.iLike]: `%${search}%` } } : {};
-
-    const { rows: businesses, count } = await Business.findAndCountAll({
-      where,
-      limit: parseInt(limit),
-      offset: parseInt(offset),
-      order: [['createdAt', 'DESC']],
+    const { search, type, sort } = req.query;
+
+    // Searches are ranked by the search index rather than cached per query string
+    if (search) {
+      const { page = 1, limit = 10 } = req.query;
+      const { total, rows: businesses } = await searchBusinesses(Business, {
+        query: search,
+        type,
+        limit: parseInt(limit),
+        offset: (page - 1) * limit,
+      });
+      return res.json({ total, page: parseInt(page), limit: parseInt(limit), businesses });
+    }
+
+    const filter = type || 'all';
+    // Review writes reorder the rating listing, so only it depends on the ratings tag
+    const listTags = sort === 'rating' ? [tags.businesses(), tags.businessRatings()] : [tags.businesses()];
+    const cacheOptions = {
+      tags: listTags,
+      suffix: `${filter}:${sort || 'newest'}:${pageSuffix(req.query)}`,
+    };
+
+    // Serve from cache, querying the DB only on a miss
+    await sendCached(req, res, cacheOptions, async () => {
+      const { rows: businesses, ...pagination } = await paginate(Business, req, {
+        where: type ? { type } : {},
+        // Totals don't depend on ratings; share them with the other sorts
+        tags: [tags.businesses()],
+        countKey: filter,
+        order: SORT_ORDERS[sort],
+      });
+
+      return { ...pagination, businesses };
     });
-
-    const response = { total: count, page: parseInt(page), limit: parseInt(limit), businesses };
-
-    // Cache response
-    await redis.set(cacheKey, JSON.stringify(response), 'EX', 60);
-
-    res.json(response);
   } catch (err) {
     console.error('GET BUSINESSES ERROR:', err.message);
     res.status(500).json({ error: err.message });
@@ -107,21 +116,38 @@ exports.getBusinesses = async (req, res) => {
 exports.getBusinessById = async (req, res) => {
   try {
     const { id } = req.params;
-    const cacheKey = `business:${id}`;
 
-    // Check cache first
-    const cached = await redis.get(cacheKey);
-    if (cached) return res.json(JSON.parse(cached));
+    // Serve from cache, querying the DB only on a miss
+    const found = await sendCached(req, res, { key: businessKey(id) }, () => Business.findByPk(id));
+    if (!found) return res.status(404).json({ error: 'Business not found' });
+  } catch (err) {
+    console.error('GET BUSINESS BY ID ERROR:', err.message);
+    res.status(500).json({ error: err.message });
+  }
+};
 
-    const business = await Business.findByPk(id);
-    if (!business) return res.status(404).json({ error: 'Business not found' });
+// Get businesses near a point, nearest first
+exports.getNearbyBusinesses = async (req, res) => {
+  try {
+    const { lat, lng, radius = 5, type, page = 1, limit = 10 } = req.query;
+    const offset = (page - 1) * limit;
 
-    // Cache the response
-    await redis.set(cacheKey, JSON.stringify(business), 'EX', 60);
+    const businesses = await findNearby(Business, {
+      lat: parseFloat(lat),
+      lng: parseFloat(lng),
+      radiusKm: parseFloat(radius),
+      type,
+    });
 
-    res.json(business);
+    res.json({
+      total: businesses.length,
+      page: parseInt(page),
+      limit: parseInt(limit),
+      radius: parseFloat(radius),
+      businesses: businesses.slice(offset, offset + parseInt(limit)),
+    });
   } catch (err) {
-    console.error('GET BUSINESS BY ID ERROR:', err.message);
+    console.error('GET NEARBY BUSINESSES ERROR:', err.message);
     res.status(500).json({ error: err.message });
   }
 };
@@ -1,11 +1,8 @@
-const { Review, Business } = require('../models');
-const redis = require('../config/redis');
-
-// Helper: Invalidate business review caches
-const invalidateBusinessReviewCache = async (businessId) => {
-  const keys = await redis.keys(`reviews:${businessId}:*`);
-  if (keys.length > 0) await redis.del(keys);
-};
+const { Review, Business, sequelize } = require('../models');
+const { tags, invalidateReviews } = require('../helpers/cacheHelpers');
+const { applyRating } = require('../helpers/ratingHelpers');
+const { sendCached } = require('../helpers/responseCache');
+const { paginate, pageSuffix } = require('../helpers/pagination');
 
 // Create review
 exports.createReview = async (req, res) => {
@@ -14,9 +11,17 @@ exports.createReview = async (req, res) => {
     const business = await Business.findByPk(businessId);
     if (!business) return res.status(404).json({ error: 'Business not found' });
 
-    const review = await Review.create({ userId: req.user.id, businessId, rating, comment, serviceId: serviceId || null });
+    // Store the review and update the business's rating aggregates atomically
+    const review = await sequelize.transaction(async (transaction) => {
+      const created = await Review.create(
+        { userId: req.user.id, businessId, rating, comment, serviceId: serviceId || null },
+        { transaction }
+      );
+      await applyRating(Business, businessId, created.rating, 1, { transaction });
+      return created;
+    });
 
-    await invalidateBusinessReviewCache(businessId);
+    await invalidateReviews(businessId);
 
     res.status(201).json({ review });
   } catch (err) {
@@ -29,24 +34,17 @@ exports.createReview = async (req, res) => {
 exports.getBusinessReviews = async (req, res) => {
   try {
     const { businessId } = req.params;
-    const { page = 1, limit = 10 } = req.query;
-    const offset = (page - 1) * limit;
-    const cacheKey = `reviews:${businessId}:page:${page}:limit:${limit}`;
+    const cacheOptions = { tags: [tags.reviews(businessId)], suffix: pageSuffix(req.query) };
 
-    const cached = await redis.get(cacheKey);
-    if (cached) return res.json(JSON.parse(cached));
+    await sendCached(req, res, cacheOptions, async () => {
+      const { rows: reviews, ...pagination } = await paginate(Review, req, {
+        where: { businessId },
+        tags: cacheOptions.tags,
+        countKey: 'all',
+      });
 
-    const { rows: reviews, count } = await Review.findAndCountAll({
-      where: { businessId },
-      limit: parseInt(limit),
-      offset: parseInt(offset),
-      order: [['createdAt', 'DESC']]
+      return { ...pagination, reviews };
     });
-
-    const response = { total: count, page: parseInt(page), limit: parseInt(limit), reviews };
-    await redis.set(cacheKey, JSON.stringify(response), 'EX', 60);
-
-    res.json(response);
   } catch (err) {
     console.error('GET REVIEWS ERROR:', err.message);
     res.status(500).json({ error: err.message });
@@ -62,8 +60,16 @@ exports.deleteReview = async (req, res) => {
 
     if (review.userId !== req.user.id && req.user.role !== 'admin') return res.status(403).json({ error: 'Unauthorized' });
 
-    await review.destroy();
-    await invalidateBusinessReviewCache(review.businessId);
+    // Concurrent deletes of the same review both get this far; only the one
+    // that actually removed the row takes its rating off the aggregates
+    const deleted = await sequelize.transaction(async (transaction) => {
+      const count = await Review.destroy({ where: { id: review.id }, transaction });
+      if (count === 1) await applyRating(Business, review.businessId, review.rating, -1, { transaction });
+      return count;
+    });
+    if (deleted !== 1) return res.status(404).json({ error: 'Review not found' });
+
+    await invalidateReviews(review.businessId);
 
     res.json({ message: 'Review deleted successfully' });
   } catch (err) {
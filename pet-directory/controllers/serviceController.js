@@ -1,11 +1,7 @@
 const { Service, Business } = require('../models');
-const redis = require('../config/redis');
-
-// Helper: Invalidate service cache for a business
-const invalidateServiceCache = async (businessId) => {
-  const keys = await redis.keys(`services:${businessId}:*`);
-  if (keys.length > 0) await redis.del(keys);
-};
+const { tags, invalidateServices } = require('../helpers/cacheHelpers');
+const { sendCached } = require('../helpers/responseCache');
+const { paginate, pageSuffix } = require('../helpers/pagination');
 
 // Create service
 exports.createService = async (req, res) => {
@@ -17,7 +13,7 @@ exports.createService = async (req, res) => {
     if (business.userId !== req.user.id && req.user.role !== 'admin') return res.status(403).json({ error: 'Unauthorized' });
 
     const service = await Service.create({ businessId, name, price, duration });
-    await invalidateServiceCache(businessId);
+    await invalidateServices(businessId);
 
     res.status(201).json({ service });
   } catch (err) {
@@ -30,24 +26,17 @@ exports.createService = async (req, res) => {
 exports.getBusinessServices = async (req, res) => {
   try {
     const { businessId } = req.params;
-    const { page = 1, limit = 10 } = req.query;
-    const offset = (page - 1) * limit;
-    const cacheKey = `services:${businessId}:page:${page}:limit:${limit}`;
+    const cacheOptions = { tags: [tags.services(businessId)], suffix: pageSuffix(req.query) };
 
-    const cached = await redis.get(cacheKey);
-    if (cached) return res.json(JSON.parse(cached));
+    await sendCached(req, res, cacheOptions, async () => {
+      const { rows: services, ...pagination } = await paginate(Service, req, {
+        where: { businessId },
+        tags: cacheOptions.tags,
+        countKey: 'all',
+      });
 
-    const { rows: services, count } = await Service.findAndCountAll({
-      where: { businessId },
-      limit: parseInt(limit),
-      offset: parseInt(offset),
-      order: [['createdAt', 'DESC']]
+      return { ...pagination, services };
     });
-
-    const response = { total: count, page: parseInt(page), limit: parseInt(limit), services };
-    await redis.set(cacheKey, JSON.stringify(response), 'EX', 60);
-
-    res.json(response);
   } catch (err) {
     console.error('GET SERVICES ERROR:', err.message);
     res.status(500).json({ error: err.message });
@@ -65,7 +54,7 @@ exports.deleteService = async (req, res) => {
     if (business.userId !== req.user.id && req.user.role !== 'admin') return res.status(403).json({ error: 'Unauthorized' });
 
     await service.destroy();
-    await invalidateServiceCache(service.businessId);
+    await invalidateServices(service.businessId);
 
     res.json({ message: 'Service deleted successfully' });
   } catch (err) {
@@ -1,29 +1,17 @@
 const { User } = require('../models');
-const bcrypt = require('bcrypt');
 const redis = require('../config/redis');
+const { hashPassword, comparePassword, isSaturated } = require('../helpers/hashPool');
 const {
   generateAccessToken,
   generateRefreshToken,
   verifyRefreshToken,
-  revokeRefreshToken
+  revokeRefreshToken,
+  checkLoginAttempts,
+  resetLoginAttempts
 } = require('../helpers/authHelpers');
 
-const loginAttemptTTL = 300; // 5 minutes
-const maxLoginAttempts = 5;
-
-// Track login attempts
-const checkLoginAttempts = async (email) => {
-  const key = `login_attempts:${email}`;
-  const attempts = await redis.get(key);
-  if (attempts && attempts >= maxLoginAttempts) return false;
-  await redis.multi().incr(key).expire(key, loginAttemptTTL).exec();
-  return true;
-};
-
-// Reset login attempts
-const resetLoginAttempts = async (email) => {
-  await redis.del(`login_attempts:${email}`);
-};
+// Hashing pool saturated: shed load instead of queueing
+const sendBusy = (res, err) => res.set('Retry-After', '1').status(503).json({ error: err.message });
 
 // Register
 exports.register = async (req, res) => {
@@ -32,7 +20,7 @@ exports.register = async (req, res) => {
     const existingUser = await User.findOne({ where: { email } });
     if (existingUser) return res.status(409).json({ error: 'Email already registered' });
 
-    const hashedPassword = await bcrypt.hash(password, 12);
+    const hashedPassword = await hashPassword(password, 12);
     const user = await User.create({ name, email, password: hashedPassword, role });
 
     const accessToken = generateAccessToken(user);
@@ -41,6 +29,7 @@ exports.register = async (req, res) => {
     const { password: _, ...userData } = user.toJSON();
     res.status(201).json({ accessToken, refreshToken, user: userData });
   } catch (err) {
+    if (isSaturated(err)) return sendBusy(res, err);
     console.error('REGISTER ERROR:', err.message);
     res.status(400).json({ error: err.message });
   }
@@ -50,13 +39,13 @@ exports.register = async (req, res) => {
 exports.login = async (req, res) => {
   try {
     const { email, password } = req.body;
-    const user = await User.findOne({ where: { email } });
-    if (!user) return res.status(404).json({ error: 'User not found' });
-
     const allowed = await checkLoginAttempts(email);
     if (!allowed) return res.status(429).json({ error: 'Too many failed login attempts. Try later.' });
 
-    const match = await bcrypt.compare(password, user.password);
+    const user = await User.findOne({ where: { email } });
+    if (!user) return res.status(404).json({ error: 'User not found' });
+
+    const match = await comparePassword(password, user.password);
     if (!match) return res.status(401).json({ error: 'Invalid credentials' });
 
     await resetLoginAttempts(email);
@@ -67,6 +56,7 @@ exports.login = async (req, res) => {
     const { password: _, ...userData } = user.toJSON();
     res.json({ accessToken, refreshToken, user: userData });
   } catch (err) {
+    if (isSaturated(err)) return sendBusy(res, err);
     console.error('LOGIN ERROR:', err.message);
     res.status(500).json({ error: 'Internal server error' });
   }
@@ -16,4 +16,33 @@ const verifyRefreshToken = (token) => jwt.verify(token, JWT_REFRESH_SECRET);
 
 const revokeRefreshToken = async (userId) => await redis.del(`refresh_token:${userId}`);
 
-module.exports = { generateAccessToken, generateRefreshToken, verifyAccessToken, verifyRefreshToken, revokeRefreshToken };
+// Login rate limiting, checked before any database or bcrypt work
+const LOGIN_ATTEMPT_TTL = 300; // 5 minutes
+const MAX_LOGIN_ATTEMPTS = 5;
+
+const loginAttemptsKey = (email) => `login_attempts:${email}`;
+
+// Count an attempt in one round trip; false once the limit is exceeded.
+// The window starts at the first attempt (SET NX) and is never extended, so
+// attempts made while locked out don't keep the lock alive.
+const checkLoginAttempts = async (email) => {
+  const key = loginAttemptsKey(email);
+  const [, [err, attempts]] = await redis.multi()
+    .set(key, 0, 'EX', LOGIN_ATTEMPT_TTL, 'NX')
+    .incr(key)
+    .exec();
+  if (err) throw err;
+  return attempts <= MAX_LOGIN_ATTEMPTS;
+};
+
+const resetLoginAttempts = async (email) => await redis.del(loginAttemptsKey(email));
+
+module.exports = {
+  generateAccessToken,
+  generateRefreshToken,
+  verifyAccessToken,
+  verifyRefreshToken,
+  revokeRefreshToken,
+  checkLoginAttempts,
+  resetLoginAttempts,
+};
@@ -0,0 +1,216 @@
+const crypto = require('crypto');
+const redis = require('../config/redis');
+const LRUCache = require('./lruCache');
+
+// Generation-based cache tagging.
+//
+// Every cached key embeds the current generation of the tags it depends on
+// (e.g. `businesses:g7:all:page:1:limit:10`). Invalidating a tag is a single
+// INCR: readers immediately start building keys with the new generation and
+// the orphaned entries age out through their TTL. This replaces the old
+// `KEYS pattern` + `DEL` scans, which were O(keyspace) and blocked Redis.
+//
+// Generation counters are intentionally stored without a TTL: if a counter
+// expired and restarted from zero, a reader could rebuild a key that still
+// points at a stale entry.
+//
+// Once `startInvalidationListener()` has subscribed to the invalidation
+// channel, generations and response bodies are also kept in-process (see
+// helpers/responseCache.js). Every invalidation is published so that the
+// other instances drop their local copies; the short local TTL bounds how
+// stale an instance can get if a message is missed.
+//
+// Other per-process state (the in-memory search index) can ride on the same
+// channel: `broadcast()` sends a message to the other instances and
+// `onInvalidationMessage()` receives them, plus a reset whenever messages may
+// have been missed.
+
+const CACHE_TTL = 60; // seconds
+const LOCAL_CACHE_MAX = parseInt(process.env.LOCAL_CACHE_MAX || '1000', 10);
+const LOCAL_CACHE_TTL = parseInt(process.env.LOCAL_CACHE_TTL_MS || '5000', 10);
+const INVALIDATION_CHANNEL = 'cache:invalidate';
+
+// Tags
+const tags = {
+  businesses: () => 'businesses',
+  // Listings ordered by the rating aggregates (sort=rating)
+  businessRatings: () => 'businesses:rating',
+  reviews: (businessId) => `reviews:${businessId}`,
+  services: (businessId) => `services:${businessId}`,
+  geoCell: (prefix) => `geo:${prefix}`,
+};
+
+const generationKey = (tag) => `cache:gen:${tag}`;
+const businessKey = (id) => `business:${id}`;
+
+// In-process state, only trusted while the pub/sub listener is connected
+const localGenerations = new LRUCache({ max: LOCAL_CACHE_MAX, ttl: LOCAL_CACHE_TTL });
+const localResponses = new LRUCache({ max: LOCAL_CACHE_MAX, ttl: LOCAL_CACHE_TTL });
+let subscriber = null;
+let listening = false;
+
+// Identifies this process's own messages on the shared channel
+const INSTANCE_ID = crypto.randomUUID();
+const messageHandlers = new Set();
+
+const isLocalCacheEnabled = () => listening;
+
+// Generations only move forward, so never let a slow read overwrite a newer value
+const rememberGeneration = (tag, generation) => {
+  const current = localGenerations.get(tag);
+  if (current === undefined || Number(generation) > Number(current)) {
+    localGenerations.set(tag, String(generation));
+  }
+};
+
+// Read the current generation for one or more tags in a single round trip
+const getGenerations = async (tagList) => {
+  if (listening) {
+    const cached = tagList.map((tag) => localGenerations.get(tag));
+    if (cached.every((g) => g !== undefined)) return cached;
+  }
+
+  const values = (await redis.mget(tagList.map(generationKey))).map((v) => v || '0');
+  if (listening) {
+    tagList.forEach((tag, i) => rememberGeneration(tag, values[i]));
+    return tagList.map((tag) => localGenerations.get(tag));
+  }
+  return values;
+};
+
+// Build a cache key scoped to the current generation of the given tags
+const buildCacheKey = async (tagList, suffix) => {
+  const generations = await getGenerations(tagList);
+  return `${tagList[0]}:g${generations.join('.')}:${suffix}`;
+};
+
+// Apply an invalidation message to the in-process caches
+const applyInvalidation = ({ generations = {}, keys = [] }) => {
+  Object.entries(generations).forEach(([tag, generation]) => rememberGeneration(tag, generation));
+  keys.forEach((key) => localResponses.delete(key));
+};
+
+// Invalidate tags (O(1) per tag) and optionally delete exact keys
+const invalidate = async ({ tags: tagList = [], keys = [] } = {}) => {
+  if (tagList.length === 0 && keys.length === 0) return;
+  const pipeline = redis.pipeline();
+  tagList.forEach((tag) => pipeline.incr(generationKey(tag)));
+  if (keys.length > 0) pipeline.del(...keys);
+  const results = (await pipeline.exec()) || [];
+
+  const generations = {};
+  tagList.forEach((tag, i) => {
+    const [err, generation] = results[i] || [];
+    if (!err && generation !== undefined) generations[tag] = generation;
+  });
+  const message = { generations, keys };
+
+  applyInvalidation(message);
+  await redis.publish(INVALIDATION_CHANNEL, JSON.stringify(message));
+};
+
+// Convenience wrappers used by the controllers
+const invalidateBusiness = (businessId, { cascade = false, extraTags = [] } = {}) => {
+  const tagList = [tags.businesses(), ...new Set(extraTags)];
+  const keys = [];
+  if (businessId !== undefined) {
+    keys.push(businessKey(businessId));
+    // Reviews and services are removed along with the business (ON DELETE CASCADE)
+    if (cascade) tagList.push(tags.reviews(businessId), tags.services(businessId));
+  }
+  return invalidate({ tags: tagList, keys });
+};
+
+// Review writes also change the rating aggregates embedded in business responses.
+// Only the rating-ordered listing and the detail key are dropped; the other
+// listings and the nearby cells serve the embedded `rating` stale for up to
+// their TTL rather than losing every cached page on each review.
+const invalidateReviews = (businessId) =>
+  invalidate({
+    tags: [tags.reviews(businessId), tags.businessRatings()],
+    keys: [businessKey(businessId)],
+  });
+
+const invalidateServices = (businessId) => invalidate({ tags: [tags.services(businessId)] });
+
+// Publish a message for the other instances (they see it via onInvalidationMessage)
+const broadcast = (message) =>
+  redis.publish(INVALIDATION_CHANNEL, JSON.stringify({ ...message, source: INSTANCE_ID }));
+
+// Register `{ onMessage(message), onReset() }` for messages from other instances
+const onInvalidationMessage = (handler) => {
+  messageHandlers.add(handler);
+  return () => messageHandlers.delete(handler);
+};
+
+const notifyHandlers = (message) => {
+  if (message.source === INSTANCE_ID) return;
+  messageHandlers.forEach((handler) => handler.onMessage && handler.onMessage(message));
+};
+
+// Drop all local state; used whenever we may have missed messages
+const resetLocalCache = () => {
+  localGenerations.clear();
+  localResponses.clear();
+  messageHandlers.forEach((handler) => handler.onReset && handler.onReset());
+};
+
+// Subscribe to invalidations from other instances and enable the local tier
+const startInvalidationListener = async () => {
+  if (subscriber) return subscriber;
+  subscriber = redis.duplicate();
+
+  subscriber.on('message', (channel, payload) => {
+    if (channel !== INVALIDATION_CHANNEL) return;
+    try {
+      const message = JSON.parse(payload);
+      applyInvalidation(message);
+      notifyHandlers(message);
+    } catch (err) {
+      console.error('❌ Invalid cache invalidation message', err.message);
+      resetLocalCache();
+    }
+  });
+  subscriber.on('ready', () => {
+    resetLocalCache();
+    listening = true;
+  });
+  subscriber.on('close', () => {
+    listening = false;
+    resetLocalCache();
+  });
+
+  await subscriber.subscribe(INVALIDATION_CHANNEL);
+  resetLocalCache();
+  listening = true;
+  return subscriber;
+};
+
+const stopInvalidationListener = async () => {
+  if (!subscriber) return;
+  listening = false;
+  resetLocalCache();
+  const current = subscriber;
+  subscriber = null;
+  await current.quit();
+};
+
+module.exports = {
+  CACHE_TTL,
+  INVALIDATION_CHANNEL,
+  tags,
+  generationKey,
+  businessKey,
+  getGenerations,
+  buildCacheKey,
+  invalidate,
+  invalidateBusiness,
+  invalidateReviews,
+  invalidateServices,
+  broadcast,
+  onInvalidationMessage,
+  localResponses,
+  isLocalCacheEnabled,
+  startInvalidationListener,
+  stopInvalidationListener,
+};
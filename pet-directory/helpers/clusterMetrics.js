@@ -0,0 +1,66 @@
+const cluster = require('cluster');
+const { AggregatorRegistry } = require('prom-client');
+
+// Cluster-wide /metrics.
+//
+// In cluster mode a scrape of GET /metrics lands on whichever worker accepted
+// the connection. If each worker answered from its own registry, successive
+// scrapes would see different counters, which Prometheus reads as resets. So a
+// worker asks the primary instead; the primary collects every worker's
+// registry with prom-client's AggregatorRegistry and sends back the sum.
+// Outside cluster mode the process's own registry is served as before.
+
+const METRICS_REQUEST = 'metrics:request';
+const METRICS_RESPONSE = 'metrics:response';
+const METRICS_TIMEOUT_MS = parseInt(process.env.METRICS_TIMEOUT_MS || '5000', 10);
+
+const pending = new Map();
+let lastRequestId = 0;
+let listening = false;
+
+const onResponse = (message) => {
+  if (!message || message.type !== METRICS_RESPONSE) return;
+  const request = pending.get(message.id);
+  if (!request) return;
+  pending.delete(message.id);
+  clearTimeout(request.timer);
+  if (message.error) request.reject(new Error(message.error));
+  else request.resolve(message.metrics);
+};
+
+// Worker side: the aggregated metrics text from the primary
+const requestClusterMetrics = () => new Promise((resolve, reject) => {
+  if (!listening) {
+    process.on('message', onResponse);
+    listening = true;
+  }
+  const id = ++lastRequestId;
+  const timer = setTimeout(() => {
+    pending.delete(id);
+    reject(new Error('Timed out waiting for cluster metrics'));
+  }, METRICS_TIMEOUT_MS);
+  pending.set(id, { resolve, reject, timer });
+  process.send({ type: METRICS_REQUEST, id });
+});
+
+// Body for GET /metrics: the whole cluster from a worker, else `register`
+const metricsText = (register) => (cluster.isWorker ? requestClusterMetrics() : register.metrics());
+
+// Primary side: answer the workers' requests. Returns the registry, which can
+// also be served directly (METRICS_PORT).
+const serveClusterMetrics = () => {
+  const registry = new AggregatorRegistry();
+  cluster.on('message', async (worker, message) => {
+    if (!message || message.type !== METRICS_REQUEST) return;
+    let response;
+    try {
+      response = { type: METRICS_RESPONSE, id: message.id, metrics: await registry.clusterMetrics() };
+    } catch (err) {
+      response = { type: METRICS_RESPONSE, id: message.id, error: err.message };
+    }
+    if (worker.isConnected()) worker.send(response);
+  });
+  return registry;
+};
+
+module.exports = { metricsText, requestClusterMetrics, serveClusterMetrics };
@@ -0,0 +1,182 @@
+const crypto = require('crypto');
+const { Op } = require('sequelize');
+const redis = require('../config/redis');
+const { CACHE_TTL, tags, getGenerations } = require('./cacheHelpers');
+const { encodeGeohash, cellSize, nextPrefix } = require('./geohash');
+const { recordCacheLookup } = require('./metrics');
+
+// Geospatial helpers for "near me" search.
+//
+// Businesses carry an indexed `geohash` column (see helpers/geohash.js).
+// Every geohash prefix is a lat/lng rectangle and every business in it shares
+// that prefix, so a cell is a plain string range scan that works the
+// same on Postgres and SQLite. A search:
+//   1. picks the finest prefix length that covers the radius in MAX_CELLS cells
+//   2. loads the candidates: the geohash ranges of those cells, narrowed in SQL
+//      by the bounding box (and type), cached in Redis per cell set
+//   3. refines the candidates with haversine
+//
+// The cached candidate set is keyed on the cells, their tag generations, the
+// type and the bounding box rounded outwards to BBOX_GRID. Nearby searches
+// from roughly the same spot share an entry, and any business write in one of
+// the cells invalidates it.
+
+const MAX_CELL_PRECISION = 6; // ~1.2km x 0.6km cells
+// 64 cells keeps a 50km radius at precision 4 (~39km x 20km cells)
+const MAX_CELLS = 64;
+const BBOX_GRID = 0.01; // degrees, ~1.1km
+const EARTH_RADIUS_KM = 6371;
+
+const toRadians = (deg) => (deg * Math.PI) / 180;
+
+// Great-circle distance in kilometres
+const haversineKm = (lat1, lng1, lat2, lng2) => {
+  const dLat = toRadians(lat2 - lat1);
+  const dLng = toRadians(lng2 - lng1);
+  const a = Math.sin(dLat / 2) ** 2
+    + Math.cos(toRadians(lat1)) * Math.cos(toRadians(lat2)) * Math.sin(dLng / 2) ** 2;
+  return 2 * EARTH_RADIUS_KM * Math.asin(Math.min(1, Math.sqrt(a)));
+};
+
+// Lat/lng rectangle enclosing the search circle
+const boundingBox = (lat, lng, radiusKm) => {
+  const latDelta = (radiusKm / EARTH_RADIUS_KM) * (180 / Math.PI);
+  const cosLat = Math.cos(toRadians(lat));
+  const lngDelta = cosLat < 1e-6 ? 180 : Math.min(180, latDelta / cosLat);
+  return {
+    minLat: Math.max(-90, lat - latDelta),
+    maxLat: Math.min(90, lat + latDelta),
+    minLng: lng - lngDelta,
+    maxLng: lng + lngDelta,
+  };
+};
+
+const wrapLng = (lng) => ((((lng + 180) % 360) + 360) % 360) - 180;
+
+const inBoundingBox = (box, lat, lng) => {
+  if (lat < box.minLat || lat > box.maxLat) return false;
+  if (box.maxLng - box.minLng >= 360) return true;
+  // Compare in the box's own frame so boxes crossing the antimeridian work
+  const offset = (((lng - box.minLng) % 360) + 360) % 360;
+  return offset <= box.maxLng - box.minLng + 1e-9 || offset >= 360 - 1e-9;
+};
+
+// Geohash prefixes covering the bounding box, using the finest precision
+// that keeps the number of cells at or below MAX_CELLS
+const coveringCells = (box) => {
+  const lngSpan = Math.min(360, box.maxLng - box.minLng);
+
+  for (let precision = MAX_CELL_PRECISION; precision >= 1; precision--) {
+    const size = cellSize(precision);
+    const latSteps = Math.ceil((box.maxLat - box.minLat) / size.lat);
+    const lngSteps = Math.ceil(lngSpan / size.lng);
+    // Each axis touches at most steps + 1 cells; skip precisions that are clearly too fine
+    if ((latSteps + 1) * (lngSteps + 1) > MAX_CELLS * 4 && precision > 1) continue;
+
+    // Sample at cell spacing (plus the far edges) so every intersecting cell is hit
+    const cells = new Set();
+    for (let i = 0; i <= latSteps; i++) {
+      const lat = Math.min(box.maxLat, box.minLat + i * size.lat, 90 - 1e-9);
+      for (let j = 0; j <= lngSteps; j++) {
+        const lng = wrapLng(Math.min(box.minLng + lngSpan, box.minLng + j * size.lng));
+        cells.add(encodeGeohash(lat, lng, precision));
+      }
+    }
+    if (cells.size <= MAX_CELLS || precision === 1) return [...cells];
+  }
+  return [];
+};
+
+const prefixCondition = (prefix) => {
+  const upper = nextPrefix(prefix);
+  return { geohash: upper ? { [Op.gte]: prefix, [Op.lt]: upper } : { [Op.gte]: prefix } };
+};
+
+// Cache tags for every cell (at every searchable precision) containing a geohash
+const cellTags = (geohash) => {
+  if (!geohash) return [];
+  const result = [];
+  for (let precision = 1; precision <= MAX_CELL_PRECISION; precision++) {
+    result.push(tags.geoCell(geohash.slice(0, precision)));
+  }
+  return result;
+};
+
+// Round the box outwards to the grid so nearby searches share cache entries
+const snapBox = (box) => ({
+  minLat: Math.max(-90, Math.floor(box.minLat / BBOX_GRID) * BBOX_GRID),
+  maxLat: Math.min(90, Math.ceil(box.maxLat / BBOX_GRID) * BBOX_GRID),
+  minLng: Math.floor(box.minLng / BBOX_GRID) * BBOX_GRID,
+  maxLng: Math.ceil(box.maxLng / BBOX_GRID) * BBOX_GRID,
+});
+
+// SQL predicate for the box; boxes crossing the antimeridian split in two
+const boxCondition = (box) => {
+  const conditions = [{ latitude: { [Op.between]: [box.minLat, box.maxLat] } }];
+  if (box.maxLng - box.minLng < 360) {
+    const minLng = box.minLng < -180 ? wrapLng(box.minLng) : box.minLng;
+    const maxLng = box.maxLng > 180 ? wrapLng(box.maxLng) : box.maxLng;
+    conditions.push(minLng <= maxLng
+      ? { longitude: { [Op.between]: [minLng, maxLng] } }
+      : { [Op.or]: [{ longitude: { [Op.gte]: minLng } }, { longitude: { [Op.lte]: maxLng } }] });
+  }
+  return conditions;
+};
+
+// Businesses in `cells` inside `box`, from the Redis cache when possible
+const loadCandidates = async (Model, cells, box, type) => {
+  const generations = await getGenerations(cells.map(tags.geoCell));
+  const digest = crypto.createHash('sha1')
+    .update(JSON.stringify([cells, generations, type || null, box]))
+    .digest('hex');
+  const cacheKey = `geo:nearby:${digest}`;
+
+  const cached = await redis.get(cacheKey);
+  recordCacheLookup('geo', cached !== null ? 'redis_hit' : 'miss');
+  if (cached !== null) return JSON.parse(cached);
+
+  const rows = await Model.findAll({
+    where: {
+      [Op.and]: [
+        { [Op.or]: cells.map(prefixCondition) },
+        ...boxCondition(box),
+        ...(type ? [{ type }] : []),
+      ],
+    },
+  });
+  const candidates = rows.map((business) => business.toJSON());
+  await redis.set(cacheKey, JSON.stringify(candidates), 'EX', CACHE_TTL);
+  return candidates;
+};
+
+/**
+ * Businesses within `radiusKm` of (lat, lng), nearest first.
+ * Each result carries a `distanceKm` field.
+ */
+const findNearby = async (Model, { lat, lng, radiusKm, type }) => {
+  const box = boundingBox(lat, lng, radiusKm);
+  const queryBox = snapBox(box);
+  const candidates = await loadCandidates(Model, coveringCells(queryBox), queryBox, type);
+
+  const results = [];
+  candidates.forEach((business) => {
+    if (type && business.type !== type) return;
+
+    const bLat = parseFloat(business.latitude);
+    const bLng = parseFloat(business.longitude);
+    if (Number.isNaN(bLat) || Number.isNaN(bLng) || !inBoundingBox(box, bLat, bLng)) return;
+
+    const distanceKm = haversineKm(lat, lng, bLat, bLng);
+    if (distanceKm <= radiusKm) results.push({ ...business, distanceKm: Math.round(distanceKm * 1000) / 1000 });
+  });
+
+  return results.sort((a, b) => a.distanceKm - b.distanceKm || a.id - b.id);
+};
+
+module.exports = {
+  haversineKm,
+  boundingBox,
+  coveringCells,
+  cellTags,
+  findNearby,
+};
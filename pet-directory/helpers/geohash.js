@@ -0,0 +1,56 @@
+// Geohash encoding (https://en.wikipedia.org/wiki/Geohash).
+//
+// Kept free of Redis/DB imports so models and migrations can use it.
+
+const BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz';
+const GEOHASH_PRECISION = 9; // ~4.8m x 4.8m
+
+// Encode a coordinate as a geohash string
+const encodeGeohash = (lat, lng, precision = GEOHASH_PRECISION) => {
+  const latRange = [-90, 90];
+  const lngRange = [-180, 180];
+  let hash = '';
+  let bits = 0;
+  let value = 0;
+  let even = true;
+
+  while (hash.length < precision) {
+    const range = even ? lngRange : latRange;
+    const coord = even ? lng : lat;
+    const mid = (range[0] + range[1]) / 2;
+    value <<= 1;
+    if (coord >= mid) {
+      value |= 1;
+      range[0] = mid;
+    } else {
+      range[1] = mid;
+    }
+    even = !even;
+    if (++bits === 5) {
+      hash += BASE32[value];
+      bits = 0;
+      value = 0;
+    }
+  }
+  return hash;
+};
+
+// Cell dimensions in degrees for a prefix length
+const cellSize = (precision) => {
+  const bits = precision * 5;
+  return {
+    lat: 180 / 2 ** Math.floor(bits / 2),
+    lng: 360 / 2 ** Math.ceil(bits / 2),
+  };
+};
+
+// Exclusive upper bound for a prefix range scan, e.g. "9q8y" -> "9q8z"
+const nextPrefix = (prefix) => {
+  for (let i = prefix.length - 1; i >= 0; i--) {
+    const index = BASE32.indexOf(prefix[i]);
+    if (index < BASE32.length - 1) return prefix.slice(0, i) + BASE32[index + 1];
+  }
+  return null; // "zzz..." covers the end of the keyspace
+};
+
+module.exports = { GEOHASH_PRECISION, encodeGeohash, cellSize, nextPrefix };
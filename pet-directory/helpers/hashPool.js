@@ -0,0 +1,172 @@
+const path = require('path');
+const { Worker } = require('worker_threads');
+const bcrypt = require('bcrypt');
+const { hashPoolWait, instrumentHashPool } = require('./metrics');
+const { cpuCount, PROCESS_COUNT } = require('../config/cluster');
+
+// Bounded worker_threads pool for bcrypt.
+//
+// bcrypt's async API runs on libuv's threadpool (4 threads by default), which
+// fs, dns, zlib and crypto share: a burst of logins used to queue every one of
+// those calls behind ~100ms hashes. The pool runs hashes on dedicated worker
+// threads instead and bounds the number of jobs allowed to wait for one. Once
+// the queue is full, new jobs are rejected straight away with a
+// HASH_POOL_SATURATED error, which the auth controllers turn into a 503, so a
+// login flood can't build an unbounded backlog.
+//
+// Workers are started on first use and unref'd while idle. With a size of 0
+// (the default under NODE_ENV=test) jobs call bcrypt's async API in-process,
+// still subject to the same limit. The default size shares the spare CPUs
+// between cluster workers.
+
+const DEFAULT_SIZE = process.env.NODE_ENV === 'test'
+  ? 0
+  : Math.max(1, Math.min(4, Math.floor((cpuCount() - 1) / PROCESS_COUNT)));
+const POOL_SIZE = parseInt(process.env.HASH_POOL_SIZE || String(DEFAULT_SIZE), 10);
+const MAX_QUEUE = parseInt(process.env.HASH_POOL_MAX_QUEUE || '64', 10);
+const SATURATED = 'HASH_POOL_SATURATED';
+
+const saturatedError = () => {
+  const err = new Error('Password hashing is at capacity, try again shortly');
+  err.code = SATURATED;
+  return err;
+};
+
+const isSaturated = (err) => Boolean(err && err.code === SATURATED);
+
+const now = () => performance.now();
+
+class HashPool {
+  constructor({ size = POOL_SIZE, maxQueue = MAX_QUEUE, workerFile = path.join(__dirname, 'hashWorker.js') } = {}) {
+    this.size = size;
+    this.maxQueue = maxQueue;
+    this.workerFile = workerFile;
+    this.workers = []; // { worker, job }
+    this.queue = [];
+    this.nextId = 1;
+    this.inline = 0; // jobs in flight when size is 0
+    this.closed = false;
+    this.metrics = { completed: 0, failed: 0, rejected: 0, maxQueued: 0, waitMs: 0, runMs: 0 };
+  }
+
+  run(op, args) {
+    if (this.size === 0) return this.runInline(op, args);
+    if (this.closed) return Promise.reject(new Error('Hash pool is closed'));
+    if (this.queue.length >= this.maxQueue) {
+      this.metrics.rejected++;
+      return Promise.reject(saturatedError());
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: this.nextId++, op, args, resolve, reject, queuedAt: now() });
+      this.metrics.maxQueued = Math.max(this.metrics.maxQueued, this.queue.length);
+      this.dispatch();
+    });
+  }
+
+  async runInline(op, args) {
+    if (this.inline >= this.maxQueue) {
+      this.metrics.rejected++;
+      throw saturatedError();
+    }
+    this.inline++;
+    const startedAt = now();
+    try {
+      const result = await bcrypt[op](...args);
+      this.metrics.completed++;
+      return result;
+    } catch (err) {
+      this.metrics.failed++;
+      throw err;
+    } finally {
+      this.inline--;
+      this.metrics.runMs += now() - startedAt;
+    }
+  }
+
+  // Hand queued jobs to idle workers, starting workers up to `size`
+  dispatch() {
+    while (this.queue.length > 0) {
+      let slot = this.workers.find((s) => !s.job);
+      if (!slot && this.workers.length < this.size) slot = this.spawn();
+      if (!slot) return;
+
+      const job = this.queue.shift();
+      job.startedAt = now();
+      this.metrics.waitMs += job.startedAt - job.queuedAt;
+      hashPoolWait.observe((job.startedAt - job.queuedAt) / 1000);
+      slot.job = job;
+      slot.worker.ref();
+      slot.worker.postMessage({ id: job.id, op: job.op, args: job.args });
+    }
+  }
+
+  spawn() {
+    const slot = { worker: new Worker(this.workerFile), job: null };
+    slot.worker.on('message', ({ id, result, error }) => {
+      if (!slot.job || slot.job.id !== id) return;
+      this.finish(slot, error ? new Error(error) : null, result);
+    });
+    slot.worker.on('error', (err) => this.replace(slot, err));
+    slot.worker.on('exit', (code) => this.replace(slot, new Error(`Hash worker exited with code ${code}`)));
+    slot.worker.unref();
+    this.workers.push(slot);
+    return slot;
+  }
+
+  finish(slot, err, result) {
+    const { job } = slot;
+    slot.job = null;
+    slot.worker.unref();
+    this.metrics.runMs += now() - job.startedAt;
+    if (err) {
+      this.metrics.failed++;
+      job.reject(err);
+    } else {
+      this.metrics.completed++;
+      job.resolve(result);
+    }
+    this.dispatch();
+  }
+
+  // A dead worker fails its current job; a replacement starts on demand
+  replace(slot, err) {
+    const index = this.workers.indexOf(slot);
+    if (index === -1) return;
+    this.workers.splice(index, 1);
+    if (slot.job) this.finish(slot, err);
+    else if (!this.closed) this.dispatch();
+  }
+
+  stats() {
+    const { completed, failed, rejected, maxQueued, waitMs, runMs } = this.metrics;
+    const finished = completed + failed;
+    return {
+      size: this.size,
+      busy: this.size === 0 ? this.inline : this.workers.filter((s) => s.job).length,
+      queued: this.queue.length,
+      maxQueue: this.maxQueue,
+      completed,
+      failed,
+      rejected,
+      maxQueued,
+      avgWaitMs: finished > 0 ? Math.round((waitMs / finished) * 100) / 100 : 0,
+      avgRunMs: finished > 0 ? Math.round((runMs / finished) * 100) / 100 : 0,
+    };
+  }
+
+  async close() {
+    this.closed = true;
+    const closedError = new Error('Hash pool is closed');
+    this.queue.splice(0).forEach((job) => job.reject(closedError));
+    await Promise.all(this.workers.map((slot) => slot.worker.terminate()));
+  }
+}
+
+const hashPool = new HashPool();
+instrumentHashPool(hashPool);
+
+const hashPassword = (password, rounds) => hashPool.run('hash', [password, rounds]);
+const comparePassword = (password, hash) => hashPool.run('compare', [password, hash]);
+
+module.exports = { HashPool, hashPool, hashPassword, comparePassword, isSaturated };
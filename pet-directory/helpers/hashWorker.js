@@ -0,0 +1,20 @@
+// Worker thread for helpers/hashPool.js.
+//
+// Runs one bcrypt operation at a time with the synchronous API: the worker
+// owns its thread, so blocking it is the point, and it keeps bcrypt off
+// libuv's shared threadpool (fs, dns, zlib and crypto all queue there).
+const { parentPort } = require('worker_threads');
+const bcrypt = require('bcrypt');
+
+const operations = {
+  hash: ([password, rounds]) => bcrypt.hashSync(password, rounds),
+  compare: ([password, hash]) => bcrypt.compareSync(password, hash),
+};
+
+parentPort.on('message', ({ id, op, args }) => {
+  try {
+    parentPort.postMessage({ id, result: operations[op](args) });
+  } catch (err) {
+    parentPort.postMessage({ id, error: err.message });
+  }
+});
@@ -0,0 +1,46 @@
+// Sampled, batched logging for hot paths.
+//
+// Per-request and per-query lines are only kept for a sample of events
+// (LOG_SAMPLE_RATE, default 1%); aggregate numbers live in /metrics instead.
+// Kept lines are buffered and written with one stdout write per event-loop
+// turn, off the request path. If stdout can't keep up, lines beyond
+// MAX_BUFFERED_LINES are dropped and counted rather than piling up in memory.
+
+const LOG_SAMPLE_RATE = parseFloat(process.env.LOG_SAMPLE_RATE || '0.01');
+const MAX_BUFFERED_LINES = 1000;
+
+let buffer = [];
+let scheduled = false;
+let dropped = 0;
+
+const flush = () => {
+  scheduled = false;
+  if (buffer.length === 0 && dropped === 0) return;
+  const lines = buffer;
+  buffer = [];
+  if (dropped > 0) {
+    lines.push(`[logger] dropped ${dropped} line(s)`);
+    dropped = 0;
+  }
+  process.stdout.write(`${lines.join('\n')}\n`);
+};
+
+const log = (line) => {
+  if (buffer.length >= MAX_BUFFERED_LINES) {
+    dropped++;
+    return;
+  }
+  buffer.push(line);
+  if (!scheduled) {
+    scheduled = true;
+    setImmediate(flush);
+  }
+};
+
+// Whether to keep this event, at `rate` (0..1)
+const sampled = (rate = LOG_SAMPLE_RATE) => rate >= 1 || (rate > 0 && Math.random() < rate);
+
+// Writable-like stream for morgan
+const stream = { write: (line) => log(line.replace(/\n$/, '')) };
+
+module.exports = { LOG_SAMPLE_RATE, log, sampled, flush, stream };
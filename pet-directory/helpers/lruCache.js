@@ -0,0 +1,45 @@
+// Bounded in-process LRU cache with per-entry TTL.
+//
+// A Map keeps insertion order, so re-inserting on access moves an entry to the
+// "most recently used" end and the first key is always the eviction candidate.
+class LRUCache {
+  constructor({ max = 500, ttl = 5000 } = {}) {
+    this.max = max;
+    this.ttl = ttl; // ms
+    this.map = new Map();
+  }
+
+  get(key) {
+    const entry = this.map.get(key);
+    if (!entry) return undefined;
+    if (entry.expiresAt <= Date.now()) {
+      this.map.delete(key);
+      return undefined;
+    }
+    this.map.delete(key);
+    this.map.set(key, entry);
+    return entry.value;
+  }
+
+  set(key, value, ttl = this.ttl) {
+    if (this.map.has(key)) this.map.delete(key);
+    this.map.set(key, { value, expiresAt: Date.now() + ttl });
+    while (this.map.size > this.max) {
+      this.map.delete(this.map.keys().next().value);
+    }
+  }
+
+  delete(key) {
+    return this.map.delete(key);
+  }
+
+  clear() {
+    this.map.clear();
+  }
+
+  get size() {
+    return this.map.size;
+  }
+}
+
+module.exports = LRUCache;
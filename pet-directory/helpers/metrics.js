@@ -0,0 +1,167 @@
+const cluster = require('cluster');
+const client = require('prom-client');
+
+// Prometheus metrics, served by GET /metrics.
+//
+// Latencies are histograms so they can be aggregated across instances; read
+// percentiles with e.g.
+//   histogram_quantile(0.95, sum by (le, route) (rate(http_request_duration_seconds_bucket[5m])))
+// The default Node.js metrics include event-loop lag (nodejs_eventloop_lag_*,
+// with p50/p90/p99), GC, heap and handle counts.
+//
+// In cluster mode each worker also answers the primary's aggregation requests,
+// and GET /metrics on any worker returns the sum over all of them (see
+// helpers/clusterMetrics.js).
+
+const { register } = client;
+
+client.collectDefaultMetrics({ register });
+if (cluster.isWorker) new client.AggregatorRegistry(); // registers the IPC listener
+
+const httpRequestDuration = new client.Histogram({
+  name: 'http_request_duration_seconds',
+  help: 'HTTP request latency by templated route',
+  labelNames: ['method', 'route', 'status_code'],
+  buckets: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+});
+
+const dbQueryDuration = new client.Histogram({
+  name: 'db_query_duration_seconds',
+  help: 'Sequelize query duration (benchmark timing) by statement type',
+  labelNames: ['operation'],
+  buckets: [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+});
+
+const dbPoolWait = new client.Histogram({
+  name: 'db_pool_wait_seconds',
+  help: 'Time spent waiting for a database connection from the pool',
+  buckets: [0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30],
+});
+
+const redisCommandDuration = new client.Histogram({
+  name: 'redis_command_duration_seconds',
+  help: 'Redis command round-trip latency by command',
+  labelNames: ['command'],
+  buckets: [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25],
+});
+
+const cacheLookups = new client.Counter({
+  name: 'cache_lookups_total',
+  help: 'Response cache lookups by namespace and result (local_hit, redis_hit, coalesced, miss)',
+  labelNames: ['namespace', 'result'],
+});
+
+const startupDuration = new client.Gauge({
+  name: 'app_startup_seconds',
+  help: 'Seconds from process start to each startup phase (listening, first_request)',
+  labelNames: ['phase'],
+  aggregator: 'max',
+});
+
+const hashPoolWait = new client.Histogram({
+  name: 'hash_pool_wait_seconds',
+  help: 'Time password hashing jobs spend queued for a worker',
+  buckets: [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+});
+
+// First segment of a cache key, e.g. "reviews" for "reviews:4:g2:..."
+const cacheNamespace = (key) => String(key).split(':')[0];
+
+const recordStartup = (phase, seconds) => startupDuration.set({ phase }, seconds);
+
+const recordCacheLookup = (namespace, result, count = 1) => {
+  if (count > 0) cacheLookups.inc({ namespace, result }, count);
+};
+
+// Sequelize `logging` callback with `benchmark: true`: (message, durationMs)
+const SQL_OPERATION = /^Execut(?:ed|ing) \([^)]*\): (\w+)/;
+
+const observeQuery = (message, durationMs) => {
+  if (typeof durationMs !== 'number') return;
+  const match = SQL_OPERATION.exec(message);
+  const operation = match ? match[1].toUpperCase() : 'OTHER';
+  dbQueryDuration.observe({ operation }, durationMs / 1000);
+};
+
+// Pool wait times and pool occupancy for a Sequelize instance
+const instrumentSequelize = (sequelize) => {
+  const started = new WeakMap();
+  sequelize.addHook('beforePoolAcquire', (options) => {
+    if (options) started.set(options, process.hrtime.bigint());
+  });
+  sequelize.addHook('afterPoolAcquire', (connection, options) => {
+    const start = options && started.get(options);
+    if (!start) return;
+    started.delete(options);
+    dbPoolWait.observe(Number(process.hrtime.bigint() - start) / 1e9);
+  });
+
+  // sequelize-pool exposes size/available/using/waiting (not every dialect has one)
+  const pool = () => sequelize.connectionManager && sequelize.connectionManager.pool;
+  ['size', 'available', 'using', 'waiting'].forEach((stat) => {
+    new client.Gauge({
+      name: `db_pool_${stat}`,
+      help: `Database connection pool: ${stat}`,
+      collect() {
+        const current = pool();
+        if (current && typeof current[stat] === 'number') this.set(current[stat]);
+      },
+    });
+  });
+};
+
+// Time every command sent by an ioredis client, including pipelined ones
+const instrumentRedis = (redis) => {
+  const timed = new WeakSet();
+  const sendCommand = redis.sendCommand;
+  redis.sendCommand = function instrumentedSendCommand(command, ...rest) {
+    // Commands are re-sent from the offline queue after a reconnect; time them once
+    if (command && command.promise && !timed.has(command)) {
+      timed.add(command);
+      const end = redisCommandDuration.startTimer({ command: command.name });
+      command.promise.then(() => end(), () => end());
+    }
+    return sendCommand.call(this, command, ...rest);
+  };
+  return redis;
+};
+
+// Occupancy and rejections for a helpers/hashPool.js pool
+const instrumentHashPool = (pool) => {
+  [
+    ['busy', 'Password hashing jobs running'],
+    ['queued', 'Password hashing jobs waiting for a worker'],
+  ].forEach(([stat, help]) => {
+    new client.Gauge({
+      name: `hash_pool_${stat}`,
+      help,
+      collect() {
+        this.set(pool.stats()[stat]);
+      },
+    });
+  });
+
+  let reported = 0;
+  new client.Counter({
+    name: 'hash_pool_rejected_total',
+    help: 'Password hashing jobs rejected because the queue was full',
+    collect() {
+      const { rejected } = pool.stats();
+      if (rejected > reported) this.inc(rejected - reported);
+      reported = rejected;
+    },
+  });
+};
+
+module.exports = {
+  register,
+  httpRequestDuration,
+  hashPoolWait,
+  cacheNamespace,
+  recordCacheLookup,
+  recordStartup,
+  observeQuery,
+  instrumentSequelize,
+  instrumentRedis,
+  instrumentHashPool,
+};
@@ -0,0 +1,163 @@
+const { Op, QueryTypes } = require('sequelize');
+const redis = require('../config/redis');
+const { buildCacheKey } = require('./cacheHelpers');
+const { recordCacheLookup } = require('./metrics');
+
+// Pagination helpers shared by the list endpoints.
+//
+// Two modes are supported:
+//   - offset mode (`?page=&limit=`), kept for existing clients
+//   - keyset mode (`?cursor=&limit=`), which seeks on the (createdAt, id)
+//     composite index instead of scanning and discarding OFFSET rows
+//
+// Totals come from a count cached per tag generation, or from the planner's
+// row estimate for large unfiltered Postgres tables, rather than an exact
+// COUNT(*) on every page.
+
+const COUNT_TTL = 300; // seconds
+const ESTIMATE_THRESHOLD = 10000; // below this, an exact count is cheap enough
+
+const KEYSET_ORDER = [['createdAt', 'DESC'], ['id', 'DESC']];
+
+// Cursors are opaque to clients: base64url([direction, createdAt, id])
+const encodeCursor = (row, direction) =>
+  Buffer.from(JSON.stringify([direction, new Date(row.createdAt).toISOString(), row.id])).toString('base64url');
+
+const decodeCursor = (cursor) => {
+  try {
+    const [direction, createdAt, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    const date = new Date(createdAt);
+    if (!['next', 'prev'].includes(direction) || Number.isNaN(date.getTime()) || !Number.isInteger(id)) return null;
+    return { direction, createdAt: date, id };
+  } catch (_) {
+    return null;
+  }
+};
+
+// express-validator friendly check; an empty cursor requests the first page
+const isValidCursor = (value) => value === '' || decodeCursor(value) !== null;
+
+const isCursorMode = (query) => query.cursor !== undefined;
+
+// Cache key suffix identifying the requested page
+const pageSuffix = ({ page = 1, limit = 10, cursor }) =>
+  cursor !== undefined ? `cursor:${cursor || 'start'}:limit:${limit}` : `page:${page}:limit:${limit}`;
+
+// Fetch one page after (or before) the cursor position
+const findKeysetPage = async (Model, { where = {}, limit, cursor }) => {
+  const position = cursor ? decodeCursor(cursor) : null;
+  const backwards = Boolean(position && position.direction === 'prev');
+  const compare = backwards ? Op.gt : Op.lt;
+
+  const conditions = [where];
+  if (position) {
+    conditions.push({
+      [Op.or]: [
+        { createdAt: { [compare]: position.createdAt } },
+        { createdAt: position.createdAt, id: { [compare]: position.id } },
+      ],
+    });
+  }
+
+  // Fetch one extra row to learn whether another page exists
+  const rows = await Model.findAll({
+    where: { [Op.and]: conditions },
+    limit: limit + 1,
+    order: backwards ? [['createdAt', 'ASC'], ['id', 'ASC']] : KEYSET_ORDER,
+  });
+  const hasMore = rows.length > limit;
+  if (hasMore) rows.pop();
+  if (backwards) rows.reverse();
+
+  const hasNext = backwards || hasMore;
+  const hasPrev = backwards ? hasMore : Boolean(position);
+  return {
+    rows,
+    nextCursor: hasNext && rows.length > 0 ? encodeCursor(rows[rows.length - 1], 'next') : null,
+    prevCursor: hasPrev && rows.length > 0 ? encodeCursor(rows[0], 'prev') : null,
+  };
+};
+
+// Planner estimate for a whole table (Postgres only)
+const estimateCount = async (Model) => {
+  if (Model.sequelize.getDialect() !== 'postgres') return null;
+  const [row] = await Model.sequelize.query(
+    'SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass(:table)',
+    { replacements: { table: Model.getTableName() }, type: QueryTypes.SELECT }
+  );
+  const estimate = row ? Number(row.estimate) : -1;
+  return estimate >= ESTIMATE_THRESHOLD ? estimate : null;
+};
+
+// Count rows, reusing the result until the tag generation changes
+const countCached = async (Model, { where = {}, tags, suffix }) => {
+  const cacheKey = await buildCacheKey(tags, `count:${suffix}`);
+  const cached = await redis.get(cacheKey);
+  recordCacheLookup('count', cached !== null ? 'redis_hit' : 'miss');
+  if (cached !== null) return parseInt(cached, 10);
+
+  let total = Reflect.ownKeys(where).length === 0 ? await estimateCount(Model) : null;
+  if (total === null) total = await Model.count({ where });
+
+  await redis.set(cacheKey, String(total), 'EX', COUNT_TTL);
+  return total;
+};
+
+// Link to another page of the current request, swapping in a new cursor
+const pageLink = (req, cursor) => {
+  if (!cursor) return null;
+  const params = new URLSearchParams({ ...req.query, cursor });
+  const path = req.path === '/' ? req.baseUrl : `${req.baseUrl}${req.path}`;
+  return `${path}?${params.toString()}`;
+};
+
+/**
+ * Paginate `Model` according to the request query, in either mode.
+ *
+ * `tags` / `countKey` scope the cached total. `order` applies to offset mode
+ * only; cursor mode always walks the (createdAt, id) keyset. Resolves to
+ * `{ rows, ...meta }` where `meta` is the pagination part of the response body.
+ */
+const paginate = async (Model, req, { where = {}, tags, countKey, order = KEYSET_ORDER }) => {
+  const { page = 1, limit = 10, cursor } = req.query;
+  const pageLimit = parseInt(limit);
+  const countTotal = countCached(Model, { where, tags, suffix: countKey });
+
+  if (isCursorMode(req.query)) {
+    const [{ rows, nextCursor, prevCursor }, total] = await Promise.all([
+      findKeysetPage(Model, { where, limit: pageLimit, cursor }),
+      countTotal,
+    ]);
+    return {
+      rows,
+      total,
+      limit: pageLimit,
+      nextCursor,
+      prevCursor,
+      links: { next: pageLink(req, nextCursor), prev: pageLink(req, prevCursor) },
+    };
+  }
+
+  const [rows, total] = await Promise.all([
+    Model.findAll({
+      where,
+      limit: pageLimit,
+      offset: (parseInt(page) - 1) * pageLimit,
+      order,
+    }),
+    countTotal,
+  ]);
+  return { rows, total, page: parseInt(page), limit: pageLimit };
+};
+
+module.exports = {
+  KEYSET_ORDER,
+  encodeCursor,
+  decodeCursor,
+  isValidCursor,
+  isCursorMode,
+  pageSuffix,
+  findKeysetPage,
+  countCached,
+  paginate,
+};
@@ -0,0 +1,83 @@
+const { literal } = require('sequelize');
+
+// Per-business rating aggregates.
+//
+// Businesses carry ratingCount, ratingSum, ratingAverage and one counter per
+// star (rating1..rating5). Review writes adjust them with a single relative
+// UPDATE inside the review's transaction, so concurrent reviews never lose an
+// increment and nobody has to read every review to show a star average.
+
+const STARS = [1, 2, 3, 4, 5];
+
+// Quoted column name for a model attribute (honours `underscored`)
+const columnOf = (Model) => {
+  const queryInterface = Model.sequelize.getQueryInterface();
+  return (attribute) => queryInterface.quoteIdentifier(Model.rawAttributes[attribute].field);
+};
+
+const tableOf = (Model) => Model.sequelize.getQueryInterface().queryGenerator.quoteTable(Model.getTableName());
+
+// Add (delta = 1) or remove (delta = -1) one rating from a business's aggregates
+const applyRating = async (Business, businessId, rating, delta, { transaction } = {}) => {
+  const stars = Number(rating);
+  if (!STARS.includes(stars) || ![1, -1].includes(delta)) throw new Error(`Invalid rating change: ${rating} x ${delta}`);
+
+  const column = columnOf(Business);
+  const count = `${column('ratingCount')} + ${delta}`;
+  const sum = `${column('ratingSum')} + ${delta * stars}`;
+
+  await Business.update(
+    {
+      ratingCount: literal(count),
+      ratingSum: literal(sum),
+      [`rating${stars}`]: literal(`${column(`rating${stars}`)} + ${delta}`),
+      ratingAverage: literal(`CASE WHEN ${count} > 0 THEN CAST(${sum} AS FLOAT) / (${count}) ELSE 0 END`),
+    },
+    { where: { id: businessId }, transaction, silent: true, hooks: false }
+  );
+};
+
+/**
+ * Recompute every business's aggregates from the reviews table, in id-range
+ * batches so no single statement holds locks on the whole table.
+ * Resolves to the number of batches processed.
+ */
+const rebuildRatingAggregates = async (Business, Review, { batchSize = 1000 } = {}) => {
+  const b = columnOf(Business);
+  const r = columnOf(Review);
+  const businesses = tableOf(Business);
+  const reviews = tableOf(Review);
+
+  const aggregate = (expression) =>
+    `(SELECT ${expression} FROM ${reviews} WHERE ${reviews}.${r('businessId')} = ${businesses}.${b('id')})`;
+  const assignments = [
+    `${b('ratingCount')} = ${aggregate('COUNT(*)')}`,
+    `${b('ratingSum')} = ${aggregate(`COALESCE(SUM(${r('rating')}), 0)`)}`,
+    `${b('ratingAverage')} = ${aggregate(`COALESCE(AVG(CAST(${r('rating')} AS FLOAT)), 0)`)}`,
+    ...STARS.map((stars) =>
+      `${b(`rating${stars}`)} = ${aggregate(`COALESCE(SUM(CASE WHEN ${r('rating')} = ${stars} THEN 1 ELSE 0 END), 0)`)}`),
+  ];
+
+  const [minId, maxId] = await Promise.all([Business.min('id'), Business.max('id')]);
+  if (minId === null || minId === undefined) return 0;
+
+  let batches = 0;
+  for (let start = minId; start <= maxId; start += batchSize) {
+    await Business.sequelize.query(
+      `UPDATE ${businesses} SET ${assignments.join(', ')} WHERE ${b('id')} BETWEEN :start AND :end`,
+      { replacements: { start, end: start + batchSize - 1 } }
+    );
+    batches++;
+  }
+  return batches;
+};
+
+// Shape embedded in business responses
+const ratingSummary = (values) => ({
+  count: values.ratingCount || 0,
+  sum: values.ratingSum || 0,
+  average: Math.round((values.ratingAverage || 0) * 100) / 100,
+  histogram: Object.fromEntries(STARS.map((stars) => [stars, values[`rating${stars}`] || 0])),
+});
+
+module.exports = { STARS, applyRating, rebuildRatingAggregates, ratingSummary };
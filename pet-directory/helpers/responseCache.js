@@ -0,0 +1,123 @@
+const crypto = require('crypto');
+const zlib = require('zlib');
+const { promisify } = require('util');
+const redis = require('../config/redis');
+const { CACHE_TTL, buildCacheKey, localResponses, isLocalCacheEnabled } = require('./cacheHelpers');
+const { cacheNamespace, recordCacheLookup } = require('./metrics');
+
+// Two-tier JSON response cache.
+//
+//   1. in-process LRU (only while the invalidation listener is connected)
+//   2. Redis, holding the serialized JSON body
+//
+// Hits are written straight to the socket as the stored bytes with an ETag,
+// so there is no JSON.parse/JSON.stringify round trip. Concurrent misses for
+// the same key share a single loader call (single-flight) instead of all
+// hitting Postgres at once.
+
+const gzip = promisify(zlib.gzip);
+const GZIP_MIN_BYTES = 1024;
+
+// Pending loads, keyed by cache key
+const inFlight = new Map();
+
+const makeEntry = (body) => {
+  const buffer = Buffer.isBuffer(body) ? body : Buffer.from(body);
+  const hash = crypto.createHash('sha1').update(buffer).digest('base64url');
+  return { body: buffer, etag: `W/"${hash}"`, gzipped: null };
+};
+
+// Compress once per entry and reuse the result for every later hit
+const getGzipped = (entry) => {
+  if (!entry.gzipped) {
+    entry.gzipped = gzip(entry.body).catch((err) => {
+      entry.gzipped = null;
+      throw err;
+    });
+  }
+  return entry.gzipped;
+};
+
+const isFresh = (req, etag) => {
+  const header = req.headers['if-none-match'];
+  if (!header) return false;
+  return header === '*' || header.split(',').some((tag) => tag.trim() === etag);
+};
+
+const sendEntry = async (req, res, entry) => {
+  res.set('ETag', entry.etag);
+  res.set('Vary', 'Accept-Encoding');
+  res.type('json');
+
+  if (isFresh(req, entry.etag)) return res.status(304).end();
+
+  if (entry.body.length >= GZIP_MIN_BYTES && req.acceptsEncodings('gzip') === 'gzip') {
+    const compressed = await getGzipped(entry);
+    res.set('Content-Encoding', 'gzip');
+    res.set('Content-Length', String(compressed.length));
+    return res.end(compressed);
+  }
+  res.set('Content-Length', String(entry.body.length));
+  return res.end(entry.body);
+};
+
+// Run `load` at most once per key at a time
+const singleFlight = (key, load) => {
+  if (inFlight.has(key)) return inFlight.get(key);
+  const promise = Promise.resolve()
+    .then(load)
+    .finally(() => inFlight.delete(key));
+  inFlight.set(key, promise);
+  return promise;
+};
+
+// Look up (or build) the cache entry for a key
+const getEntry = async (cacheKey, load, ttl) => {
+  const useLocal = isLocalCacheEnabled();
+  const namespace = cacheNamespace(cacheKey);
+  if (useLocal) {
+    const local = localResponses.get(cacheKey);
+    if (local) {
+      recordCacheLookup(namespace, 'local_hit');
+      return local;
+    }
+  }
+
+  if (inFlight.has(cacheKey)) recordCacheLookup(namespace, 'coalesced');
+
+  const entry = await singleFlight(cacheKey, async () => {
+    const stored = await redis.getBuffer(cacheKey);
+    recordCacheLookup(namespace, stored ? 'redis_hit' : 'miss');
+    if (stored) return makeEntry(stored);
+
+    const data = await load();
+    if (data === null || data === undefined) return null;
+
+    const body = JSON.stringify(data);
+    await redis.set(cacheKey, body, 'EX', ttl);
+    return makeEntry(body);
+  });
+
+  if (entry && useLocal) localResponses.set(cacheKey, entry);
+  return entry;
+};
+
+/**
+ * Serve a cached JSON response.
+ *
+ * Either pass an exact `key`, or `tags` + `suffix` to build a generation-scoped
+ * key. `load` is only called on a miss and should resolve to the response
+ * payload, or null/undefined when there is nothing to send.
+ *
+ * Resolves true when a response was sent, false when `load` found nothing so
+ * the caller can reply (e.g. with a 404) itself.
+ */
+const sendCached = async (req, res, { key, tags, suffix, ttl = CACHE_TTL }, load) => {
+  const cacheKey = key || (await buildCacheKey(tags, suffix));
+  const entry = await getEntry(cacheKey, load, ttl);
+  if (!entry) return false;
+  await sendEntry(req, res, entry);
+  return true;
+};
+
+module.exports = { sendCached, singleFlight, makeEntry };
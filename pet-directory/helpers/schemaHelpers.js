@@ -0,0 +1,54 @@
+// Schema helpers for migrations and seeders.
+//
+// The models are `underscored`, so attribute `ratingCount` is stored in column
+// `rating_count`. Tables built by sync() use those names from the start; the
+// original create-table migrations used camelCase until
+// 20250901000050-underscore-columns renamed them. Names are resolved against
+// the live table so the same code works on either, and a database that
+// already has a column or index (e.g. from sync()) is left as it is.
+//
+// Kept free of model/Redis imports so migrations can use it.
+
+// Column name of an attribute on an `underscored` model
+const fieldName = (attribute) => attribute.replace(/([a-z0-9])([A-Z])/g, '$1_$2').toLowerCase();
+
+// Map attribute names onto a table's real columns; unknown attributes get the model's field name
+const columnResolver = async (queryInterface, table) => {
+  const columns = new Set(Object.keys(await queryInterface.describeTable(table)));
+  const resolve = (attribute) => (columns.has(attribute) ? attribute : fieldName(attribute));
+  resolve.has = (attribute) => columns.has(attribute) || columns.has(fieldName(attribute));
+  return resolve;
+};
+
+// Map row objects onto a table's columns, dropping attributes the table doesn't have
+const rowMapper = async (queryInterface, table) => {
+  const column = await columnResolver(queryInterface, table);
+  const fields = new Map();
+  return (row) => {
+    const mapped = {};
+    Object.keys(row).forEach((attribute) => {
+      if (!fields.has(attribute)) fields.set(attribute, column.has(attribute) ? column(attribute) : null);
+      const field = fields.get(attribute);
+      if (field) mapped[field] = row[attribute];
+    });
+    return mapped;
+  };
+};
+
+// Add the attributes the table doesn't have yet, under their field names
+const addMissingColumns = async (queryInterface, table, attributes, options = {}) => {
+  const column = await columnResolver(queryInterface, table);
+  for (const [attribute, definition] of Object.entries(attributes)) {
+    if (!column.has(attribute)) await queryInterface.addColumn(table, column(attribute), definition, options);
+  }
+};
+
+// Add an index over the given attributes unless one with that name exists
+const addIndexIfMissing = async (queryInterface, table, attributes, options) => {
+  const indexes = await queryInterface.showIndex(table);
+  if (indexes.some((index) => index.name === options.name)) return;
+  const column = await columnResolver(queryInterface, table);
+  await queryInterface.addIndex(table, attributes.map(column), options);
+};
+
+module.exports = { fieldName, columnResolver, rowMapper, addMissingColumns, addIndexIfMissing };
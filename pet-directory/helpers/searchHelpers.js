@@ -0,0 +1,148 @@
+const { Op, QueryTypes } = require('sequelize');
+const { searchIndex, tokenize } = require('./searchIndex');
+const { broadcast, onInvalidationMessage } = require('./cacheHelpers');
+
+// Business search.
+//
+// On Postgres the ranking runs in the database against the weighted
+// `search_vector` column (GIN) and a trigram index on `name` for typo
+// tolerance, both added by migrations/20250901000300-add-business-search.js.
+// Other dialects (the SQLite test database) use the in-process inverted index
+// from helpers/searchIndex.js.
+//
+// Both paths resolve to ranked ids; the rows themselves are then fetched by
+// primary key so responses look exactly like the regular listing.
+//
+// The in-process index belongs to one process. Writes are applied locally by
+// the model hooks and broadcast over the cache invalidation channel, so the
+// other cluster workers (and instances) apply them too. If that channel drops
+// messages, the index is cleared and reloaded from the database on the next
+// search.
+
+const MAX_QUERY_TOKENS = 8;
+const INDEXED_ATTRIBUTES = ['id', 'name', 'type', 'description', 'address'];
+
+const queryTokens = (query) => tokenize(query).slice(0, MAX_QUERY_TOKENS);
+
+// Prefix-matching tsquery, e.g. "happy paw" -> "happy:* & paw:*"
+const toPrefixTsQuery = (tokens) => tokens.map((token) => `${token}:*`).join(' & ');
+
+const SEARCH_MATCH = `(b.search_vector @@ q.tsq OR :text <% b.name)
+        AND (CAST(:type AS TEXT) IS NULL OR CAST(b.type AS TEXT) = :type)`;
+
+const searchPostgres = async (Model, { query, type, limit, offset }) => {
+  const tokens = queryTokens(query);
+  if (tokens.length === 0) return { total: 0, ids: [] };
+
+  const replacements = { text: tokens.join(' '), tsquery: toPrefixTsQuery(tokens), type: type || null, limit, offset };
+  const rows = await Model.sequelize.query(
+    `SELECT b.id,
+            ts_rank(b.search_vector, q.tsq) + word_similarity(:text, b.name) AS rank,
+            COUNT(*) OVER () AS total
+       FROM businesses b, to_tsquery('english', :tsquery) AS q(tsq)
+      WHERE ${SEARCH_MATCH}
+      ORDER BY rank DESC, b.id DESC
+      LIMIT :limit OFFSET :offset`,
+    { replacements, type: QueryTypes.SELECT }
+  );
+  if (rows.length > 0) return { total: Number(rows[0].total), ids: rows.map((row) => row.id) };
+  if (offset === 0) return { total: 0, ids: [] };
+
+  // Past the last page the window count has no rows to ride on; count separately
+  const [{ total }] = await Model.sequelize.query(
+    `SELECT COUNT(*) AS total
+       FROM businesses b, to_tsquery('english', :tsquery) AS q(tsq)
+      WHERE ${SEARCH_MATCH}`,
+    { replacements, type: QueryTypes.SELECT }
+  );
+  return { total: Number(total), ids: [] };
+};
+
+// Build the in-process index once; concurrent first searches share the load.
+// Writes that land while the snapshot is loading are replayed afterwards; a
+// reset during the load discards the snapshot and takes a new one.
+let loading = null;
+let pendingWrites = [];
+let snapshotStale = false;
+
+const ensureIndexLoaded = async (Model) => {
+  while (!searchIndex.loaded) {
+    if (!loading) {
+      pendingWrites = [];
+      snapshotStale = false;
+      loading = Model.findAll({ attributes: INDEXED_ATTRIBUTES })
+        .then((businesses) => {
+          if (snapshotStale) return;
+          businesses.forEach((business) => searchIndex.upsert(business.get({ plain: true })));
+          pendingWrites.forEach((apply) => apply());
+          searchIndex.loaded = true;
+        })
+        .finally(() => {
+          loading = null;
+          pendingWrites = [];
+        });
+    }
+    await loading;
+  }
+};
+
+const applyWrite = (apply) => {
+  if (searchIndex.loaded) apply();
+  else if (loading) pendingWrites.push(apply);
+};
+
+const searchInMemory = async (Model, { query, type, limit, offset }) => {
+  await ensureIndexLoaded(Model);
+  const matches = searchIndex.search(queryTokens(query).join(' '), { type });
+  return { total: matches.length, ids: matches.slice(offset, offset + limit).map((match) => match.id) };
+};
+
+/**
+ * Relevance-ranked business search with optional type filter.
+ * Resolves to `{ total, rows }` for the requested page.
+ */
+const searchBusinesses = async (Model, { query, type, limit, offset }) => {
+  const search = Model.sequelize.getDialect() === 'postgres' ? searchPostgres : searchInMemory;
+  const { total, ids } = await search(Model, { query, type, limit, offset });
+  if (ids.length === 0) return { total, rows: [] };
+
+  const rows = await Model.findAll({ where: { id: { [Op.in]: ids } } });
+  const byId = new Map(rows.map((row) => [row.id, row]));
+  return { total, rows: ids.map((id) => byId.get(id)).filter(Boolean) };
+};
+
+// Postgres searches in the database, so there is nothing to forward
+const broadcastWrite = (business, change) => {
+  if (business.constructor.sequelize.getDialect() === 'postgres') return;
+  broadcast({ search: change }).catch((err) => console.error('❌ Search index broadcast failed', err.message));
+};
+
+// Model hooks keep the in-process index in sync with writes
+const indexBusiness = (business) => {
+  const plain = business.get({ plain: true });
+  const document = Object.fromEntries(INDEXED_ATTRIBUTES.map((name) => [name, plain[name]]));
+  applyWrite(() => searchIndex.upsert(document));
+  broadcastWrite(business, { upsert: document });
+};
+
+const unindexBusiness = (business) => {
+  const { id } = business;
+  applyWrite(() => searchIndex.remove(id));
+  broadcastWrite(business, { remove: id });
+};
+
+// Writes made by other processes
+onInvalidationMessage({
+  onMessage: ({ search }) => {
+    if (!search) return;
+    if (search.upsert) applyWrite(() => searchIndex.upsert(search.upsert));
+    if (search.remove !== undefined) applyWrite(() => searchIndex.remove(search.remove));
+  },
+  // Messages may have been missed; rebuild from the database on the next search
+  onReset: () => {
+    searchIndex.clear();
+    if (loading) snapshotStale = true;
+  },
+});
+
+module.exports = { searchBusinesses, indexBusiness, unindexBusiness, toPrefixTsQuery };
@@ -0,0 +1,195 @@
+// In-process inverted index over businesses, used for search when the
+// database has no full-text support (the SQLite test dialect).
+//
+// Documents are tokenized per field with a weight (name > type > description
+// > address). Query tokens match indexed terms exactly, by prefix, or within a
+// small edit distance, with decreasing scores. Every query token must match
+// for a document to be returned.
+//
+// The index is loaded lazily on the first search and then kept up to date by
+// the Business model hooks (see models/business.js). Each process has its own
+// copy; writes reach the other processes over the cache invalidation channel
+// (see helpers/searchHelpers.js).
+
+const FIELD_WEIGHTS = { name: 4, type: 3, description: 1, address: 1 };
+
+// Words indexed for each business type. Shared with the Postgres search_vector
+// column (migrations/20250901000300-add-business-search.js) so both dialects
+// match the same synonyms.
+const TYPE_KEYWORDS = {
+  Vet: 'vet veterinarian',
+  Groomer: 'groomer grooming',
+  'Pet Sitter': 'pet sitter sitting',
+  'Dog Park': 'dog park',
+};
+
+const fieldText = (business, field) =>
+  field === 'type' ? TYPE_KEYWORDS[business.type] || business.type : business[field];
+const MATCH_SCORES = { exact: 1, prefix: 0.7, fuzzy: 0.4 };
+const MIN_PREFIX_LENGTH = 2;
+
+const tokenize = (text) =>
+  String(text || '')
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean);
+
+// Allowed typos grow with the length of the token
+const maxEdits = (token) => (token.length >= 8 ? 2 : token.length >= 4 ? 1 : 0);
+
+// Damerau-Levenshtein (optimal string alignment) distance, bailing out early
+const editDistance = (a, b, limit) => {
+  if (Math.abs(a.length - b.length) > limit) return limit + 1;
+  let prevPrev = null;
+  let prev = Array.from({ length: b.length + 1 }, (_, j) => j);
+  for (let i = 1; i <= a.length; i++) {
+    const current = [i];
+    let rowMin = i;
+    for (let j = 1; j <= b.length; j++) {
+      const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+      let value = Math.min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost);
+      if (prevPrev && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+        value = Math.min(value, prevPrev[j - 2] + 1);
+      }
+      current.push(value);
+      rowMin = Math.min(rowMin, value);
+    }
+    if (rowMin > limit) return limit + 1;
+    prevPrev = prev;
+    prev = current;
+  }
+  return prev[b.length];
+};
+
+class SearchIndex {
+  constructor() {
+    this.postings = new Map(); // term -> Map(id -> weight)
+    this.documents = new Map(); // id -> { type, terms }
+    this.sortedTerms = [];
+    this.dirty = false;
+    this.loaded = false;
+  }
+
+  upsert(business) {
+    const { id } = business;
+    this.remove(id);
+
+    const terms = new Map();
+    Object.entries(FIELD_WEIGHTS).forEach(([field, weight]) => {
+      tokenize(fieldText(business, field)).forEach((term) => {
+        terms.set(term, Math.max(terms.get(term) || 0, weight));
+      });
+    });
+
+    terms.forEach((weight, term) => {
+      if (!this.postings.has(term)) {
+        this.postings.set(term, new Map());
+        this.dirty = true;
+      }
+      this.postings.get(term).set(id, weight);
+    });
+    this.documents.set(id, { type: business.type, terms: [...terms.keys()] });
+  }
+
+  remove(id) {
+    const document = this.documents.get(id);
+    if (!document) return;
+    document.terms.forEach((term) => {
+      const posting = this.postings.get(term);
+      posting.delete(id);
+      if (posting.size === 0) {
+        this.postings.delete(term);
+        this.dirty = true;
+      }
+    });
+    this.documents.delete(id);
+  }
+
+  // Terms sharing `prefix`, found by binary search over the sorted vocabulary
+  prefixTerms(prefix) {
+    if (this.dirty) {
+      this.sortedTerms = [...this.postings.keys()].sort();
+      this.dirty = false;
+    }
+    let low = 0;
+    let high = this.sortedTerms.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (this.sortedTerms[mid] < prefix) low = mid + 1;
+      else high = mid;
+    }
+    const result = [];
+    for (let i = low; i < this.sortedTerms.length && this.sortedTerms[i].startsWith(prefix); i++) {
+      result.push(this.sortedTerms[i]);
+    }
+    return result;
+  }
+
+  // Indexed terms matching one query token, with their match score
+  matchTerms(token) {
+    const matches = new Map();
+    if (this.postings.has(token)) matches.set(token, MATCH_SCORES.exact);
+
+    if (token.length >= MIN_PREFIX_LENGTH) {
+      this.prefixTerms(token).forEach((term) => {
+        if (!matches.has(term)) matches.set(term, MATCH_SCORES.prefix);
+      });
+    }
+
+    const edits = maxEdits(token);
+    if (matches.size === 0 && edits > 0) {
+      this.postings.forEach((_, term) => {
+        if (editDistance(token, term, edits) <= edits) matches.set(term, MATCH_SCORES.fuzzy);
+      });
+    }
+    return matches;
+  }
+
+  /**
+   * Ranked ids for `query`, optionally restricted to one business type.
+   * Resolves ties by newest id first, like the listing order.
+   */
+  search(query, { type } = {}) {
+    const tokens = [...new Set(tokenize(query))];
+    if (tokens.length === 0) return [];
+
+    let scores = null;
+    for (const token of tokens) {
+      const tokenScores = new Map();
+      this.matchTerms(token).forEach((matchScore, term) => {
+        this.postings.get(term).forEach((weight, id) => {
+          const score = weight * matchScore;
+          if (score > (tokenScores.get(id) || 0)) tokenScores.set(id, score);
+        });
+      });
+
+      if (scores === null) {
+        scores = tokenScores;
+      } else {
+        const merged = new Map();
+        scores.forEach((score, id) => {
+          if (tokenScores.has(id)) merged.set(id, score + tokenScores.get(id));
+        });
+        scores = merged;
+      }
+      if (scores.size === 0) return [];
+    }
+
+    return [...scores.entries()]
+      .filter(([id]) => !type || this.documents.get(id).type === type)
+      .sort((a, b) => b[1] - a[1] || b[0] - a[0])
+      .map(([id, score]) => ({ id, score }));
+  }
+
+  clear() {
+    this.postings.clear();
+    this.documents.clear();
+    this.sortedTerms = [];
+    this.dirty = false;
+    this.loaded = false;
+  }
+}
+
+module.exports = { SearchIndex, TYPE_KEYWORDS, tokenize, editDistance, searchIndex: new SearchIndex() };
@@ -32,8 +32,8 @@ const testUser = {
   name: `Test User ${__VU}`,
 };
 
-// Helper function to handle API requests
-function makeRequest(method, endpoint, token = null, body = null) {
+// Helper function to handle API requests; `okStatuses` overrides the 2xx/3xx check
+function makeRequest(method, endpoint, token = null, body = null, okStatuses = null) {
   const params = {
     headers: {
       'Content-Type': 'application/json',
@@ -56,8 +56,8 @@ function makeRequest(method, endpoint, token = null, body = null) {
   }
 
   const success = check(response, {
-    [`${method} ${endpoint} status was 2xx or 3xx`]: (r) =>
-      r.status >= 200 && r.status < 400,
+    [`${method} ${endpoint} status was expected`]: (r) =>
+      okStatuses ? okStatuses.includes(r.status) : r.status >= 200 && r.status < 400,
   });
 
   if (!success) {
@@ -72,14 +72,13 @@ function makeRequest(method, endpoint, token = null, body = null) {
 
 // Test scenario
 export default function () {
-  // 1. Register a new user
+  // 1. Register the VU's user (409 on later iterations: already registered)
   const registerResponse = makeRequest('POST', '/auth/register', null, {
     ...testUser,
     role: 'user',
-  });
+  }, [201, 409]);
 
-  // If registration failed, skip the rest of the test
-  if (registerResponse.status !== 201) {
+  if (registerResponse.status !== 201 && registerResponse.status !== 409) {
     return;
   }
 
@@ -89,26 +88,23 @@ export default function () {
     password: testUser.password,
   });
 
-  const authToken = loginResponse.json('token');
+  const authToken = loginResponse.status === 200 ? loginResponse.json('accessToken') : null;
   if (!authToken) {
     return;
   }
 
-  // 3. Fetch businesses
-  const businesses = makeRequest('GET', '/businesses', authToken);
+  // 3. Fetch businesses (the list is under `businesses`, next to the pagination fields)
+  const businessesResponse = makeRequest('GET', '/businesses', authToken);
   let businessId = null;
-  
-  if (businesses && businesses.json() && businesses.json().length > 0) {
-    businessId = businesses.json()[0].id;
+
+  const businesses = businessesResponse.status === 200 ? businessesResponse.json('businesses') : null;
+  if (businesses && businesses.length > 0) {
+    businessId = businesses[0].id;
   }
 
   // 4. If we have a business, fetch its services
   if (businessId) {
-    makeRequest(
-      'GET',
-      `/businesses/${businessId}/services`,
-      authToken
-    );
+    makeRequest('GET', `/services/${businessId}`, authToken);
   }
 
   // 5. Simulate user think time
@@ -0,0 +1,120 @@
+// load-tests/bench/loadGenerator.js
+// Closed-loop HTTP load: `concurrency` virtual users, each sending its next
+// request as soon as the previous one finishes, over keep-alive connections.
+// Latencies are recorded per label so one scenario can mix several endpoints.
+const http = require("http");
+
+const percentile = (sorted, p) => {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+};
+
+const round = (value) => Math.round(value * 100) / 100;
+
+const summarize = (latencies, errors, elapsedMs) => {
+  const sorted = Float64Array.from(latencies).sort();
+  const count = sorted.length;
+  const total = sorted.reduce((sum, value) => sum + value, 0);
+  return {
+    requests: count,
+    errors,
+    errorRate: count > 0 ? Math.round((errors / count) * 10000) / 10000 : 0,
+    rps: elapsedMs > 0 ? round(count / (elapsedMs / 1000)) : 0,
+    meanMs: count > 0 ? round(total / count) : 0,
+    p50Ms: round(percentile(sorted, 50)),
+    p95Ms: round(percentile(sorted, 95)),
+    p99Ms: round(percentile(sorted, 99)),
+    maxMs: round(count > 0 ? sorted[count - 1] : 0),
+  };
+};
+
+// One request; resolves to { status, body } and never rejects
+const send = (agent, baseUrl, { method = "GET", path, headers = {}, body }) =>
+  new Promise((resolve) => {
+    const payload = body === undefined ? null : Buffer.from(JSON.stringify(body));
+    const req = http.request(new URL(path, baseUrl), {
+      method,
+      agent,
+      headers: {
+        Accept: "application/json",
+        ...(payload ? { "Content-Type": "application/json", "Content-Length": payload.length } : {}),
+        ...headers,
+      },
+    }, (res) => {
+      const chunks = [];
+      res.on("data", (chunk) => chunks.push(chunk));
+      res.on("end", () => resolve({ status: res.statusCode, body: Buffer.concat(chunks) }));
+      res.on("error", (err) => resolve({ status: 0, error: err }));
+    });
+    req.on("error", (err) => resolve({ status: 0, error: err }));
+    if (payload) req.write(payload);
+    req.end();
+  });
+
+/**
+ * Run `next(vu, iteration)` in a loop from `concurrency` virtual users until
+ * `requests` have been sent or `durationMs` has elapsed. `next` returns a
+ * request description ({ label, method, path, headers, body, expect }) or an
+ * array of them, sent in order. A response is an error when its status is not
+ * in `expect` (default [200, 304]).
+ */
+const runLoad = async ({ baseUrl, concurrency = 10, requests = Infinity, durationMs = Infinity, warmup = 0, next }) => {
+  if (requests === Infinity && durationMs === Infinity) throw new Error("runLoad needs requests or durationMs");
+  const agent = new http.Agent({ keepAlive: true, maxSockets: concurrency });
+  const byLabel = new Map();
+  const all = { latencies: [], errors: 0 };
+  const failures = [];
+  let sent = 0;
+  let iteration = 0;
+
+  const record = (label, ms, failed) => {
+    if (!byLabel.has(label)) byLabel.set(label, { latencies: [], errors: 0 });
+    const bucket = byLabel.get(label);
+    bucket.latencies.push(ms);
+    all.latencies.push(ms);
+    if (failed) {
+      bucket.errors++;
+      all.errors++;
+    }
+  };
+
+  const execute = async (vu, measure) => {
+    const step = await next(vu, iteration++);
+    for (const request of [].concat(step)) {
+      const started = process.hrtime.bigint();
+      const res = await send(agent, baseUrl, request);
+      const ms = Number(process.hrtime.bigint() - started) / 1e6;
+      if (!measure) continue;
+      const failed = !(request.expect || [200, 304]).includes(res.status);
+      if (failed && failures.length < 5) {
+        failures.push(`${request.method || "GET"} ${request.path} -> ${res.status || res.error.message}`);
+      }
+      sent++;
+      record(request.label || "default", ms, failed);
+    }
+  };
+
+  try {
+    // Warm caches and connections; not measured
+    for (let i = 0; i < warmup; i++) await execute(0, false);
+
+    const started = Date.now();
+    const deadline = started + durationMs;
+    const users = Array.from({ length: concurrency }, async (_, vu) => {
+      while (sent < requests && Date.now() < deadline) await execute(vu, true);
+    });
+    await Promise.all(users);
+    const elapsed = Date.now() - started;
+
+    const labels = {};
+    byLabel.forEach((bucket, label) => {
+      labels[label] = summarize(bucket.latencies, bucket.errors, elapsed);
+    });
+    return { ...summarize(all.latencies, all.errors, elapsed), durationMs: elapsed, labels, failures };
+  } finally {
+    agent.destroy();
+  }
+};
+
+module.exports = { runLoad, send, summarize, percentile };
@@ -0,0 +1,153 @@
+// load-tests/bench/memoryRedis.js
+// In-process stand-in for the ioredis client, covering the commands the app
+// uses (strings with EX, counters, MULTI/pipeline, pub/sub). Lets the benchmark
+// run without a Redis server; set BENCH_REDIS_URL to measure against a real one.
+const { EventEmitter } = require("events");
+
+class MemoryStore {
+  constructor() {
+    this.values = new Map();
+    this.expiries = new Map();
+    this.subscribers = new Set();
+  }
+
+  read(key) {
+    const expiresAt = this.expiries.get(key);
+    if (expiresAt !== undefined && expiresAt <= Date.now()) {
+      this.values.delete(key);
+      this.expiries.delete(key);
+    }
+    return this.values.has(key) ? this.values.get(key) : null;
+  }
+
+  write(key, value, ttlSeconds) {
+    this.values.set(key, value);
+    if (ttlSeconds) this.expiries.set(key, Date.now() + ttlSeconds * 1000);
+    else this.expiries.delete(key);
+  }
+}
+
+const toBuffer = (value) => (Buffer.isBuffer(value) ? value : Buffer.from(String(value)));
+const toString = (value) => (Buffer.isBuffer(value) ? value.toString() : value);
+
+// Synchronous command implementations, shared by direct calls and MULTI
+const commands = {
+  get: (store, key) => {
+    const value = store.read(key);
+    return value === null ? null : toString(value);
+  },
+  getBuffer: (store, key) => {
+    const value = store.read(key);
+    return value === null ? null : toBuffer(value);
+  },
+  mget: (store, ...keys) => keys.flat().map((key) => commands.get(store, key)),
+  set: (store, key, value, ...args) => {
+    const exIndex = args.findIndex((arg) => String(arg).toUpperCase() === "EX");
+    const ttl = exIndex >= 0 ? Number(args[exIndex + 1]) : 0;
+    store.write(key, Buffer.isBuffer(value) ? value : String(value), ttl);
+    return "OK";
+  },
+  del: (store, ...keys) =>
+    keys.flat().reduce((count, key) => {
+      const existed = store.read(key) !== null;
+      store.values.delete(key);
+      store.expiries.delete(key);
+      return count + (existed ? 1 : 0);
+    }, 0),
+  incr: (store, key) => {
+    const current = parseInt(commands.get(store, key) || "0", 10);
+    if (Number.isNaN(current)) throw new Error("ERR value is not an integer or out of range");
+    const ttl = store.expiries.get(key);
+    store.values.set(key, String(current + 1));
+    if (ttl === undefined) store.expiries.delete(key);
+    return current + 1;
+  },
+  expire: (store, key, seconds) => {
+    if (store.read(key) === null) return 0;
+    store.expiries.set(key, Date.now() + Number(seconds) * 1000);
+    return 1;
+  },
+  ping: () => "PONG",
+  flushdb: (store) => {
+    store.values.clear();
+    store.expiries.clear();
+    return "OK";
+  },
+  publish: (store, channel, message) => {
+    let receivers = 0;
+    store.subscribers.forEach((subscriber) => {
+      if (!subscriber.channels.has(channel)) return;
+      receivers++;
+      setImmediate(() => subscriber.emit("message", channel, message));
+    });
+    return receivers;
+  },
+};
+
+class MemoryRedis extends EventEmitter {
+  constructor(store = new MemoryStore()) {
+    super();
+    this.store = store;
+    this.channels = new Set();
+    this.status = "ready";
+    setImmediate(() => {
+      this.emit("connect");
+      this.emit("ready");
+    });
+  }
+
+  duplicate() {
+    return new MemoryRedis(this.store);
+  }
+
+  // Queued commands; exec() resolves to [[err, result], ...] like ioredis
+  multi() {
+    const queue = [];
+    const chain = {
+      exec: async () =>
+        queue.map(([name, args]) => {
+          try {
+            return [null, commands[name](this.store, ...args)];
+          } catch (err) {
+            return [err, null];
+          }
+        }),
+    };
+    Object.keys(commands).forEach((name) => {
+      chain[name] = (...args) => {
+        queue.push([name, args]);
+        return chain;
+      };
+    });
+    return chain;
+  }
+
+  pipeline() {
+    return this.multi();
+  }
+
+  async subscribe(...channels) {
+    channels.forEach((channel) => this.channels.add(channel));
+    this.store.subscribers.add(this);
+    return this.channels.size;
+  }
+
+  async quit() {
+    this.store.subscribers.delete(this);
+    this.status = "end";
+    setImmediate(() => this.emit("close"));
+    return "OK";
+  }
+
+  disconnect() {
+    this.quit();
+  }
+}
+
+Object.keys(commands).forEach((name) => {
+  MemoryRedis.prototype[name] = async function command(...args) {
+    return commands[name](this.store, ...args);
+  };
+});
+
+module.exports = { MemoryRedis, MemoryStore };
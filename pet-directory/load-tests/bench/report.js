@@ -0,0 +1,76 @@
+// load-tests/bench/report.js
+// Threshold and baseline checks for benchmark results.
+//
+// Each scenario must stay under its absolute budgets (p95Ms, maxErrorRate).
+// When a baseline run with the same data set is given, it also must not regress
+// by more than maxP95RegressionPct (p95 latency) or maxRpsDropPct (throughput).
+// Baselines from a different data set, load or stack are reported but not enforced.
+
+const limitsFor = (thresholds, name) => ({
+  ...(thresholds.defaults || {}),
+  ...((thresholds.scenarios || {})[name] || {}),
+});
+
+const pctChange = (current, previous) =>
+  previous > 0 ? Math.round(((current - previous) / previous) * 10000) / 100 : 0;
+
+// Runs are comparable when they used the same data set and load on the same stack
+const comparable = (run, baseline) =>
+  Boolean(baseline) &&
+  JSON.stringify(baseline.dataset) === JSON.stringify(run.dataset) &&
+  JSON.stringify(baseline.settings) === JSON.stringify(run.settings) &&
+  baseline.dialect === run.dialect &&
+  baseline.redis === run.redis;
+
+const evaluateScenario = (name, result, limits, previous) => {
+  const checks = [];
+  const check = (metric, actual, limit, ok) => checks.push({ metric, actual, limit, passed: ok });
+
+  if (limits.p95Ms !== undefined) check("p95Ms", result.p95Ms, limits.p95Ms, result.p95Ms <= limits.p95Ms);
+  if (limits.maxErrorRate !== undefined) {
+    check("errorRate", result.errorRate, limits.maxErrorRate, result.errorRate <= limits.maxErrorRate);
+  }
+  if (result.requests === 0) check("requests", 0, 1, false);
+
+  if (previous) {
+    const p95Change = pctChange(result.p95Ms, previous.p95Ms);
+    const rpsChange = pctChange(result.rps, previous.rps);
+    if (limits.maxP95RegressionPct !== undefined) {
+      check("p95ChangePct", p95Change, limits.maxP95RegressionPct, p95Change <= limits.maxP95RegressionPct);
+    }
+    if (limits.maxRpsDropPct !== undefined) {
+      check("rpsChangePct", rpsChange, -limits.maxRpsDropPct, rpsChange >= -limits.maxRpsDropPct);
+    }
+  }
+
+  return { passed: checks.every((c) => c.passed), checks };
+};
+
+/**
+ * Attach `verdict` to every scenario of `run` and return whether all passed.
+ */
+const evaluate = (run, thresholds, baseline = null) => {
+  const enforceBaseline = comparable(run, baseline);
+  let passed = true;
+  Object.entries(run.scenarios).forEach(([name, result]) => {
+    const previous = enforceBaseline ? (baseline.scenarios || {})[name] : null;
+    result.verdict = evaluateScenario(name, result, limitsFor(thresholds, name), previous);
+    if (!result.verdict.passed) passed = false;
+  });
+  run.baseline = baseline
+    ? { file: baseline.file || null, commit: baseline.commit || null, enforced: enforceBaseline }
+    : null;
+  run.passed = passed;
+  return passed;
+};
+
+const formatRow = (name, result) => {
+  const failed = result.verdict ? result.verdict.checks.filter((c) => !c.passed) : [];
+  const status = failed.length === 0 ? "ok  " : "FAIL";
+  const detail = failed.map((c) => `${c.metric}=${c.actual} (limit ${c.limit})`).join(", ");
+  return `${status} ${name.padEnd(18)} ${String(result.rps).padStart(9)} rps  p50 ${String(result.p50Ms).padStart(7)}ms  ` +
+    `p95 ${String(result.p95Ms).padStart(7)}ms  p99 ${String(result.p99Ms).padStart(7)}ms  errors ${result.errors}` +
+    (detail ? `  ${detail}` : "");
+};
+
+module.exports = { evaluate, evaluateScenario, limitsFor, comparable, pctChange, formatRow };
@@ -0,0 +1,255 @@
+// load-tests/bench/run.js
+// In-repo benchmark suite: seeds a deterministic data set, starts the app in
+// this process and drives each scenario (see scenarios.js) over HTTP.
+//
+//   npm run bench                    all scenarios
+//   npm run bench -- list login      selected scenarios
+//
+// By default everything is local: the SQLite test database and an in-memory
+// Redis stand-in (memoryRedis.js). BENCH_DB=postgres uses the configured
+// Postgres database (migrated; seeded if it has no seed users yet) and
+// BENCH_REDIS_URL a real Redis, which is flushed first.
+//
+// Every run is written as JSON to reports/bench/<timestamp>-<commit>.json and
+// checked against thresholds.json and a baseline run: BENCH_BASELINE, else the
+// pinned load-tests/bench/baseline.json if one is committed, else the last
+// passing run (reports/bench/latest.json). Only passing runs replace
+// latest.json, so a regression can't become the next run's baseline;
+// BENCH_UPDATE_BASELINE=true also writes a passing run to the pinned file.
+// Exits with code 1 when a check fails.
+//
+// Tuning: BENCH_DURATION_MS (10000 per scenario), BENCH_CONCURRENCY (20),
+// BENCH_WARMUP (50 requests), BENCH_SEED (1); data set size via SEED_* (see
+// load-tests/bench/scaleSeed.js).
+const fs = require("fs");
+const os = require("os");
+const path = require("path");
+const Module = require("module");
+const { execSync } = require("child_process");
+
+const ROOT = path.join(__dirname, "..", "..");
+const REPORT_DIR = process.env.BENCH_REPORT_DIR || path.join(ROOT, "reports", "bench");
+const LATEST_FILE = path.join(REPORT_DIR, "latest.json");
+const PINNED_BASELINE = path.join(__dirname, "baseline.json");
+const UPDATE_BASELINE = process.env.BENCH_UPDATE_BASELINE === "true";
+const USE_POSTGRES = process.env.BENCH_DB === "postgres";
+const REDIS_URL = process.env.BENCH_REDIS_URL || null;
+
+// The local run needs the sqlite3 driver (a dev dependency)
+if (!USE_POSTGRES) {
+  try {
+    require.resolve("sqlite3");
+  } catch (_) {
+    console.error("❌ The local benchmark needs the sqlite3 dev dependency: run `npm install`, or set BENCH_DB=postgres");
+    process.exit(1);
+  }
+}
+
+// Environment for the app, before any of it is loaded
+if (!USE_POSTGRES) process.env.NODE_ENV = "test";
+if (REDIS_URL) process.env.REDIS_URL = REDIS_URL;
+process.env.LOG_SAMPLE_RATE = process.env.LOG_SAMPLE_RATE || "0";
+// The test environment hashes inline; benchmark the worker pool instead
+process.env.HASH_POOL_SIZE = process.env.HASH_POOL_SIZE || String(Math.max(1, os.cpus().length - 1));
+const SEED_DEFAULTS = { SEED_USERS: "1000", SEED_BUSINESSES: "2000", SEED_REVIEWS: "20000" };
+Object.entries(SEED_DEFAULTS).forEach(([name, value]) => {
+  if (!process.env[name]) process.env[name] = value;
+});
+
+// Without a Redis URL, config/redis resolves to the in-memory stand-in
+if (!REDIS_URL) {
+  const { MemoryRedis } = require("./memoryRedis");
+  const file = require.resolve("../../config/redis");
+  const stub = new Module(file);
+  stub.filename = file;
+  stub.loaded = true;
+  stub.exports = new MemoryRedis();
+  require.cache[file] = stub;
+}
+
+const { Op } = require("sequelize");
+const app = require("../../app");
+const { sequelize, User, Business, Service, Review } = require("../../models");
+const redisClient = require("../../config/redis");
+const { startInvalidationListener, stopInvalidationListener } = require("../../helpers/cacheHelpers");
+const { generateAccessToken } = require("../../helpers/authHelpers");
+const { hashPool } = require("../../helpers/hashPool");
+const { register } = require("../../helpers/metrics");
+const { SEED_PASSWORD, seed, seedOptions } = require("./scaleSeed");
+const { runLoad } = require("./loadGenerator");
+const { buildScenario, SCENARIO_NAMES } = require("./scenarios");
+const { evaluate, formatRow } = require("./report");
+const thresholds = require("./thresholds.json");
+
+const DURATION_MS = parseInt(process.env.BENCH_DURATION_MS || "10000", 10);
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY || "20", 10);
+const WARMUP = parseInt(process.env.BENCH_WARMUP || "50", 10);
+const BENCH_SEED = parseInt(process.env.BENCH_SEED || "1", 10);
+
+const gitCommit = () => {
+  try {
+    return execSync("git rev-parse --short HEAD", { cwd: ROOT, stdio: ["ignore", "pipe", "ignore"] }).toString().trim();
+  } catch (_) {
+    return "unknown";
+  }
+};
+
+const readJson = (file) => {
+  try {
+    return { ...JSON.parse(fs.readFileSync(file, "utf8")), file };
+  } catch (_) {
+    return null;
+  }
+};
+
+const cacheLookups = async () => {
+  const metric = register.getSingleMetric("cache_lookups_total");
+  const { values } = await metric.get();
+  return values.reduce((totals, { labels, value }) => {
+    totals[`${labels.namespace}:${labels.result}`] = value;
+    return totals;
+  }, {});
+};
+
+const diffCounts = (after, before) =>
+  Object.keys(after).reduce((diff, key) => {
+    const delta = after[key] - (before[key] || 0);
+    if (delta > 0) diff[key] = delta;
+    return diff;
+  }, {});
+
+const SEED_USER_WHERE = { email: { [Op.like]: "seed%@petdirectory.com" } };
+
+const prepareDatabase = async () => {
+  const options = seedOptions();
+  const started = Date.now();
+  if (!USE_POSTGRES) {
+    await sequelize.sync({ force: true });
+    await seed(sequelize.getQueryInterface(), options);
+  } else if ((await User.count({ where: SEED_USER_WHERE })) === 0) {
+    await seed(sequelize.getQueryInterface(), options);
+  }
+  const counts = {
+    users: await User.count(),
+    businesses: await Business.count(),
+    services: await Service.count(),
+    reviews: await Review.count(),
+  };
+  console.log(`🌱 Data set ready in ${Date.now() - started}ms: ${JSON.stringify(counts)}`);
+  return { options, counts };
+};
+
+// Ids, users and search terms the scenarios draw from
+const buildContext = async () => {
+  const [businesses, users] = await Promise.all([
+    Business.findAll({ attributes: ["id", "name"], order: [["id", "ASC"]], limit: 5000 }),
+    User.findAll({ attributes: ["id", "email", "role"], where: SEED_USER_WHERE, order: [["id", "ASC"]], limit: 500 }),
+  ]);
+  if (businesses.length === 0 || users.length === 0) throw new Error("No seeded businesses or users to benchmark");
+
+  const words = new Set();
+  businesses.slice(0, 200).forEach(({ name }) => name.split(/\s+/).forEach((word) => words.add(word.toLowerCase())));
+  const tokens = new Map();
+  return {
+    businessIds: businesses.map((b) => b.id),
+    users: users.map((u) => u.get({ plain: true })),
+    password: SEED_PASSWORD,
+    // Whole words, prefixes and a misspelling per word (typo tolerance)
+    searchTerms: [...words].flatMap((word) => [word, word.slice(0, 4), word.slice(0, -2) + word.slice(-1)]),
+    tokenFor: (user) => {
+      if (!tokens.has(user.id)) tokens.set(user.id, generateAccessToken(user));
+      return tokens.get(user.id);
+    },
+  };
+};
+
+// Explicit file, then the pinned baseline, then the last passing run
+const loadBaseline = () => {
+  if (process.env.BENCH_BASELINE) return readJson(process.env.BENCH_BASELINE);
+  return readJson(PINNED_BASELINE) || readJson(LATEST_FILE);
+};
+
+const writeReport = (run) => {
+  fs.mkdirSync(REPORT_DIR, { recursive: true });
+  const stamp = run.createdAt.replace(/[:.]/g, "-");
+  const file = path.join(REPORT_DIR, `${stamp}-${run.commit}.json`);
+  const json = JSON.stringify(run, null, 2);
+  fs.writeFileSync(file, json);
+  // A failing run must not become the next baseline
+  if (run.passed) {
+    fs.writeFileSync(LATEST_FILE, json);
+    if (UPDATE_BASELINE) fs.writeFileSync(PINNED_BASELINE, json);
+  }
+  return file;
+};
+
+const main = async () => {
+  const selected = process.argv.slice(2);
+  const names = selected.length > 0 ? selected : SCENARIO_NAMES;
+  const baseline = loadBaseline();
+
+  if (REDIS_URL) await redisClient.flushdb();
+  const dataset = await prepareDatabase();
+  await startInvalidationListener();
+  const ctx = await buildContext();
+
+  const server = await new Promise((resolve) => {
+    const listening = app.listen(0, "127.0.0.1", () => resolve(listening));
+  });
+  const baseUrl = `http://127.0.0.1:${server.address().port}`;
+
+  const run = {
+    createdAt: new Date().toISOString(),
+    commit: gitCommit(),
+    node: process.version,
+    cpus: os.cpus().length,
+    dialect: sequelize.getDialect(),
+    redis: REDIS_URL ? "redis" : "memory",
+    dataset: { ...dataset.options, counts: dataset.counts },
+    settings: { durationMs: DURATION_MS, concurrency: CONCURRENCY, warmup: WARMUP, seed: BENCH_SEED },
+    scenarios: {},
+  };
+
+  try {
+    for (const [i, name] of names.entries()) {
+      const next = buildScenario(name, ctx, BENCH_SEED + i);
+      const before = await cacheLookups();
+      const result = await runLoad({ baseUrl, concurrency: CONCURRENCY, durationMs: DURATION_MS, warmup: WARMUP, next });
+      result.cacheLookups = diffCounts(await cacheLookups(), before);
+      run.scenarios[name] = result;
+      console.log(`▶️  ${name}: ${result.requests} requests, ${result.rps} rps, p95 ${result.p95Ms}ms`);
+      result.failures.forEach((failure) => console.warn(`   ⚠️  ${failure}`));
+    }
+  } finally {
+    await new Promise((resolve) => server.close(resolve));
+  }
+
+  const passed = evaluate(run, thresholds, baseline);
+  const file = writeReport(run);
+
+  console.log("");
+  Object.entries(run.scenarios).forEach(([name, result]) => console.log(formatRow(name, result)));
+  if (run.baseline) {
+    console.log(`\nBaseline ${run.baseline.commit} from ${path.relative(ROOT, run.baseline.file)} (${run.baseline.enforced ? "compared" : "different data set or settings, not compared"})`);
+  }
+  console.log(`\n📄 ${path.relative(ROOT, file)}`);
+  if (passed && UPDATE_BASELINE) console.log(`📌 Pinned as ${path.relative(ROOT, PINNED_BASELINE)}`);
+  console.log(passed ? "✅ All benchmark checks passed" : "❌ Benchmark checks failed");
+  return passed;
+};
+
+main()
+  .then((passed) => {
+    process.exitCode = passed ? 0 : 1;
+  })
+  .catch((err) => {
+    console.error("❌ Benchmark failed:", err.message);
+    process.exitCode = 1;
+  })
+  .finally(async () => {
+    await hashPool.close();
+    await stopInvalidationListener();
+    await sequelize.close();
+    if (REDIS_URL) await redisClient.quit();
+    process.exit();
+  });
@@ -0,0 +1,317 @@
+// load-tests/bench/scaleSeed.js
+const bcrypt = require('bcrypt');
+const { QueryTypes } = require('sequelize');
+const { encodeGeohash } = require('../../helpers/geohash');
+const { columnResolver, rowMapper } = require('../../helpers/schemaHelpers');
+
+// Deterministic, batched data set for performance work, loaded by
+// `npm run db:seed:scale` (scripts/seed-scale.js) and the benchmark suite.
+// It is deliberately not a sequelize-cli seeder, so `npm run db:seed` only
+// loads the small demo data.
+//
+// Sizes come from the environment, so the same file seeds a laptop or a
+// multi-million-row benchmark database:
+//   SEED_USERS (1000)  SEED_BUSINESSES (1000)  SEED_SERVICES_PER_BUSINESS (3)
+//   SEED_REVIEWS (~10000 in total)  SEED (42)  SEED_BATCH_SIZE (5000)
+//
+// The same SEED and sizes always produce the same rows. Values come from a
+// seeded PRNG and fixed word lists instead of faker, whose output changes
+// between versions. Timestamps are offsets from a fixed epoch. Ids are
+// assigned after the current maximum, so rows can reference each other
+// without reading anything back.
+//
+// Each business draws its reviews from its own PRNG stream. Its rating
+// aggregates are therefore computed before it is inserted, with no rebuild
+// afterwards. Seeded users log in as seed<id>@petdirectory.com / Password123!.
+
+const SEED_PASSWORD = 'Password123!';
+const SEED_EPOCH = Date.UTC(2025, 0, 1);
+const EMAIL_DOMAIN = 'petdirectory.com';
+const TYPES = ['Vet', 'Groomer', 'Pet Sitter', 'Dog Park'];
+const RATING_WEIGHTS = [5, 7, 15, 33, 40]; // % of 1..5 star reviews
+
+const FIRST_NAMES = ['Ava', 'Liam', 'Maya', 'Noah', 'Zoe', 'Ethan', 'Lena', 'Omar', 'Ines', 'Kai', 'Rosa', 'Theo', 'Nia', 'Felix', 'Sara', 'Hugo'];
+const LAST_NAMES = ['Garcia', 'Smith', 'Nguyen', 'Khan', 'Rossi', 'Muller', 'Silva', 'Cohen', 'Okafor', 'Tanaka', 'Novak', 'Larsen', 'Dubois', 'Patel'];
+const ADJECTIVES = ['Happy', 'Furry', 'Golden', 'Loyal', 'Sunny', 'Gentle', 'Playful', 'Cozy', 'Brave', 'Lucky', 'Urban', 'Green'];
+const NOUNS = ['Paws', 'Tails', 'Whiskers', 'Bark', 'Meadow', 'Hound', 'Kitty', 'Pup', 'Corner', 'Haven', 'Friends', 'Trail'];
+const TYPE_SUFFIXES = {
+  Vet: ['Veterinary Clinic', 'Animal Hospital', 'Vet Care'],
+  Groomer: ['Grooming', 'Spa', 'Salon'],
+  'Pet Sitter': ['Pet Sitting', 'Pet Care', 'Sitters'],
+  'Dog Park': ['Dog Park', 'Off-Leash Area', 'Play Yard'],
+};
+const SERVICE_NAMES = {
+  Vet: ['Checkup', 'Vaccination', 'Dental Cleaning', 'Microchipping', 'Surgery Consult'],
+  Groomer: ['Bath & Brush', 'Full Groom', 'Nail Trim', 'De-shedding', 'Puppy Cut'],
+  'Pet Sitter': ['Drop-in Visit', 'Overnight Stay', 'Dog Walk', 'Cat Care', 'Weekend Care'],
+  'Dog Park': ['Day Pass', 'Monthly Membership', 'Agility Session', 'Group Play', 'Training Class'],
+};
+const STREETS = ['Oak', 'Maple', 'Cedar', 'Pine', 'Elm', 'Lake', 'Hill', 'Park', 'River', 'Mill'];
+const STREET_TYPES = ['St', 'Ave', 'Rd', 'Blvd', 'Ln'];
+const CITIES = [
+  ['San Francisco', 37.7749, -122.4194], ['New York', 40.7128, -74.006], ['Austin', 30.2672, -97.7431],
+  ['Chicago', 41.8781, -87.6298], ['Seattle', 47.6062, -122.3321], ['Denver', 39.7392, -104.9903],
+  ['Boston', 42.3601, -71.0589], ['Miami', 25.7617, -80.1918], ['Portland', 45.5152, -122.6784],
+  ['Atlanta', 33.749, -84.388],
+];
+const REVIEW_OPENERS = ['Great', 'Friendly', 'Professional', 'Okay', 'Disappointing', 'Excellent', 'Quick', 'Careful'];
+const REVIEW_SUBJECTS = ['staff', 'service', 'visit', 'experience', 'team', 'care'];
+const REVIEW_CLOSERS = ['would come back.', 'my dog loved it.', 'a bit pricey.', 'highly recommended.', 'long wait though.', 'very clean place.'];
+
+// mulberry32: small, fast, good enough for test data
+const createRandom = (seed) => {
+  let state = seed >>> 0;
+  const next = () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+  next.int = (min, max) => min + Math.floor(next() * (max - min + 1));
+  next.pick = (list) => list[Math.floor(next() * list.length)];
+  return next;
+};
+
+// Independent stream per entity, so one business's data never depends on another's
+const streamSeed = (seed, stream, index) =>
+  (Math.imul(seed ^ 0x9e3779b9, 31) ^ Math.imul(stream + 1, 0x85ebca6b) ^ Math.imul(index + 1, 0xc2b2ae35)) >>> 0;
+
+const pickRating = (random) => {
+  let roll = random() * 100;
+  for (let stars = 1; stars <= 5; stars++) {
+    roll -= RATING_WEIGHTS[stars - 1];
+    if (roll < 0) return stars;
+  }
+  return 5;
+};
+
+const readInt = (env, name, fallback) => {
+  const value = parseInt(env[name] || String(fallback), 10);
+  return Number.isNaN(value) || value < 0 ? fallback : value;
+};
+
+const seedOptions = (env = process.env) => ({
+  seed: readInt(env, 'SEED', 42),
+  users: Math.max(1, readInt(env, 'SEED_USERS', 1000)),
+  businesses: readInt(env, 'SEED_BUSINESSES', 1000),
+  servicesPerBusiness: readInt(env, 'SEED_SERVICES_PER_BUSINESS', 3),
+  reviews: readInt(env, 'SEED_REVIEWS', 10000),
+  batchSize: Math.max(1, readInt(env, 'SEED_BATCH_SIZE', 5000)),
+  bcryptRounds: readInt(env, 'SEED_BCRYPT_ROUNDS', 10),
+});
+
+const seedEmail = (userId) => `seed${userId}@${EMAIL_DOMAIN}`;
+
+// Row generators. `index` is 1-based within the seeded set; ids are base + index.
+
+const userRow = ({ seed }, index, base, passwordHash) => {
+  const random = createRandom(streamSeed(seed, 0, index));
+  const at = new Date(SEED_EPOCH + index * 1000);
+  return {
+    id: base.users + index,
+    name: `${random.pick(FIRST_NAMES)} ${random.pick(LAST_NAMES)}`,
+    email: seedEmail(base.users + index),
+    password: passwordHash,
+    role: 'user',
+    createdAt: at,
+    updatedAt: at,
+  };
+};
+
+// The reviews of one business, replayable from its own stream
+const businessReviews = (options, index, base, createdAt) => {
+  const { seed, users, businesses, reviews, servicesPerBusiness } = options;
+  const random = createRandom(streamSeed(seed, 3, index));
+  const mean = businesses > 0 ? reviews / businesses : 0;
+  // Exponentially distributed counts: most businesses have a few reviews, some have many
+  const count = mean > 0 ? Math.floor(-mean * Math.log(1 - random())) : 0;
+
+  const result = [];
+  for (let i = 0; i < count; i++) {
+    const rating = pickRating(random);
+    const service = random.int(0, servicesPerBusiness); // servicesPerBusiness = no service
+    const at = new Date(createdAt.getTime() + random.int(1, 180 * 86400) * 1000);
+    result.push({
+      rating,
+      comment: `${random.pick(REVIEW_OPENERS)} ${random.pick(REVIEW_SUBJECTS)}, ${random.pick(REVIEW_CLOSERS)}`,
+      userId: base.users + random.int(1, users),
+      businessId: base.businesses + index,
+      serviceId: service < servicesPerBusiness ? base.services + (index - 1) * servicesPerBusiness + service + 1 : null,
+      createdAt: at,
+      updatedAt: at,
+    });
+  }
+  return result;
+};
+
+const businessRow = (options, index, base) => {
+  const { seed, users } = options;
+  const random = createRandom(streamSeed(seed, 1, index));
+  const type = random.pick(TYPES);
+  const [city, cityLat, cityLng] = random.pick(CITIES);
+  // Within ~20km of the city centre, so nearby searches find neighbours
+  const latitude = Number((cityLat + (random() - 0.5) * 0.36).toFixed(6));
+  const longitude = Number((cityLng + (random() - 0.5) * 0.46).toFixed(6));
+  const createdAt = new Date(SEED_EPOCH + index * 1000);
+
+  const histogram = [0, 0, 0, 0, 0];
+  let ratingSum = 0;
+  const ratings = businessReviews(options, index, base, createdAt).map((review) => review.rating);
+  ratings.forEach((stars) => {
+    histogram[stars - 1]++;
+    ratingSum += stars;
+  });
+
+  return {
+    id: base.businesses + index,
+    name: `${random.pick(ADJECTIVES)} ${random.pick(NOUNS)} ${random.pick(TYPE_SUFFIXES[type])}`,
+    type,
+    address: `${random.int(1, 9999)} ${random.pick(STREETS)} ${random.pick(STREET_TYPES)}, ${city}`,
+    latitude,
+    longitude,
+    geohash: encodeGeohash(latitude, longitude),
+    contactInfo: `555-${String(random.int(0, 9999)).padStart(4, '0')}`,
+    description: `${type} in ${city}. ${random.pick(ADJECTIVES)} ${random.pick(REVIEW_SUBJECTS)} for your pets.`,
+    userId: base.users + 1 + ((index - 1) % users),
+    ratingCount: ratings.length,
+    ratingSum,
+    ratingAverage: ratings.length > 0 ? ratingSum / ratings.length : 0,
+    rating1: histogram[0],
+    rating2: histogram[1],
+    rating3: histogram[2],
+    rating4: histogram[3],
+    rating5: histogram[4],
+    createdAt,
+    updatedAt: createdAt,
+  };
+};
+
+const serviceRows = ({ seed, servicesPerBusiness }, index, base, type) => {
+  const random = createRandom(streamSeed(seed, 2, index));
+  const at = new Date(SEED_EPOCH + index * 1000);
+  const rows = [];
+  for (let j = 0; j < servicesPerBusiness; j++) {
+    rows.push({
+      id: base.services + (index - 1) * servicesPerBusiness + j + 1,
+      name: SERVICE_NAMES[type][j % SERVICE_NAMES[type].length],
+      price: random.int(20, 200),
+      duration: random.int(2, 8) * 15,
+      businessId: base.businesses + index,
+      createdAt: at,
+      updatedAt: at,
+    });
+  }
+  return rows;
+};
+
+// Buffered bulk inserts, `batchSize` rows per statement
+const batchWriter = async (queryInterface, table, batchSize) => {
+  const map = await rowMapper(queryInterface, table);
+  let rows = [];
+  let total = 0;
+  const flush = async () => {
+    if (rows.length === 0) return;
+    const batch = rows;
+    rows = [];
+    await queryInterface.bulkInsert(table, batch, { logging: false });
+  };
+  return {
+    async add(row) {
+      rows.push(map(row));
+      total++;
+      if (rows.length >= batchSize) await flush();
+    },
+    async close() {
+      await flush();
+      return total;
+    },
+  };
+};
+
+const maxId = async (queryInterface, table) => {
+  const quoted = queryInterface.queryGenerator.quoteTable(table);
+  const [row] = await queryInterface.sequelize.query(
+    `SELECT COALESCE(MAX(id), 0) AS max FROM ${quoted}`,
+    { type: QueryTypes.SELECT, logging: false }
+  );
+  return Number(row.max);
+};
+
+// Explicit ids bypass Postgres sequences; move them past the seeded rows
+const resetSequences = async (queryInterface, tables) => {
+  if (queryInterface.sequelize.getDialect() !== 'postgres') return;
+  for (const table of tables) {
+    const quoted = queryInterface.queryGenerator.quoteTable(table);
+    await queryInterface.sequelize.query(
+      `SELECT setval(pg_get_serial_sequence('${quoted}', 'id'), GREATEST((SELECT MAX(id) FROM ${quoted}), 1))`,
+      { logging: false }
+    );
+  }
+};
+
+/**
+ * Insert the seeded data set. Resolves to the number of rows per table.
+ */
+const seed = async (queryInterface, options = seedOptions()) => {
+  const base = {
+    users: await maxId(queryInterface, 'users'),
+    businesses: await maxId(queryInterface, 'businesses'),
+    services: await maxId(queryInterface, 'services'),
+  };
+  const passwordHash = await bcrypt.hash(SEED_PASSWORD, options.bcryptRounds);
+
+  const users = await batchWriter(queryInterface, 'users', options.batchSize);
+  for (let i = 1; i <= options.users; i++) await users.add(userRow(options, i, base, passwordHash));
+
+  const businesses = await batchWriter(queryInterface, 'businesses', options.batchSize);
+  const services = await batchWriter(queryInterface, 'services', options.batchSize);
+  const types = [];
+  for (let i = 1; i <= options.businesses; i++) {
+    const business = businessRow(options, i, base);
+    types.push(business.type);
+    await businesses.add(business);
+  }
+  const counts = { users: await users.close(), businesses: await businesses.close() };
+
+  for (let i = 1; i <= options.businesses; i++) {
+    for (const service of serviceRows(options, i, base, types[i - 1])) await services.add(service);
+  }
+  counts.services = await services.close();
+
+  const reviews = await batchWriter(queryInterface, 'reviews', options.batchSize);
+  for (let i = 1; i <= options.businesses; i++) {
+    const createdAt = new Date(SEED_EPOCH + i * 1000);
+    for (const review of businessReviews(options, i, base, createdAt)) await reviews.add(review);
+  }
+  counts.reviews = await reviews.close();
+
+  await resetSequences(queryInterface, ['users', 'businesses', 'services', 'reviews']);
+  return counts;
+};
+
+/**
+ * Delete the seeded rows (matched by their seed e-mail addresses).
+ */
+const unseed = async (queryInterface) => {
+  const column = async (table, attribute) =>
+    queryInterface.quoteIdentifier((await columnResolver(queryInterface, table))(attribute));
+  const seedUsers = `SELECT id FROM users WHERE email LIKE 'seed%@${EMAIL_DOMAIN}'`;
+  const seedBusinesses = `SELECT id FROM businesses WHERE ${await column('businesses', 'userId')} IN (${seedUsers})`;
+
+  await queryInterface.sequelize.query(
+    `DELETE FROM reviews WHERE ${await column('reviews', 'userId')} IN (${seedUsers})
+        OR ${await column('reviews', 'businessId')} IN (${seedBusinesses})`
+  );
+  await queryInterface.sequelize.query(`DELETE FROM services WHERE ${await column('services', 'businessId')} IN (${seedBusinesses})`);
+  await queryInterface.sequelize.query(`DELETE FROM businesses WHERE id IN (${seedBusinesses})`);
+  await queryInterface.sequelize.query(`DELETE FROM users WHERE email LIKE 'seed%@${EMAIL_DOMAIN}'`);
+};
+
+module.exports = {
+  SEED_PASSWORD,
+  createRandom,
+  seed,
+  seedOptions,
+  unseed,
+};
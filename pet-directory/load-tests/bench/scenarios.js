@@ -0,0 +1,76 @@
+// load-tests/bench/scenarios.js
+// Benchmark scenarios. Each one builds a request generator for runLoad() from
+// the seeded data set (`ctx`), using its own seeded PRNG so that two runs send
+// the same request sequence.
+//
+// ctx: { businessIds, users: [{ id, email }], password, searchTerms, tokenFor(user) }
+const { createRandom } = require("./scaleSeed");
+
+const TYPES = ["Vet", "Groomer", "Pet Sitter", "Dog Park"];
+const API = "/api/v1";
+
+const scenarios = {
+  // Business listing: first pages, type filters and the rating sort
+  list: (ctx, random) => () => {
+    const roll = random();
+    if (roll < 0.4) return { label: "list:newest", path: `${API}/businesses?page=${random.int(1, 5)}&limit=20` };
+    if (roll < 0.7) {
+      return { label: "list:type", path: `${API}/businesses?type=${encodeURIComponent(random.pick(TYPES))}&limit=20` };
+    }
+    return { label: "list:rating", path: `${API}/businesses?sort=rating&page=${random.int(1, 3)}&limit=20` };
+  },
+
+  // Name search, with and without a type filter
+  search: (ctx, random) => () => {
+    const term = encodeURIComponent(random.pick(ctx.searchTerms));
+    if (random() < 0.7) return { label: "search", path: `${API}/businesses?search=${term}&limit=20` };
+    return {
+      label: "search:type",
+      path: `${API}/businesses?search=${term}&type=${encodeURIComponent(random.pick(TYPES))}&limit=20`,
+    };
+  },
+
+  // Review pages and service lists of random businesses
+  reviews: (ctx, random) => () => {
+    const businessId = random.pick(ctx.businessIds);
+    if (random() < 0.75) return { label: "reviews", path: `${API}/reviews/${businessId}?limit=20` };
+    return { label: "services", path: `${API}/services/${businessId}` };
+  },
+
+  // Password logins: exercises bcrypt (hash pool) and the login rate limit
+  login: (ctx, random) => () => {
+    const user = random.pick(ctx.users);
+    return {
+      label: "login",
+      method: "POST",
+      path: `${API}/auth/login`,
+      body: { email: user.email, password: ctx.password },
+    };
+  },
+
+  // A review write followed by the reads it invalidates
+  "write-invalidate": (ctx, random) => () => {
+    const user = random.pick(ctx.users);
+    const businessId = random.pick(ctx.businessIds);
+    return [
+      {
+        label: "write:review",
+        method: "POST",
+        path: `${API}/reviews`,
+        headers: { Authorization: `Bearer ${ctx.tokenFor(user)}` },
+        body: { rating: random.int(1, 5), comment: "Benchmark review", userId: user.id, businessId },
+        expect: [201],
+      },
+      // Review writes bump the rating listing's tag and the business's review tag
+      { label: "read:list", path: `${API}/businesses?sort=rating&limit=20` },
+      { label: "read:reviews", path: `${API}/reviews/${businessId}?limit=20` },
+    ];
+  },
+};
+
+const buildScenario = (name, ctx, seed) => {
+  if (!scenarios[name]) throw new Error(`Unknown scenario "${name}" (available: ${Object.keys(scenarios).join(", ")})`);
+  return scenarios[name](ctx, createRandom(seed));
+};
+
+module.exports = { scenarios, buildScenario, SCENARIO_NAMES: Object.keys(scenarios) };
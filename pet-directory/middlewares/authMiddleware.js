@@ -1,6 +1,24 @@
 // middlewares/authMiddleware.js
-const { jwtSecret } = require('../config/db'); // <-- import secret
-const jwt = require('jsonwebtoken');
+const { verifyAccessToken } = require('../helpers/authHelpers'); // verifies with JWT_SECRET from config/jwt
+const LRUCache = require('../helpers/lruCache');
+
+// Recently verified access tokens, so repeat requests skip the HMAC check.
+// Entries never outlive the token's own `exp`.
+const TOKEN_CACHE_MAX = parseInt(process.env.AUTH_TOKEN_CACHE_MAX || '10000', 10);
+const TOKEN_CACHE_TTL = parseInt(process.env.AUTH_TOKEN_CACHE_TTL_MS || '60000', 10);
+const verifiedTokens = new LRUCache({ max: TOKEN_CACHE_MAX, ttl: TOKEN_CACHE_TTL });
+
+// The cached payload is shared between requests, so it is frozen and every
+// request gets its own copy to put on req.user
+const verifyCached = (token) => {
+  const cached = verifiedTokens.get(token);
+  if (cached) return { ...cached };
+
+  const decoded = Object.freeze(verifyAccessToken(token));
+  const ttl = decoded.exp ? Math.min(TOKEN_CACHE_TTL, decoded.exp * 1000 - Date.now()) : TOKEN_CACHE_TTL;
+  if (ttl > 0) verifiedTokens.set(token, decoded, ttl);
+  return { ...decoded };
+};
 
 // Middleware to authenticate JWT tokens
 exports.authenticate = (req, res, next) => {
@@ -11,9 +29,7 @@ exports.authenticate = (req, res, next) => {
     const parts = authHeader.split(' ');
     if (parts.length !== 2 || parts[0] !== 'Bearer') return res.status(401).json({ error: 'Invalid authorization header format' });
 
-    const token = parts[1];
-    const decoded = jwt.verify(token, jwtSecret); // <-- use Docker secret
-    req.user = decoded;
+    req.user = verifyCached(parts[1]);
     next();
   } catch (err) {
     return res.status(401).json({ error: 'Invalid or expired token' });
@@ -27,3 +43,5 @@ exports.isAdmin = (req, res, next) => {
   }
   next();
 };
+
+exports.verifiedTokens = verifiedTokens;
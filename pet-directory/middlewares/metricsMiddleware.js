@@ -0,0 +1,30 @@
+// middlewares/metricsMiddleware.js
+const { httpRequestDuration } = require('../helpers/metrics');
+const { log, sampled } = require('../helpers/logger');
+
+const SLOW_REQUEST_MS = parseInt(process.env.SLOW_REQUEST_MS || '300', 10);
+
+// Templated path (e.g. /api/v1/businesses/:id) so the label set stays bounded
+const routeOf = (req) => {
+  if (!req.route) return 'unmatched';
+  const path = req.route.path === '/' ? '' : req.route.path;
+  return `${req.baseUrl}${path}` || '/';
+};
+
+// Records request latency; logs slow requests and a sample of the rest
+module.exports = (req, res, next) => {
+  const start = process.hrtime.bigint();
+
+  res.on('finish', () => {
+    const durationMs = Number(process.hrtime.bigint() - start) / 1e6;
+    const route = routeOf(req);
+    httpRequestDuration.observe({ method: req.method, route, status_code: res.statusCode }, durationMs / 1000);
+
+    const slow = durationMs > SLOW_REQUEST_MS;
+    if (slow || sampled()) {
+      log(`${slow ? '⚠️ SLOW REQUEST: ' : ''}[${new Date().toISOString()}] ${req.method} ${req.originalUrl} ${res.statusCode} - ${durationMs.toFixed(2)}ms`);
+    }
+  });
+
+  next();
+};
@@ -0,0 +1,35 @@
+'use strict';
+
+const { fieldName } = require('../helpers/schemaHelpers');
+
+// The models are `underscored` (config/db.js), but the create-table migrations
+// above used camelCase columns, so a schema built from migrations alone didn't
+// match the queries the models issue. Rename those columns to the models'
+// field names. Tables created by sync() already use them and are skipped.
+const CAMEL_CASE_COLUMNS = {
+  users: ['createdAt', 'updatedAt'],
+  businesses: ['contactInfo', 'userId', 'createdAt', 'updatedAt'],
+  pets: ['userId', 'createdAt', 'updatedAt'],
+  services: ['businessId', 'createdAt', 'updatedAt'],
+  reviews: ['userId', 'businessId', 'serviceId', 'createdAt', 'updatedAt'],
+};
+
+const renameColumns = async (queryInterface, rename) => {
+  for (const [table, attributes] of Object.entries(CAMEL_CASE_COLUMNS)) {
+    const columns = await queryInterface.describeTable(table);
+    for (const attribute of attributes) {
+      const [from, to] = rename(attribute);
+      if (columns[from] && !columns[to]) await queryInterface.renameColumn(table, from, to);
+    }
+  }
+};
+
+module.exports = {
+  async up(queryInterface) {
+    await renameColumns(queryInterface, (attribute) => [attribute, fieldName(attribute)]);
+  },
+
+  async down(queryInterface) {
+    await renameColumns(queryInterface, (attribute) => [fieldName(attribute), attribute]);
+  },
+};
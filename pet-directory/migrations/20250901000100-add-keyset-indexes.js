@@ -0,0 +1,27 @@
+'use strict';
+
+const { addIndexIfMissing } = require('../helpers/schemaHelpers');
+
+// Composite indexes backing keyset pagination: ORDER BY createdAt DESC, id DESC
+// (optionally scoped by businessId) is served by a backward index scan.
+// Attribute names are resolved against each table, so the indexes cover the
+// columns the models actually query (created_at, business_id).
+const INDEXES = [
+  ['businesses', ['createdAt', 'id'], 'businesses_created_at_id'],
+  ['reviews', ['businessId', 'createdAt', 'id'], 'reviews_business_id_created_at_id'],
+  ['services', ['businessId', 'createdAt', 'id'], 'services_business_id_created_at_id'],
+];
+
+module.exports = {
+  async up(queryInterface) {
+    for (const [table, attributes, name] of INDEXES) {
+      await addIndexIfMissing(queryInterface, table, attributes, { name });
+    }
+  },
+
+  async down(queryInterface) {
+    for (const [table, , name] of [...INDEXES].reverse()) {
+      await queryInterface.removeIndex(table, name);
+    }
+  },
+};
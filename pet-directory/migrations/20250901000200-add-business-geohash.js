@@ -0,0 +1,50 @@
+'use strict';
+
+const { encodeGeohash } = require('../helpers/geohash');
+const { addMissingColumns, addIndexIfMissing } = require('../helpers/schemaHelpers');
+
+const BACKFILL_BATCH_SIZE = 1000;
+
+// Geohash column backing /businesses/nearby; prefix range scans on the
+// B-tree index select the businesses inside a geohash cell.
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    await addMissingColumns(queryInterface, 'businesses', { geohash: { type: Sequelize.STRING(12) } });
+    await addIndexIfMissing(queryInterface, 'businesses', ['geohash'], { name: 'businesses_geohash' });
+
+    // Backfill existing rows in id-range batches, one UPDATE per batch, so a
+    // large table is never held in memory or locked in one long transaction
+    const [{ minId, maxId }] = await queryInterface.sequelize.query(
+      'SELECT MIN(id) AS "minId", MAX(id) AS "maxId" FROM businesses',
+      { type: Sequelize.QueryTypes.SELECT }
+    );
+    if (minId === null || minId === undefined) return;
+
+    for (let start = Number(minId); start <= Number(maxId); start += BACKFILL_BATCH_SIZE) {
+      const businesses = await queryInterface.sequelize.query(
+        `SELECT id, latitude, longitude FROM businesses
+         WHERE id BETWEEN :start AND :end AND latitude IS NOT NULL AND longitude IS NOT NULL`,
+        { type: Sequelize.QueryTypes.SELECT, replacements: { start, end: start + BACKFILL_BATCH_SIZE - 1 } }
+      );
+      if (businesses.length === 0) continue;
+
+      // Geohashes are computed here, so the batch is applied as a CASE on id
+      const replacements = {};
+      const cases = businesses.map(({ id, latitude, longitude }, i) => {
+        replacements[`id${i}`] = id;
+        replacements[`geohash${i}`] = encodeGeohash(parseFloat(latitude), parseFloat(longitude));
+        return `WHEN :id${i} THEN :geohash${i}`;
+      });
+      replacements.ids = businesses.map(({ id }) => id);
+      await queryInterface.sequelize.query(
+        `UPDATE businesses SET geohash = CASE id ${cases.join(' ')} END WHERE id IN (:ids)`,
+        { replacements }
+      );
+    }
+  },
+
+  async down(queryInterface) {
+    await queryInterface.removeIndex('businesses', 'businesses_geohash');
+    await queryInterface.removeColumn('businesses', 'geohash');
+  },
+};
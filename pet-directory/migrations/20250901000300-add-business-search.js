@@ -0,0 +1,48 @@
+'use strict';
+const { TYPE_KEYWORDS } = require('../helpers/searchIndex');
+
+// Full-text search for businesses (Postgres only; other dialects fall back to
+// the in-process index in helpers/searchIndex.js):
+//   - search_vector: weighted tsvector over name, type, description, address,
+//     maintained by Postgres as a generated column and GIN indexed
+//   - a trigram index on name for typo-tolerant matching (pg_trgm)
+
+// Type synonyms, shared with the in-process index
+const typeKeywords = Object.entries(TYPE_KEYWORDS)
+  .map(([type, words]) => `WHEN '${type}' THEN '${words}'`)
+  .join('\n          ');
+
+module.exports = {
+  async up(queryInterface) {
+    if (queryInterface.sequelize.getDialect() !== 'postgres') return;
+
+    await queryInterface.sequelize.query('CREATE EXTENSION IF NOT EXISTS pg_trgm');
+    // Enum-to-text casts are not immutable, so the type is spelled out with CASE
+    await queryInterface.sequelize.query(`
+      ALTER TABLE businesses ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', CASE type
+          ${typeKeywords}
+          ELSE '' END), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(address, '')), 'D')
+      ) STORED
+    `);
+    await queryInterface.sequelize.query(
+      'CREATE INDEX businesses_search_vector ON businesses USING GIN (search_vector)'
+    );
+    await queryInterface.sequelize.query(
+      'CREATE INDEX businesses_name_trgm ON businesses USING GIN (name gin_trgm_ops)'
+    );
+    await queryInterface.addIndex('businesses', ['type'], { name: 'businesses_type' });
+  },
+
+  async down(queryInterface) {
+    if (queryInterface.sequelize.getDialect() !== 'postgres') return;
+
+    await queryInterface.removeIndex('businesses', 'businesses_type');
+    await queryInterface.sequelize.query('DROP INDEX IF EXISTS businesses_name_trgm');
+    await queryInterface.sequelize.query('DROP INDEX IF EXISTS businesses_search_vector');
+    await queryInterface.removeColumn('businesses', 'search_vector');
+  },
+};
@@ -0,0 +1,42 @@
+'use strict';
+
+const { columnResolver, addMissingColumns, addIndexIfMissing } = require('../helpers/schemaHelpers');
+
+const COUNTERS = ['ratingCount', 'ratingSum', 'rating1', 'rating2', 'rating3', 'rating4', 'rating5'];
+
+// Per-business rating aggregates (see helpers/ratingHelpers.js) and the index
+// behind GET /businesses?sort=rating. Columns use the model's field names
+// (rating_count, ...); a table that already has them is left as it is.
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    await addMissingColumns(queryInterface, 'businesses', {
+      ...Object.fromEntries(COUNTERS.map((attribute) =>
+        [attribute, { type: Sequelize.INTEGER, allowNull: false, defaultValue: 0 }])),
+      ratingAverage: { type: Sequelize.FLOAT, allowNull: false, defaultValue: 0 },
+    });
+    await addIndexIfMissing(queryInterface, 'businesses', ['ratingAverage', 'ratingCount', 'id'], { name: 'businesses_rating' });
+
+    // Backfill from existing reviews
+    const b = await columnResolver(queryInterface, 'businesses');
+    const r = await columnResolver(queryInterface, 'reviews');
+    const quote = (name) => queryInterface.quoteIdentifier(name);
+    const aggregate = (expression) =>
+      `(SELECT ${expression} FROM reviews WHERE reviews.${quote(r('businessId'))} = businesses.id)`;
+    await queryInterface.sequelize.query(`
+      UPDATE businesses SET
+        ${quote(b('ratingCount'))} = ${aggregate('COUNT(*)')},
+        ${quote(b('ratingSum'))} = ${aggregate('COALESCE(SUM(rating), 0)')},
+        ${quote(b('ratingAverage'))} = ${aggregate('COALESCE(AVG(CAST(rating AS FLOAT)), 0)')},
+        ${[1, 2, 3, 4, 5].map((stars) =>
+          `${quote(b(`rating${stars}`))} = ${aggregate(`COALESCE(SUM(CASE WHEN rating = ${stars} THEN 1 ELSE 0 END), 0)`)}`).join(',\n        ')}
+    `);
+  },
+
+  async down(queryInterface) {
+    await queryInterface.removeIndex('businesses', 'businesses_rating');
+    const b = await columnResolver(queryInterface, 'businesses');
+    for (const attribute of [...COUNTERS, 'ratingAverage']) {
+      await queryInterface.removeColumn('businesses', b(attribute));
+    }
+  },
+};
@@ -1,3 +1,7 @@
+const { encodeGeohash } = require('../helpers/geohash');
+const { indexBusiness, unindexBusiness } = require('../helpers/searchHelpers');
+const { ratingSummary } = require('../helpers/ratingHelpers');
+
 module.exports = (sequelize, DataTypes) => {
   const Business = sequelize.define('Business', {
     id: { type: DataTypes.INTEGER, primaryKey: true, autoIncrement: true },
@@ -6,11 +10,45 @@ module.exports = (sequelize, DataTypes) => {
     address: { type: DataTypes.STRING, allowNull: false, validate: { notEmpty: true } },
     latitude: { type: DataTypes.DECIMAL },
     longitude: { type: DataTypes.DECIMAL },
+    geohash: { type: DataTypes.STRING(12) },
     contactInfo: { type: DataTypes.STRING },
     description: { type: DataTypes.TEXT },
-    userId: { type: DataTypes.INTEGER, allowNull: false }
+    userId: { type: DataTypes.INTEGER, allowNull: false },
+    // Rating aggregates, maintained by helpers/ratingHelpers.js
+    ratingCount: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    ratingSum: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    ratingAverage: { type: DataTypes.FLOAT, allowNull: false, defaultValue: 0 },
+    rating1: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    rating2: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    rating3: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    rating4: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 },
+    rating5: { type: DataTypes.INTEGER, allowNull: false, defaultValue: 0 }
   }, { tableName: 'businesses' });
 
+  // Expose the rating aggregates as one nested object
+  Business.prototype.toJSON = function toJSON() {
+    const {
+      ratingCount, ratingSum, ratingAverage, rating1, rating2, rating3, rating4, rating5, ...values
+    } = this.get({ plain: true });
+    return {
+      ...values,
+      rating: ratingSummary({ ratingCount, ratingSum, ratingAverage, rating1, rating2, rating3, rating4, rating5 }),
+    };
+  };
+
+  // Keep the geohash used by /businesses/nearby in sync with the coordinates
+  Business.beforeSave((business) => {
+    if (!business.isNewRecord && !business.changed('latitude') && !business.changed('longitude')) return;
+    const { latitude, longitude } = business;
+    business.geohash = latitude == null || longitude == null
+      ? null
+      : encodeGeohash(parseFloat(latitude), parseFloat(longitude));
+  });
+
+  // Keep the in-process search index (non-Postgres dialects) up to date
+  Business.afterSave(indexBusiness);
+  Business.afterDestroy(unindexBusiness);
+
   Business.associate = (models) => {
     Business.belongsTo(models.User, { foreignKey: 'userId' });
     Business.hasMany(models.Service, { foreignKey: 'businessId' });
@@ -1,25 +1,49 @@
 //routes/businesses.js
 const express = require('express');
 const router = express.Router();
-const { createBusiness, getBusinesses } = require('../controllers/businessController');
+const { createBusiness, getBusinesses, getNearbyBusinesses } = require('../controllers/businessController');
 const { authenticate } = require('../middlewares/authMiddleware');
 const { createBusinessValidator, businessIdValidator } = require('../middlewares/validators/businessValidator');
 const { validate } = require('../middlewares/validators/validateMiddleware');
+const { isValidCursor } = require('../helpers/pagination');
 const { query, param } = require('express-validator');
 
 // Create business
 router.post('/', authenticate, createBusinessValidator, validate, createBusiness);
 
-// Get all businesses with optional query validation (pagination, filtering)
+// Get all businesses with optional query validation (pagination, search, type filter)
 router.get(
   '/',
   [
     query('page').optional().isInt({ gt: 0 }).withMessage('Page must be a positive integer'),
     query('limit').optional().isInt({ gt: 0 }).withMessage('Limit must be a positive integer'),
-    query('search').optional().isString().withMessage('Search must be a string')
+    query('cursor').optional().custom(isValidCursor).withMessage('Invalid cursor'),
+    query('search').optional().isString().isLength({ max: 100 }).withMessage('Search must be a string of at most 100 characters')
+      // Search results are relevance-ranked and paged by offset
+      .custom((search, { req }) => req.query.cursor === undefined && req.query.sort === undefined)
+      .withMessage('Search does not support cursor or sort; results are ordered by relevance'),
+    query('type').optional().isIn(['Vet', 'Groomer', 'Pet Sitter', 'Dog Park']).withMessage('Invalid business type'),
+    query('sort').optional().isIn(['newest', 'rating']).withMessage('Sort must be one of: newest, rating')
+      .custom((sort, { req }) => sort !== 'rating' || req.query.cursor === undefined)
+      .withMessage('Cursor pagination is not supported with sort=rating')
   ],
   validate,
   getBusinesses
 );
 
+// Get businesses within a radius (km) of a point, sorted by distance
+router.get(
+  '/nearby',
+  [
+    query('lat').isFloat({ min: -90, max: 90 }).withMessage('Latitude must be between -90 and 90'),
+    query('lng').isFloat({ min: -180, max: 180 }).withMessage('Longitude must be between -180 and 180'),
+    query('radius').optional().isFloat({ gt: 0, max: 50 }).withMessage('Radius must be between 0 and 50 km'),
+    query('type').optional().isIn(['Vet', 'Groomer', 'Pet Sitter', 'Dog Park']).withMessage('Invalid business type'),
+    query('page').optional().isInt({ gt: 0 }).withMessage('Page must be a positive integer'),
+    query('limit').optional().isInt({ gt: 0 }).withMessage('Limit must be a positive integer')
+  ],
+  validate,
+  getNearbyBusinesses
+);
+
 module.exports = router;
@@ -5,6 +5,7 @@ const { createReview, getBusinessReviews, deleteReview } = require('../controlle
 const { authenticate } = require('../middlewares/authMiddleware');
 const { createReviewValidator, reviewIdValidator } = require('../middlewares/validators/reviewValidator');
 const { validate } = require('../middlewares/validators/validateMiddleware');
+const { isValidCursor } = require('../helpers/pagination');
 const { param, query } = require('express-validator');
 
 // Create review
@@ -16,7 +17,8 @@ router.get(
   [
     param('businessId').isInt().withMessage('Business ID must be an integer'),
     query('page').optional().isInt({ gt: 0 }).withMessage('Page must be a positive integer'),
-    query('limit').optional().isInt({ gt: 0 }).withMessage('Limit must be a positive integer')
+    query('limit').optional().isInt({ gt: 0 }).withMessage('Limit must be a positive integer'),
+    query('cursor').optional().custom(isValidCursor).withMessage('Invalid cursor')
   ],
   validate,
   getBusinessReviews
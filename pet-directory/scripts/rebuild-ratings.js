@@ -0,0 +1,32 @@
+// scripts/rebuild-ratings.js
+// Recompute every business's rating aggregates from the reviews table.
+//
+// Review writes keep the aggregates up to date incrementally; run this after
+// bulk imports, manual SQL edits, or if the counters are ever suspected to have
+// drifted:  npm run ratings:rebuild
+require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
+
+const { Business, Review, sequelize } = require("../models");
+const redisClient = require("../config/redis");
+const { invalidate, tags } = require("../helpers/cacheHelpers");
+const { rebuildRatingAggregates } = require("../helpers/ratingHelpers");
+
+const batchSize = parseInt(process.env.RATING_REBUILD_BATCH || "1000", 10);
+
+const run = async () => {
+  const started = Date.now();
+  const batches = await rebuildRatingAggregates(Business, Review, { batchSize });
+  // Every cached business response embeds the aggregates
+  await invalidate({ tags: [tags.businesses()] });
+  console.log(`✅ Rebuilt rating aggregates in ${batches} batch(es) (${Date.now() - started}ms)`);
+};
+
+run()
+  .catch((err) => {
+    console.error("❌ Rating rebuild failed:", err.message);
+    process.exitCode = 1;
+  })
+  .finally(async () => {
+    await sequelize.close();
+    await redisClient.quit();
+  });
@@ -0,0 +1,42 @@
+// scripts/seed-scale.js
+// Load the deterministic scale data set into the configured database:
+//
+//   SEED_USERS=100000 SEED_BUSINESSES=1000000 SEED_REVIEWS=5000000 npm run db:seed:scale
+//
+// Same generator as the benchmark suite (load-tests/bench/scaleSeed.js), with
+// progress output and cache invalidation. Rows are added after the existing
+// ones, so run it against a migrated database; `npm run db:seed:scale --
+// --undo` removes them again.
+require("dotenv").config({ path: `.env.${process.env.NODE_ENV || "development"}` });
+
+const { sequelize } = require("../models");
+const redisClient = require("../config/redis");
+const { invalidate, tags } = require("../helpers/cacheHelpers");
+const { seed, seedOptions, unseed } = require("../load-tests/bench/scaleSeed");
+
+const undo = process.argv.includes("--undo");
+
+const run = async () => {
+  const started = Date.now();
+  if (undo) {
+    await unseed(sequelize.getQueryInterface());
+    console.log(`✅ Removed the seeded rows in ${Date.now() - started}ms`);
+  } else {
+    const options = seedOptions();
+    console.log(`🌱 Seeding ${JSON.stringify(options)}`);
+    const counts = await seed(sequelize.getQueryInterface(), options);
+    console.log(`✅ Inserted ${JSON.stringify(counts)} in ${Date.now() - started}ms`);
+  }
+  // Cached listings are out of date either way
+  await invalidate({ tags: [tags.businesses()] });
+};
+
+run()
+  .catch((err) => {
+    console.error("❌ Scale seed failed:", err.message);
+    process.exitCode = 1;
+  })
+  .finally(async () => {
+    await sequelize.close();
+    await redisClient.quit();
+  });
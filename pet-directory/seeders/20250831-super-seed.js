@@ -1,9 +1,14 @@
 'use strict';
 const bcrypt = require('bcrypt');
 const { faker } = require('@faker-js/faker');
+const { rowMapper } = require('../helpers/schemaHelpers');
 
 module.exports = {
   async up(queryInterface, Sequelize) {
+    // Rows use attribute names; map them onto the tables' columns
+    const insert = async (table, rows, options) =>
+      queryInterface.bulkInsert(table, rows.map(await rowMapper(queryInterface, table)), options);
+
     // Arrays to store IDs for associations
     const userIds = [];
     const businessIds = [];
@@ -24,7 +29,7 @@ module.exports = {
       });
     }
 
-    const insertedUsers = await queryInterface.bulkInsert('users', users, { returning: true });
+    const insertedUsers = await insert('users', users, { returning: true });
     insertedUsers.forEach(u => userIds.push(u.id));
 
     // 2️⃣ Create Businesses
@@ -45,7 +50,7 @@ module.exports = {
       });
     }
 
-    const insertedBusinesses = await queryInterface.bulkInsert('businesses', businesses, { returning: true });
+    const insertedBusinesses = await insert('businesses', businesses, { returning: true });
     insertedBusinesses.forEach(b => businessIds.push(b.id));
 
     // 3️⃣ Create Services
@@ -63,7 +68,7 @@ module.exports = {
       }
     }
 
-    const insertedServices = await queryInterface.bulkInsert('services', services, { returning: true });
+    const insertedServices = await insert('services', services, { returning: true });
     insertedServices.forEach(s => serviceIds.push(s.id));
 
     // 4️⃣ Create Pets
@@ -82,7 +87,7 @@ module.exports = {
       }
     }
 
-    const insertedPets = await queryInterface.bulkInsert('pets', pets, { returning: true });
+    const insertedPets = await insert('pets', pets, { returning: true });
     insertedPets.forEach(p => petIds.push(p.id));
 
     // 5️⃣ Create Reviews
@@ -102,7 +107,7 @@ module.exports = {
       });
     }
 
-    await queryInterface.bulkInsert('reviews', reviews);
+    await insert('reviews', reviews);
   },
 
   async down(queryInterface, Sequelize) {
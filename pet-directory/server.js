@@ -0,0 +1,91 @@
+// server.js
+// Starts the HTTP server for a single process or a cluster worker, and drains
+// it on shutdown.
+const app = require("./app");
+const { sequelize } = require("./config/db");
+const redisClient = require("./config/redis");
+const { startInvalidationListener, stopInvalidationListener } = require("./helpers/cacheHelpers");
+const { hashPool } = require("./helpers/hashPool");
+const { recordStartup } = require("./helpers/metrics");
+const logger = require("./helpers/logger");
+
+const PORT = process.env.PORT || 5000;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS || "10000", 10);
+// The schema is managed by migrations; DB_SYNC=true restores sync() on boot
+const DB_SYNC = process.env.DB_SYNC === "true";
+
+let server;
+let shuttingDown = false;
+
+// Seconds since the process started, module loading included
+const sinceStart = () => process.uptime();
+
+async function startServer() {
+  try {
+    // One connectivity check, in parallel with the cache listener
+    await Promise.all([sequelize.authenticate(), startInvalidationListener()]);
+    if (DB_SYNC) await sequelize.sync({ alter: false });
+
+    server = app.listen(PORT, () => {
+      const ready = sinceStart();
+      recordStartup("listening", ready);
+      console.log(`🚀 Server running on port ${PORT} (pid ${process.pid}, listening after ${Math.round(ready * 1000)}ms)`);
+    });
+
+    // Time to first request: includes any lazy work on the first hit
+    server.once("request", (req, res) => {
+      res.once("finish", () => {
+        const firstRequest = sinceStart();
+        recordStartup("first_request", firstRequest);
+        console.log(`⏱️  First request served ${Math.round(firstRequest * 1000)}ms after start (pid ${process.pid})`);
+      });
+    });
+  } catch (err) {
+    console.error("❌ Failed to start server", err);
+    process.exit(1);
+  }
+}
+
+// Stop accepting connections and wait for in-flight requests
+const drain = () => new Promise((resolve) => {
+  if (!server) return resolve();
+  app.locals.draining = true;
+  const timer = setTimeout(() => {
+    console.warn(`⚠️  Requests still running after ${SHUTDOWN_TIMEOUT_MS}ms, closing connections`);
+    server.closeAllConnections();
+  }, SHUTDOWN_TIMEOUT_MS);
+  timer.unref();
+
+  server.close(() => {
+    clearTimeout(timer);
+    resolve();
+  });
+  server.closeIdleConnections();
+});
+
+// Graceful shutdown
+async function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`⚠️  Shutting down gracefully due to ${signal}...`);
+
+  await drain();
+  console.log("HTTP server closed.");
+  try {
+    await hashPool.close();
+    await sequelize.close();
+    console.log("Database connection closed.");
+    await stopInvalidationListener();
+    await redisClient.quit();
+    console.log("Redis connection closed.");
+  } catch (err) {
+    console.error("Error during shutdown:", err);
+  }
+  logger.flush();
+  process.exit(0);
+}
+
+process.on("SIGTERM", () => shutdown("SIGTERM"));
+process.on("SIGINT", () => shutdown("SIGINT"));
+
+module.exports = { startServer, shutdown };
@@ -0,0 +1,62 @@
+const { evaluate } = require('../../load-tests/bench/report');
+const { summarize } = require('../../load-tests/bench/loadGenerator');
+
+const thresholds = {
+  defaults: { maxErrorRate: 0, maxP95RegressionPct: 25, maxRpsDropPct: 20 },
+  scenarios: { list: { p95Ms: 50 } },
+};
+
+const makeRun = (list, overrides = {}) => ({
+  dialect: 'sqlite',
+  redis: 'memory',
+  dataset: { seed: 42, users: 10 },
+  settings: { durationMs: 1000, concurrency: 4 },
+  scenarios: { list: { requests: 100, errors: 0, errorRate: 0, rps: 500, p95Ms: 20, ...list } },
+  ...overrides,
+});
+
+describe('Benchmark report', () => {
+  it('should summarize latencies into percentiles and rates', () => {
+    const latencies = Array.from({ length: 100 }, (_, i) => i + 1);
+
+    const summary = summarize(latencies, 2, 2000);
+
+    expect(summary).toEqual(expect.objectContaining({
+      requests: 100, errors: 2, errorRate: 0.02, rps: 50, p50Ms: 50, p95Ms: 95, p99Ms: 99, maxMs: 100,
+    }));
+  });
+
+  it('should pass a run within its absolute thresholds', () => {
+    const run = makeRun();
+
+    expect(evaluate(run, thresholds)).toBe(true);
+    expect(run.passed).toBe(true);
+    expect(run.baseline).toBeNull();
+  });
+
+  it('should fail on errors or a p95 above the budget', () => {
+    const run = makeRun({ p95Ms: 80, errors: 1, errorRate: 0.01 });
+
+    expect(evaluate(run, thresholds)).toBe(false);
+    const failed = run.scenarios.list.verdict.checks.filter((check) => !check.passed).map((check) => check.metric);
+    expect(failed).toEqual(['p95Ms', 'errorRate']);
+  });
+
+  it('should fail on a regression against a comparable baseline', () => {
+    const baseline = makeRun({ p95Ms: 10, rps: 1000 }, { commit: 'abc123' });
+    const run = makeRun();
+
+    expect(evaluate(run, thresholds, baseline)).toBe(false);
+    const failed = run.scenarios.list.verdict.checks.filter((check) => !check.passed).map((check) => check.metric);
+    expect(failed).toEqual(['p95ChangePct', 'rpsChangePct']);
+    expect(run.baseline).toEqual(expect.objectContaining({ commit: 'abc123', enforced: true }));
+  });
+
+  it('should not compare against a baseline with a different data set', () => {
+    const baseline = makeRun({ p95Ms: 10, rps: 1000 }, { dataset: { seed: 42, users: 1000 } });
+    const run = makeRun();
+
+    expect(evaluate(run, thresholds, baseline)).toBe(true);
+    expect(run.baseline.enforced).toBe(false);
+  });
+});
@@ -0,0 +1,103 @@
+jest.mock('bcrypt', () => ({ hash: jest.fn().mockResolvedValue('hashed') }));
+
+const { seed, seedOptions } = require('../../load-tests/bench/scaleSeed');
+
+const COLUMNS = {
+  users: ['id', 'name', 'email', 'password', 'role', 'createdAt', 'updatedAt'],
+  businesses: [
+    'id', 'name', 'type', 'address', 'latitude', 'longitude', 'geohash', 'contactInfo', 'description', 'userId',
+    'ratingCount', 'ratingSum', 'ratingAverage', 'rating1', 'rating2', 'rating3', 'rating4', 'rating5',
+    'createdAt', 'updatedAt',
+  ],
+  services: ['id', 'name', 'price', 'duration', 'businessId', 'createdAt', 'updatedAt'],
+  reviews: ['id', 'rating', 'comment', 'userId', 'businessId', 'serviceId', 'createdAt', 'updatedAt'],
+};
+
+const snake = (name) => name.replace(/([a-z0-9])([A-Z])/g, '$1_$2').toLowerCase();
+
+// Records bulk inserts; `underscored` mimics tables created by sync()
+const fakeQueryInterface = ({ underscored = false, maxId = 0 } = {}) => {
+  const rows = { users: [], businesses: [], services: [], reviews: [] };
+  const batches = [];
+  return {
+    rows,
+    batches,
+    describeTable: jest.fn(async (table) =>
+      Object.fromEntries(COLUMNS[table].map((name) => [underscored ? snake(name) : name, {}]))),
+    bulkInsert: jest.fn(async (table, batch) => {
+      batches.push([table, batch.length]);
+      rows[table].push(...batch);
+    }),
+    queryGenerator: { quoteTable: (name) => `"${name}"` },
+    sequelize: {
+      getDialect: () => 'sqlite',
+      query: jest.fn().mockResolvedValue([{ max: maxId }]),
+    },
+  };
+};
+
+const options = seedOptions({
+  SEED_USERS: '20',
+  SEED_BUSINESSES: '50',
+  SEED_SERVICES_PER_BUSINESS: '2',
+  SEED_REVIEWS: '400',
+  SEED_BATCH_SIZE: '30',
+});
+
+describe('Scale seeder', () => {
+  it('should produce identical rows for the same seed', async () => {
+    const first = fakeQueryInterface();
+    const second = fakeQueryInterface();
+
+    await seed(first, options);
+    await seed(second, options);
+
+    expect(second.rows).toEqual(first.rows);
+
+    const other = fakeQueryInterface();
+    await seed(other, { ...options, seed: options.seed + 1 });
+    expect(other.rows.businesses).not.toEqual(first.rows.businesses);
+  });
+
+  it('should insert in batches of at most SEED_BATCH_SIZE rows', async () => {
+    const queryInterface = fakeQueryInterface();
+
+    const counts = await seed(queryInterface, options);
+
+    expect(counts).toEqual(expect.objectContaining({ users: 20, businesses: 50, services: 100 }));
+    expect(counts.reviews).toBe(queryInterface.rows.reviews.length);
+    queryInterface.batches.forEach(([, size]) => expect(size).toBeLessThanOrEqual(30));
+  });
+
+  it('should precompute rating aggregates that match the seeded reviews', async () => {
+    const queryInterface = fakeQueryInterface();
+
+    await seed(queryInterface, options);
+
+    const { businesses, reviews, services } = queryInterface.rows;
+    businesses.forEach((business) => {
+      const own = reviews.filter((review) => review.businessId === business.id);
+      expect(business.ratingCount).toBe(own.length);
+      expect(business.ratingSum).toBe(own.reduce((sum, review) => sum + review.rating, 0));
+      [1, 2, 3, 4, 5].forEach((stars) => {
+        expect(business[`rating${stars}`]).toBe(own.filter((review) => review.rating === stars).length);
+      });
+    });
+    reviews.filter((review) => review.serviceId !== null).forEach((review) => {
+      expect(services.find((service) => service.id === review.serviceId).businessId).toBe(review.businessId);
+    });
+  });
+
+  it('should number rows after existing ids and map snake_case columns', async () => {
+    const queryInterface = fakeQueryInterface({ underscored: true, maxId: 100 });
+
+    await seed(queryInterface, options);
+
+    const [business] = queryInterface.rows.businesses;
+    expect(business.id).toBe(101);
+    expect(business.user_id).toBeGreaterThan(100);
+    expect(business.rating_count).toEqual(expect.any(Number));
+    expect(business).not.toHaveProperty('ratingCount');
+    expect(queryInterface.rows.users[0].email).toBe('seed101@petdirectory.com');
+  });
+});
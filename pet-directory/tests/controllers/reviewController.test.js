@@ -2,9 +2,11 @@
 const request = require('supertest');
 const express = require('express');
 const reviewController = require('../../controllers/reviewController');
-const { Review, Business } = require('../../models');
+const { Review, Business, sequelize } = require('../../models');
+const { applyRating } = require('../../helpers/ratingHelpers');
 
 jest.mock('../../models');
+jest.mock('../../helpers/ratingHelpers');
 
 const app = express();
 app.use(express.json());
@@ -63,14 +65,29 @@ describe('Review Controller', () => {
   });
 
   describe('DELETE /reviews/:id', () => {
+    beforeEach(() => {
+      sequelize.transaction.mockImplementation((callback) => callback({}));
+    });
+
     it('should delete a review successfully', async () => {
-      const review = { id: 1, userId: 1, destroy: jest.fn() };
-      Review.findByPk.mockResolvedValue(review);
+      Review.findByPk.mockResolvedValue({ id: 1, userId: 1, businessId: 3, rating: 4 });
+      Review.destroy.mockResolvedValue(1);
 
       const res = await request(app).delete('/reviews/1');
 
       expect(res.statusCode).toEqual(200);
-      expect(review.destroy).toHaveBeenCalled();
+      expect(Review.destroy).toHaveBeenCalledWith({ where: { id: 1 }, transaction: {} });
+      expect(applyRating).toHaveBeenCalledWith(Business, 3, 4, -1, { transaction: {} });
+    });
+
+    it('should not remove the rating twice when the review was already deleted', async () => {
+      Review.findByPk.mockResolvedValue({ id: 1, userId: 1, businessId: 3, rating: 4 });
+      Review.destroy.mockResolvedValue(0);
+
+      const res = await request(app).delete('/reviews/1');
+
+      expect(res.statusCode).toEqual(404);
+      expect(applyRating).not.toHaveBeenCalled();
     });
 
     it('should return an error if the review is not found', async () => {
@@ -83,8 +100,7 @@ describe('Review Controller', () => {
     });
 
     it('should return an error if the user is not authorized', async () => {
-      const review = { id: 1, userId: 2, destroy: jest.fn() };
-      Review.findByPk.mockResolvedValue(review);
+      Review.findByPk.mockResolvedValue({ id: 1, userId: 2 });
 
       const res = await request(app).delete('/reviews/1');
 
@@ -0,0 +1,42 @@
+const redis = require('../../config/redis');
+const { checkLoginAttempts } = require('../../helpers/authHelpers');
+
+jest.mock('../../config/redis', () => {
+  const counters = new Map();
+  // Minimal MULTI: SET ... NX and INCR on an in-memory counter, recording TTLs
+  const multi = jest.fn(() => {
+    const results = [];
+    const chain = {
+      set: jest.fn((key, value, ex, ttl, nx) => {
+        if (nx === 'NX' && counters.has(key)) {
+          results.push([null, null]);
+        } else {
+          counters.set(key, Number(value));
+          multi.ttls.push(ttl);
+          results.push([null, 'OK']);
+        }
+        return chain;
+      }),
+      incr: jest.fn((key) => {
+        counters.set(key, (counters.get(key) || 0) + 1);
+        results.push([null, counters.get(key)]);
+        return chain;
+      }),
+      exec: jest.fn(async () => results),
+    };
+    return chain;
+  });
+  multi.ttls = [];
+  return { multi };
+});
+
+describe('Auth Helpers', () => {
+  it('should lock out after five attempts without extending the window', async () => {
+    const results = [];
+    for (let i = 0; i < 8; i++) results.push(await checkLoginAttempts('a@example.com'));
+
+    expect(results).toEqual([true, true, true, true, true, false, false, false]);
+    // The expiry was only set by the first attempt
+    expect(redis.multi.ttls).toEqual([300]);
+  });
+});
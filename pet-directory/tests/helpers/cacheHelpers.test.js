@@ -0,0 +1,85 @@
+const redis = require('../../config/redis');
+const {
+  buildCacheKey,
+  invalidateBusiness,
+  invalidateReviews,
+  tags,
+} = require('../../helpers/cacheHelpers');
+
+jest.mock('../../config/redis', () => {
+  const pipeline = { incr: jest.fn(), del: jest.fn(), exec: jest.fn().mockResolvedValue([]) };
+  return {
+    mget: jest.fn(),
+    pipeline: jest.fn(() => pipeline),
+    publish: jest.fn().mockResolvedValue(0),
+    keys: jest.fn(),
+  };
+});
+
+describe('Cache Helpers', () => {
+  const pipeline = redis.pipeline();
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('buildCacheKey', () => {
+    it('should embed the current tag generation in the key', async () => {
+      redis.mget.mockResolvedValue(['7']);
+
+      const key = await buildCacheKey([tags.businesses()], 'all:page:1:limit:10');
+
+      expect(redis.mget).toHaveBeenCalledWith(['cache:gen:businesses']);
+      expect(key).toBe('businesses:g7:all:page:1:limit:10');
+    });
+
+    it('should default to generation 0 for unknown tags', async () => {
+      redis.mget.mockResolvedValue([null]);
+
+      const key = await buildCacheKey([tags.reviews(3)], 'page:1:limit:10');
+
+      expect(key).toBe('reviews:3:g0:page:1:limit:10');
+    });
+  });
+
+  describe('invalidation', () => {
+    it('should bump the tag generation without scanning keys', async () => {
+      await invalidateReviews(3);
+
+      expect(pipeline.incr).toHaveBeenCalledWith('cache:gen:reviews:3');
+      // Only the rating-ordered listing and the detail key embed fresh aggregates
+      expect(pipeline.incr).toHaveBeenCalledWith('cache:gen:businesses:rating');
+      expect(pipeline.incr).not.toHaveBeenCalledWith('cache:gen:businesses');
+      expect(pipeline.del).toHaveBeenCalledWith('business:3');
+      expect(pipeline.exec).toHaveBeenCalled();
+      expect(redis.keys).not.toHaveBeenCalled();
+    });
+
+    it('should drop the business detail key on update', async () => {
+      await invalidateBusiness(5);
+
+      expect(pipeline.incr).toHaveBeenCalledWith('cache:gen:businesses');
+      expect(pipeline.incr).not.toHaveBeenCalledWith('cache:gen:reviews:5');
+      expect(pipeline.del).toHaveBeenCalledWith('business:5');
+    });
+
+    it('should cascade to reviews and services on delete', async () => {
+      await invalidateBusiness(5, { cascade: true });
+
+      expect(pipeline.incr).toHaveBeenCalledWith('cache:gen:reviews:5');
+      expect(pipeline.incr).toHaveBeenCalledWith('cache:gen:services:5');
+      expect(pipeline.del).toHaveBeenCalledWith('business:5');
+    });
+
+    it('should publish invalidations for other instances', async () => {
+      pipeline.exec.mockResolvedValueOnce([[null, 4]]);
+
+      await invalidateReviews(3);
+
+      expect(redis.publish).toHaveBeenCalledWith(
+        'cache:invalidate',
+        JSON.stringify({ generations: { 'reviews:3': 4 }, keys: ['business:3'] })
+      );
+    });
+  });
+});
@@ -0,0 +1,40 @@
+const cluster = require('cluster');
+const { AggregatorRegistry } = require('prom-client');
+const { requestClusterMetrics, serveClusterMetrics } = require('../../helpers/clusterMetrics');
+
+describe('Cluster Metrics', () => {
+  const originalSend = process.send;
+
+  afterEach(() => {
+    process.send = originalSend;
+    cluster.removeAllListeners('message');
+    jest.restoreAllMocks();
+  });
+
+  it('should answer worker requests with the aggregate of all workers', async () => {
+    jest.spyOn(AggregatorRegistry.prototype, 'clusterMetrics').mockResolvedValue('http_requests_total 42\n');
+    serveClusterMetrics();
+
+    // Route the worker's request to the primary and the reply back to the worker
+    const worker = {
+      isConnected: () => true,
+      send: (message) => process.emit('message', message),
+    };
+    process.send = (message) => cluster.emit('message', worker, message);
+
+    await expect(requestClusterMetrics()).resolves.toBe('http_requests_total 42\n');
+  });
+
+  it('should surface aggregation errors to the worker', async () => {
+    jest.spyOn(AggregatorRegistry.prototype, 'clusterMetrics').mockRejectedValue(new Error('worker timed out'));
+    serveClusterMetrics();
+
+    const worker = {
+      isConnected: () => true,
+      send: (message) => process.emit('message', message),
+    };
+    process.send = (message) => cluster.emit('message', worker, message);
+
+    await expect(requestClusterMetrics()).rejects.toThrow('worker timed out');
+  });
+});
@@ -0,0 +1,109 @@
+const { Op } = require('sequelize');
+const redis = require('../../config/redis');
+const { encodeGeohash, nextPrefix } = require('../../helpers/geohash');
+const { haversineKm, boundingBox, coveringCells, findNearby } = require('../../helpers/geoHelpers');
+
+jest.mock('../../config/redis', () => ({
+  mget: jest.fn((keys) => Promise.resolve(keys.map(() => null))),
+  get: jest.fn().mockResolvedValue(null),
+  set: jest.fn().mockResolvedValue('OK'),
+}));
+
+const business = (id, latitude, longitude, type = 'Vet') => ({
+  id,
+  type,
+  latitude: String(latitude),
+  longitude: String(longitude),
+  geohash: encodeGeohash(latitude, longitude),
+});
+
+describe('Geo Helpers', () => {
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('should encode known geohashes', () => {
+    expect(encodeGeohash(57.64911, 10.40744, 11)).toBe('u4pruydqqvj');
+  });
+
+  it('should compute the next prefix for range scans', () => {
+    expect(nextPrefix('9q8y')).toBe('9q8z');
+    expect(nextPrefix('9zz')).toBe('b');
+    expect(nextPrefix('zz')).toBeNull();
+  });
+
+  it('should compute haversine distances', () => {
+    expect(haversineKm(51.5007, -0.1246, 40.6892, -74.0445)).toBeCloseTo(5574.8, 0);
+  });
+
+  it('should cover the search area with a bounded number of cells', () => {
+    const point = encodeGeohash(37.7749, -122.4194, 6);
+    const cells = coveringCells(boundingBox(37.7749, -122.4194, 5));
+
+    expect(cells.length).toBeLessThanOrEqual(64);
+    expect(cells.some((cell) => point.startsWith(cell))).toBe(true);
+  });
+
+  it('should keep large radii on fine cells', () => {
+    const cells = coveringCells(boundingBox(37.7749, -122.4194, 50));
+
+    expect(cells.length).toBeLessThanOrEqual(64);
+    expect(cells[0].length).toBe(4);
+  });
+
+  it('should return businesses within the radius sorted by distance', async () => {
+    const rows = [
+      business(1, 37.7749, -122.4194),
+      business(2, 37.8044, -122.2712),
+      business(3, 37.7793, -122.4193, 'Groomer'),
+      business(4, 37.7755, -122.4180),
+    ];
+    const Model = { findAll: jest.fn().mockResolvedValue(rows.map((row) => ({ toJSON: () => row }))) };
+
+    const results = await findNearby(Model, { lat: 37.7749, lng: -122.4194, radiusKm: 1, type: 'Vet' });
+
+    expect(results.map((r) => r.id)).toEqual([1, 4]);
+    expect(results[1].distanceKm).toBeGreaterThan(0);
+  });
+
+  it('should narrow the candidates by bounding box and type in SQL', async () => {
+    const Model = { findAll: jest.fn().mockResolvedValue([]) };
+
+    await findNearby(Model, { lat: 37.7749, lng: -122.4194, radiusKm: 1, type: 'Vet' });
+
+    const [cellRanges, latitude, longitude, type] = Model.findAll.mock.calls[0][0].where[Op.and];
+    expect(cellRanges[Op.or].length).toBeGreaterThan(0);
+    const [minLat, maxLat] = latitude.latitude[Op.between];
+    expect(minLat).toBeLessThan(37.7749);
+    expect(maxLat).toBeGreaterThan(37.7749);
+    const [minLng, maxLng] = longitude.longitude[Op.between];
+    expect(minLng).toBeLessThan(-122.4194);
+    expect(maxLng).toBeGreaterThan(-122.4194);
+    expect(type).toEqual({ type: 'Vet' });
+  });
+
+  it('should split the longitude range across the antimeridian', async () => {
+    const Model = { findAll: jest.fn().mockResolvedValue([]) };
+
+    await findNearby(Model, { lat: 0, lng: 179.99, radiusKm: 5 });
+
+    const [, , longitude] = Model.findAll.mock.calls[0][0].where[Op.and];
+    const [east, west] = longitude[Op.or];
+    expect(east.longitude[Op.gte]).toBeLessThan(179.99);
+    expect(west.longitude[Op.lte]).toBeGreaterThan(-180);
+  });
+
+  it('should serve cached candidates for the same cell set', async () => {
+    const row = business(1, 37.7749, -122.4194);
+    const Model = { findAll: jest.fn().mockResolvedValue([{ toJSON: () => row }]) };
+
+    await findNearby(Model, { lat: 37.7749, lng: -122.4194, radiusKm: 1 });
+    const [key, payload] = redis.set.mock.calls[0];
+    redis.get.mockResolvedValueOnce(payload);
+    const results = await findNearby(Model, { lat: 37.7749, lng: -122.4194, radiusKm: 1 });
+
+    expect(redis.get.mock.calls[1][0]).toBe(key);
+    expect(Model.findAll).toHaveBeenCalledTimes(1);
+    expect(results.map((r) => r.id)).toEqual([1]);
+  });
+});
@@ -0,0 +1,38 @@
+const { HashPool, isSaturated } = require('../../helpers/hashPool');
+
+jest.mock('bcrypt', () => ({
+  hash: jest.fn((password) => new Promise((resolve) => setImmediate(() => resolve(`hashed:${password}`)))),
+  compare: jest.fn((password, hash) => Promise.resolve(hash === `hashed:${password}`)),
+}));
+
+describe('Hash Pool', () => {
+  it('should hash and compare in-process when the pool size is 0', async () => {
+    const pool = new HashPool({ size: 0, maxQueue: 4 });
+
+    const hash = await pool.run('hash', ['secret', 10]);
+
+    expect(hash).toBe('hashed:secret');
+    await expect(pool.run('compare', ['secret', hash])).resolves.toBe(true);
+    await expect(pool.run('compare', ['wrong', hash])).resolves.toBe(false);
+    expect(pool.stats()).toEqual(expect.objectContaining({ completed: 3, failed: 0, rejected: 0, busy: 0 }));
+  });
+
+  it('should reject jobs beyond the queue limit', async () => {
+    const pool = new HashPool({ size: 0, maxQueue: 2 });
+
+    const results = await Promise.allSettled([
+      pool.run('hash', ['a', 10]),
+      pool.run('hash', ['b', 10]),
+      pool.run('hash', ['c', 10]),
+    ]);
+
+    expect(results.map((r) => r.status)).toEqual(['fulfilled', 'fulfilled', 'rejected']);
+    expect(isSaturated(results[2].reason)).toBe(true);
+    expect(pool.stats().rejected).toBe(1);
+  });
+
+  it('should only treat saturation errors as saturated', () => {
+    expect(isSaturated(new Error('boom'))).toBe(false);
+    expect(isSaturated(undefined)).toBe(false);
+  });
+});
@@ -0,0 +1,57 @@
+const { register, observeQuery, recordCacheLookup, instrumentRedis } = require('../../helpers/metrics');
+
+const metricValues = async (name) => (await register.getSingleMetric(name).get()).values;
+
+const command = (name) => {
+  let resolve;
+  const promise = new Promise((res) => { resolve = res; });
+  return { name, promise, resolve };
+};
+
+describe('Metrics', () => {
+  beforeEach(() => {
+    register.resetMetrics();
+  });
+
+  it('should record query durations by statement type', async () => {
+    observeQuery('Executed (default): SELECT * FROM businesses', 12);
+    observeQuery('Executed (a1b2): UPDATE businesses SET x = 1', 3);
+    observeQuery('Executing (default): SELECT 1', undefined);
+
+    const counts = (await metricValues('db_query_duration_seconds'))
+      .filter((v) => v.metricName === 'db_query_duration_seconds_count');
+    expect(counts).toEqual(expect.arrayContaining([
+      expect.objectContaining({ labels: { operation: 'SELECT' }, value: 1 }),
+      expect.objectContaining({ labels: { operation: 'UPDATE' }, value: 1 }),
+    ]));
+  });
+
+  it('should count cache lookups per namespace', async () => {
+    recordCacheLookup('businesses', 'miss');
+    recordCacheLookup('geo', 'redis_hit', 3);
+    recordCacheLookup('geo', 'miss', 0);
+
+    const values = await metricValues('cache_lookups_total');
+    expect(values).toEqual(expect.arrayContaining([
+      expect.objectContaining({ labels: { namespace: 'businesses', result: 'miss' }, value: 1 }),
+      expect.objectContaining({ labels: { namespace: 'geo', result: 'redis_hit' }, value: 3 }),
+    ]));
+    expect(values.find((v) => v.labels.result === 'miss' && v.labels.namespace === 'geo')).toBeUndefined();
+  });
+
+  it('should time each Redis command once', async () => {
+    const client = { sendCommand: jest.fn((cmd) => cmd.promise) };
+    instrumentRedis(client);
+    const get = command('get');
+
+    client.sendCommand(get);
+    client.sendCommand(get); // re-sent from the offline queue
+    get.resolve('value');
+    await get.promise;
+    await new Promise(setImmediate);
+
+    const count = (await metricValues('redis_command_duration_seconds'))
+      .find((v) => v.metricName === 'redis_command_duration_seconds_count' && v.labels.command === 'get');
+    expect(count.value).toBe(1);
+  });
+});
@@ -0,0 +1,85 @@
+const { Op } = require('sequelize');
+const redis = require('../../config/redis');
+const {
+  encodeCursor,
+  decodeCursor,
+  isValidCursor,
+  paginate,
+} = require('../../helpers/pagination');
+
+jest.mock('../../config/redis', () => ({
+  get: jest.fn(),
+  set: jest.fn().mockResolvedValue('OK'),
+  mget: jest.fn().mockResolvedValue(['0']),
+}));
+
+const rows = (ids) => ids.map((id) => ({ id, createdAt: new Date(Date.UTC(2025, 0, id)) }));
+
+const Model = {
+  sequelize: { getDialect: () => 'sqlite' },
+  findAll: jest.fn(),
+  count: jest.fn(),
+};
+
+const req = (query) => ({ query, path: '/', baseUrl: '/api/v1/businesses' });
+
+describe('Pagination Helpers', () => {
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('cursors', () => {
+    it('should round-trip a cursor', () => {
+      const [row] = rows([3]);
+      const cursor = encodeCursor(row, 'next');
+
+      expect(decodeCursor(cursor)).toEqual({ direction: 'next', createdAt: row.createdAt, id: 3 });
+    });
+
+    it('should reject malformed cursors', () => {
+      expect(isValidCursor('not-a-cursor')).toBe(false);
+      expect(isValidCursor('')).toBe(true);
+    });
+  });
+
+  describe('paginate', () => {
+    it('should keep offset pagination for page/limit clients', async () => {
+      redis.get.mockResolvedValue('25');
+      Model.findAll.mockResolvedValue(rows([25, 24]));
+
+      const result = await paginate(Model, req({ page: '3', limit: '2' }), { tags: ['businesses'], countKey: 'all' });
+
+      expect(Model.findAll).toHaveBeenCalledWith(expect.objectContaining({ limit: 2, offset: 4 }));
+      expect(Model.count).not.toHaveBeenCalled();
+      expect(result).toMatchObject({ total: 25, page: 3, limit: 2 });
+    });
+
+    it('should return next links in cursor mode', async () => {
+      redis.get.mockResolvedValue(null);
+      Model.count.mockResolvedValue(3);
+      Model.findAll.mockResolvedValue(rows([3, 2, 1]));
+
+      const result = await paginate(Model, req({ cursor: '', limit: '2' }), { tags: ['businesses'], countKey: 'all' });
+
+      expect(result.rows.map((r) => r.id)).toEqual([3, 2]);
+      expect(result.total).toBe(3);
+      expect(result.prevCursor).toBeNull();
+      expect(decodeCursor(result.nextCursor)).toMatchObject({ direction: 'next', id: 2 });
+      expect(result.links.next).toMatch(/^\/api\/v1\/businesses\?cursor=/);
+      expect(redis.set).toHaveBeenCalledWith('businesses:g0:count:all', '3', 'EX', 300);
+    });
+
+    it('should seek past the cursor position', async () => {
+      redis.get.mockResolvedValue('3');
+      Model.findAll.mockResolvedValue(rows([1]));
+      const cursor = encodeCursor(rows([2])[0], 'next');
+
+      const result = await paginate(Model, req({ cursor, limit: '2' }), { tags: ['businesses'], countKey: 'all' });
+
+      const { where } = Model.findAll.mock.calls[0][0];
+      expect(where[Op.and]).toHaveLength(2);
+      expect(result.nextCursor).toBeNull();
+      expect(decodeCursor(result.prevCursor)).toMatchObject({ direction: 'prev', id: 1 });
+    });
+  });
+});
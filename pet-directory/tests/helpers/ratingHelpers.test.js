@@ -0,0 +1,67 @@
+const { applyRating, ratingSummary } = require('../../helpers/ratingHelpers');
+
+const fakeBusiness = () => {
+  const queryInterface = {
+    quoteIdentifier: (name) => `"${name}"`,
+    queryGenerator: { quoteTable: (name) => `"${name}"` },
+  };
+  const attributes = ['ratingCount', 'ratingSum', 'ratingAverage', 'rating1', 'rating2', 'rating3', 'rating4', 'rating5'];
+  return {
+    sequelize: { getQueryInterface: () => queryInterface },
+    rawAttributes: Object.fromEntries(attributes.map((name) => [name, { field: name }])),
+    update: jest.fn().mockResolvedValue([1]),
+  };
+};
+
+describe('Rating Helpers', () => {
+  it('should apply a rating with one relative update', async () => {
+    const Business = fakeBusiness();
+    const transaction = {};
+
+    await applyRating(Business, 7, 4, 1, { transaction });
+
+    expect(Business.update).toHaveBeenCalledTimes(1);
+    const [values, options] = Business.update.mock.calls[0];
+    expect(values.ratingCount.val).toBe('"ratingCount" + 1');
+    expect(values.ratingSum.val).toBe('"ratingSum" + 4');
+    expect(values.rating4.val).toBe('"rating4" + 1');
+    expect(values.ratingAverage.val).toContain('CASE WHEN');
+    expect(options).toEqual(expect.objectContaining({ where: { id: 7 }, transaction, silent: true }));
+  });
+
+  it('should subtract a removed rating', async () => {
+    const Business = fakeBusiness();
+
+    await applyRating(Business, 7, 2, -1);
+
+    const [values] = Business.update.mock.calls[0];
+    expect(values.ratingCount.val).toBe('"ratingCount" + -1');
+    expect(values.ratingSum.val).toBe('"ratingSum" + -2');
+    expect(values.rating2.val).toBe('"rating2" + -1');
+  });
+
+  it('should reject invalid ratings', async () => {
+    const Business = fakeBusiness();
+
+    await expect(applyRating(Business, 7, 6, 1)).rejects.toThrow('Invalid rating change');
+    await expect(applyRating(Business, 7, 3, 2)).rejects.toThrow('Invalid rating change');
+    expect(Business.update).not.toHaveBeenCalled();
+  });
+
+  it('should summarise aggregates for responses', () => {
+    expect(ratingSummary({
+      ratingCount: 3, ratingSum: 11, ratingAverage: 3.6666, rating3: 1, rating4: 1, rating5: 1,
+    })).toEqual({
+      count: 3,
+      sum: 11,
+      average: 3.67,
+      histogram: { 1: 0, 2: 0, 3: 1, 4: 1, 5: 1 },
+    });
+  });
+
+  it('should default missing aggregates to zero', () => {
+    expect(ratingSummary({})).toEqual({
+      count: 0, sum: 0, average: 0, histogram: { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 },
+    });
+  });
+});
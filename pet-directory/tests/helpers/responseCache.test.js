@@ -0,0 +1,83 @@
+const request = require('supertest');
+const express = require('express');
+const redis = require('../../config/redis');
+const { sendCached } = require('../../helpers/responseCache');
+
+jest.mock('../../config/redis', () => ({
+  getBuffer: jest.fn(),
+  set: jest.fn().mockResolvedValue('OK'),
+  mget: jest.fn().mockResolvedValue(['0']),
+}));
+
+const load = jest.fn();
+
+const app = express();
+app.get('/items', async (req, res) => {
+  const found = await sendCached(req, res, { key: 'items' }, load);
+  if (!found) res.status(404).json({ error: 'Not found' });
+});
+
+describe('Response Cache', () => {
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('should load, store and serve the payload on a miss', async () => {
+    redis.getBuffer.mockResolvedValue(null);
+    load.mockResolvedValue({ items: [1, 2] });
+
+    const res = await request(app).get('/items');
+
+    expect(res.statusCode).toEqual(200);
+    expect(res.body).toEqual({ items: [1, 2] });
+    expect(res.headers.etag).toBeDefined();
+    expect(redis.set).toHaveBeenCalledWith('items', JSON.stringify({ items: [1, 2] }), 'EX', 60);
+  });
+
+  it('should serve stored bytes without calling the loader on a hit', async () => {
+    redis.getBuffer.mockResolvedValue(Buffer.from('{"items":[3]}'));
+
+    const res = await request(app).get('/items');
+
+    expect(res.statusCode).toEqual(200);
+    expect(res.body).toEqual({ items: [3] });
+    expect(load).not.toHaveBeenCalled();
+  });
+
+  it('should answer 304 when the ETag matches', async () => {
+    redis.getBuffer.mockResolvedValue(Buffer.from('{"items":[3]}'));
+    const first = await request(app).get('/items');
+
+    const res = await request(app).get('/items').set('If-None-Match', first.headers.etag);
+
+    expect(res.statusCode).toEqual(304);
+  });
+
+  it('should gzip large payloads when the client accepts it', async () => {
+    const payload = { text: 'x'.repeat(4096) };
+    redis.getBuffer.mockResolvedValue(Buffer.from(JSON.stringify(payload)));
+
+    const res = await request(app).get('/items').set('Accept-Encoding', 'gzip');
+
+    expect(res.headers['content-encoding']).toBe('gzip');
+    expect(res.body).toEqual(payload);
+  });
+
+  it('should share a single load between concurrent misses', async () => {
+    redis.getBuffer.mockResolvedValue(null);
+    load.mockImplementation(() => new Promise((resolve) => setTimeout(() => resolve({ ok: true }), 20)));
+
+    await Promise.all([request(app).get('/items'), request(app).get('/items'), request(app).get('/items')]);
+
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('should let the caller handle a missing payload', async () => {
+    redis.getBuffer.mockResolvedValue(null);
+    load.mockResolvedValue(null);
+
+    const res = await request(app).get('/items');
+
+    expect(res.statusCode).toEqual(404);
+  });
+});
@@ -0,0 +1,53 @@
+const {
+  fieldName, columnResolver, rowMapper, addMissingColumns, addIndexIfMissing,
+} = require('../../helpers/schemaHelpers');
+
+const fakeQueryInterface = (columns, indexes = []) => ({
+  describeTable: jest.fn(async () => Object.fromEntries(columns.map((name) => [name, {}]))),
+  showIndex: jest.fn(async () => indexes.map((name) => ({ name }))),
+  addColumn: jest.fn().mockResolvedValue(),
+  addIndex: jest.fn().mockResolvedValue(),
+});
+
+describe('Schema Helpers', () => {
+  it('should convert attributes to underscored field names', () => {
+    expect(fieldName('createdAt')).toBe('created_at');
+    expect(fieldName('rating1')).toBe('rating1');
+    expect(fieldName('id')).toBe('id');
+  });
+
+  it('should resolve attributes against the live table', async () => {
+    const camel = await columnResolver(fakeQueryInterface(['id', 'createdAt']), 'businesses');
+    const snake = await columnResolver(fakeQueryInterface(['id', 'created_at']), 'businesses');
+
+    expect(camel('createdAt')).toBe('createdAt');
+    expect(snake('createdAt')).toBe('created_at');
+    expect(snake('ratingCount')).toBe('rating_count');
+    expect(snake.has('ratingCount')).toBe(false);
+  });
+
+  it('should map rows onto existing columns only', async () => {
+    const map = await rowMapper(fakeQueryInterface(['id', 'user_id', 'created_at']), 'pets');
+
+    expect(map({ id: 1, userId: 2, createdAt: 'now', nickname: 'x' })).toEqual({ id: 1, user_id: 2, created_at: 'now' });
+  });
+
+  it('should only add missing columns', async () => {
+    const queryInterface = fakeQueryInterface(['id', 'created_at', 'rating_count']);
+
+    await addMissingColumns(queryInterface, 'businesses', { ratingCount: { type: 'INTEGER' }, ratingSum: { type: 'INTEGER' } });
+
+    expect(queryInterface.addColumn).toHaveBeenCalledTimes(1);
+    expect(queryInterface.addColumn).toHaveBeenCalledWith('businesses', 'rating_sum', { type: 'INTEGER' }, {});
+  });
+
+  it('should skip indexes that already exist', async () => {
+    const queryInterface = fakeQueryInterface(['id', 'created_at'], ['businesses_created_at_id']);
+
+    await addIndexIfMissing(queryInterface, 'businesses', ['createdAt', 'id'], { name: 'businesses_created_at_id' });
+    expect(queryInterface.addIndex).not.toHaveBeenCalled();
+
+    await addIndexIfMissing(queryInterface, 'businesses', ['createdAt', 'id'], { name: 'businesses_other' });
+    expect(queryInterface.addIndex).toHaveBeenCalledWith('businesses', ['created_at', 'id'], { name: 'businesses_other' });
+  });
+});
@@ -0,0 +1,107 @@
+const { Op } = require('sequelize');
+const redis = require('../../config/redis');
+const { startInvalidationListener, stopInvalidationListener } = require('../../helpers/cacheHelpers');
+const { searchIndex } = require('../../helpers/searchIndex');
+const { searchBusinesses, indexBusiness } = require('../../helpers/searchHelpers');
+
+jest.mock('../../config/redis', () => {
+  const { EventEmitter: Emitter } = require('events');
+  const subscriber = Object.assign(new Emitter(), {
+    subscribe: jest.fn().mockResolvedValue(1),
+    quit: jest.fn().mockResolvedValue('OK'),
+  });
+  return {
+    subscriber,
+    duplicate: jest.fn(() => subscriber),
+    publish: jest.fn().mockResolvedValue(1),
+  };
+});
+
+const fakeModel = (queryResults) => {
+  const query = jest.fn();
+  queryResults.forEach((result) => query.mockResolvedValueOnce(result));
+  return {
+    sequelize: { getDialect: () => 'postgres', query },
+    findAll: jest.fn(async ({ where }) => where.id[Op.in].map((id) => ({ id }))),
+  };
+};
+
+describe('Search Helpers', () => {
+  it('should read the total from the ranked page', async () => {
+    const Model = fakeModel([[{ id: 4, total: '12' }, { id: 2, total: '12' }]]);
+
+    const result = await searchBusinesses(Model, { query: 'happy paws', limit: 2, offset: 0 });
+
+    expect(result.total).toBe(12);
+    expect(result.rows.map((row) => row.id)).toEqual([4, 2]);
+    expect(Model.sequelize.query).toHaveBeenCalledTimes(1);
+  });
+
+  it('should count separately when the page is past the last result', async () => {
+    const Model = fakeModel([[], [{ total: '12' }]]);
+
+    const result = await searchBusinesses(Model, { query: 'happy', limit: 10, offset: 20 });
+
+    expect(result).toEqual({ total: 12, rows: [] });
+    expect(Model.sequelize.query).toHaveBeenCalledTimes(2);
+    expect(Model.sequelize.query.mock.calls[1][0]).toContain('COUNT(*) AS total');
+  });
+
+  it('should not count again when the first page is empty', async () => {
+    const Model = fakeModel([[]]);
+
+    const result = await searchBusinesses(Model, { query: 'nothing', limit: 10, offset: 0 });
+
+    expect(result).toEqual({ total: 0, rows: [] });
+    expect(Model.sequelize.query).toHaveBeenCalledTimes(1);
+  });
+
+  describe('index sync between processes', () => {
+    const business = (values) => ({
+      ...values,
+      constructor: { sequelize: { getDialect: () => 'sqlite' } },
+      get: () => ({ ...values, createdAt: new Date() }),
+    });
+
+    beforeEach(async () => {
+      await startInvalidationListener();
+      searchIndex.loaded = true;
+    });
+
+    afterEach(async () => {
+      await stopInvalidationListener();
+      searchIndex.clear();
+    });
+
+    it('should broadcast local writes', () => {
+      indexBusiness(business({ id: 9, name: 'Lucky Paws', type: 'Vet' }));
+
+      expect(searchIndex.search('lucky').map((r) => r.id)).toEqual([9]);
+      const [channel, payload] = redis.publish.mock.calls[0];
+      expect(channel).toBe('cache:invalidate');
+      expect(JSON.parse(payload).search).toEqual({
+        upsert: { id: 9, name: 'Lucky Paws', type: 'Vet', description: undefined, address: undefined },
+      });
+    });
+
+    it('should apply writes from other processes', () => {
+      redis.subscriber.emit('message', 'cache:invalidate', JSON.stringify({
+        source: 'other-worker',
+        search: { upsert: { id: 4, name: 'Golden Tails', type: 'Groomer' } },
+      }));
+      expect(searchIndex.search('golden').map((r) => r.id)).toEqual([4]);
+
+      redis.subscriber.emit('message', 'cache:invalidate', JSON.stringify({ source: 'other-worker', search: { remove: 4 } }));
+      expect(searchIndex.search('golden')).toEqual([]);
+    });
+
+    it('should drop the index when messages may have been missed', () => {
+      searchIndex.upsert({ id: 1, name: 'Happy Paws' });
+
+      redis.subscriber.emit('close');
+
+      expect(searchIndex.loaded).toBe(false);
+      expect(searchIndex.search('happy')).toEqual([]);
+    });
+  });
+});
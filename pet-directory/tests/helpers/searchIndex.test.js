@@ -0,0 +1,47 @@
+const { SearchIndex, tokenize } = require('../../helpers/searchIndex');
+
+describe('Search Index', () => {
+  let index;
+
+  beforeEach(() => {
+    index = new SearchIndex();
+    index.upsert({ id: 1, name: 'Happy Paws Grooming', type: 'Groomer', description: 'Professional grooming', address: '1 Main St' });
+    index.upsert({ id: 2, name: 'Downtown Vet Clinic', type: 'Vet', description: 'Emergency care for paws', address: '22 Elm Rd' });
+    index.upsert({ id: 3, name: 'Bark Park', type: 'Dog Park', description: 'Off-leash fun', address: 'Main Ave' });
+  });
+
+  it('should tokenize case- and accent-insensitively', () => {
+    expect(tokenize('Café  du Chien!')).toEqual(['cafe', 'du', 'chien']);
+  });
+
+  it('should rank name matches above description matches', () => {
+    expect(index.search('paws').map((r) => r.id)).toEqual([1, 2]);
+  });
+
+  it('should match prefixes', () => {
+    expect(index.search('groom').map((r) => r.id)).toEqual([1]);
+  });
+
+  it('should tolerate typos', () => {
+    expect(index.search('clinc').map((r) => r.id)).toEqual([2]);
+  });
+
+  it('should match type synonyms', () => {
+    expect(index.search('veterinarian').map((r) => r.id)).toEqual([2]);
+    expect(index.search('grooming', { type: 'Groomer' }).map((r) => r.id)).toEqual([1]);
+  });
+
+  it('should require every query term and honour the type filter', () => {
+    expect(index.search('vet emergency').map((r) => r.id)).toEqual([2]);
+    expect(index.search('main', { type: 'Dog Park' }).map((r) => r.id)).toEqual([3]);
+  });
+
+  it('should apply updates and removals incrementally', () => {
+    index.upsert({ id: 2, name: 'Uptown Vet', type: 'Vet' });
+    index.remove(1);
+
+    expect(index.search('downtown')).toEqual([]);
+    expect(index.search('uptown').map((r) => r.id)).toEqual([2]);
+    expect(index.search('happy')).toEqual([]);
+  });
+});
@@ -0,0 +1,68 @@
+const jwt = require('jsonwebtoken');
+const { JWT_SECRET } = require('../../config/jwt');
+const { authenticate, verifiedTokens } = require('../../middlewares/authMiddleware');
+
+jest.mock('../../config/redis', () => ({}));
+
+const run = (authorization) => {
+  const req = { headers: { authorization } };
+  const res = { status: jest.fn().mockReturnThis(), json: jest.fn().mockReturnThis() };
+  const next = jest.fn();
+  authenticate(req, res, next);
+  return { req, res, next };
+};
+
+describe('Auth Middleware', () => {
+  afterEach(() => {
+    verifiedTokens.clear();
+    jest.restoreAllMocks();
+  });
+
+  it('should accept tokens signed with the configured secret', () => {
+    const token = jwt.sign({ id: 1, role: 'user' }, JWT_SECRET, { expiresIn: '15m' });
+
+    const { req, next } = run(`Bearer ${token}`);
+
+    expect(next).toHaveBeenCalled();
+    expect(req.user).toEqual(expect.objectContaining({ id: 1, role: 'user' }));
+  });
+
+  it('should reject tokens signed with another secret', () => {
+    const token = jwt.sign({ id: 1, role: 'user' }, 'not-the-secret');
+
+    const { res, next } = run(`Bearer ${token}`);
+
+    expect(next).not.toHaveBeenCalled();
+    expect(res.status).toHaveBeenCalledWith(401);
+  });
+
+  it('should reuse verified tokens', () => {
+    const token = jwt.sign({ id: 2, role: 'admin' }, JWT_SECRET, { expiresIn: '15m' });
+    const verify = jest.spyOn(jwt, 'verify');
+
+    run(`Bearer ${token}`);
+    const { req, next } = run(`Bearer ${token}`);
+
+    expect(verify).toHaveBeenCalledTimes(1);
+    expect(next).toHaveBeenCalled();
+    expect(req.user.id).toBe(2);
+  });
+
+  it('should not share req.user between requests', () => {
+    const token = jwt.sign({ id: 3, role: 'user' }, JWT_SECRET, { expiresIn: '15m' });
+
+    const first = run(`Bearer ${token}`);
+    first.req.user.role = 'admin';
+    const second = run(`Bearer ${token}`);
+
+    expect(second.req.user).not.toBe(first.req.user);
+    expect(second.req.user.role).toBe('user');
+  });
+
+  it('should reject malformed authorization headers', () => {
+    const { res, next } = run('Token abc');
+
+    expect(next).not.toHaveBeenCalled();
+    expect(res.status).toHaveBeenCalledWith(401);
+  });
+});
@@ -0,0 +1,37 @@
+const migration = require('../../migrations/20250901000100-add-keyset-indexes');
+
+const fakeQueryInterface = (columns, indexes = []) => ({
+  describeTable: jest.fn(async (table) => Object.fromEntries(columns[table].map((name) => [name, {}]))),
+  showIndex: jest.fn(async () => indexes.map((name) => ({ name }))),
+  addIndex: jest.fn().mockResolvedValue(),
+});
+
+const underscored = {
+  businesses: ['id', 'created_at'],
+  reviews: ['id', 'business_id', 'created_at'],
+  services: ['id', 'business_id', 'created_at'],
+};
+
+describe('Keyset indexes migration', () => {
+  it('should index the columns the keyset queries use', async () => {
+    const queryInterface = fakeQueryInterface(underscored);
+
+    await migration.up(queryInterface);
+
+    expect(queryInterface.addIndex.mock.calls).toEqual([
+      ['businesses', ['created_at', 'id'], { name: 'businesses_created_at_id' }],
+      ['reviews', ['business_id', 'created_at', 'id'], { name: 'reviews_business_id_created_at_id' }],
+      ['services', ['business_id', 'created_at', 'id'], { name: 'services_business_id_created_at_id' }],
+    ]);
+  });
+
+  it('should skip indexes that already exist', async () => {
+    const queryInterface = fakeQueryInterface(underscored, [
+      'businesses_created_at_id', 'reviews_business_id_created_at_id', 'services_business_id_created_at_id',
+    ]);
+
+    await migration.up(queryInterface);
+
+    expect(queryInterface.addIndex).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,40 @@
+const Sequelize = require('sequelize');
+const migration = require('../../migrations/20250901000400-add-business-rating-aggregates');
+
+const fakeQueryInterface = (tables, indexes = []) => ({
+  describeTable: jest.fn(async (table) => Object.fromEntries(tables[table].map((name) => [name, {}]))),
+  showIndex: jest.fn(async () => indexes.map((name) => ({ name }))),
+  addColumn: jest.fn(async (table, column) => { tables[table].push(column); }),
+  addIndex: jest.fn().mockResolvedValue(),
+  quoteIdentifier: (name) => `"${name}"`,
+  sequelize: { query: jest.fn().mockResolvedValue([]) },
+});
+
+describe('Rating aggregates migration', () => {
+  it('should add the columns and index under the model field names', async () => {
+    const tables = { businesses: ['id', 'created_at'], reviews: ['id', 'rating', 'business_id'] };
+    const queryInterface = fakeQueryInterface(tables);
+
+    await migration.up(queryInterface, Sequelize);
+
+    expect(tables.businesses).toEqual(expect.arrayContaining(['rating_count', 'rating_sum', 'rating_average', 'rating5']));
+    expect(queryInterface.addIndex).toHaveBeenCalledWith(
+      'businesses', ['rating_average', 'rating_count', 'id'], { name: 'businesses_rating' }
+    );
+    const [backfill] = queryInterface.sequelize.query.mock.calls[0];
+    expect(backfill).toContain('"rating_count" = (SELECT COUNT(*) FROM reviews WHERE reviews."business_id" = businesses.id)');
+  });
+
+  it('should keep columns and indexes that sync() already created', async () => {
+    const tables = {
+      businesses: ['id', 'rating_count', 'rating_sum', 'rating_average', 'rating1', 'rating2', 'rating3', 'rating4', 'rating5'],
+      reviews: ['id', 'rating', 'business_id'],
+    };
+    const queryInterface = fakeQueryInterface(tables, ['businesses_rating']);
+
+    await migration.up(queryInterface, Sequelize);
+
+    expect(queryInterface.addColumn).not.toHaveBeenCalled();
+    expect(queryInterface.addIndex).not.toHaveBeenCalled();
+  });
+});
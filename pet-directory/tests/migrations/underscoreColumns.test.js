@@ -0,0 +1,47 @@
+const migration = require('../../migrations/20250901000050-underscore-columns');
+
+// Tracks renames so describeTable reflects them
+const fakeQueryInterface = (tables) => ({
+  describeTable: jest.fn(async (table) => Object.fromEntries(tables[table].map((name) => [name, {}]))),
+  renameColumn: jest.fn(async (table, from, to) => {
+    tables[table] = tables[table].map((name) => (name === from ? to : name));
+  }),
+});
+
+const camelCase = () => ({
+  users: ['id', 'createdAt', 'updatedAt'],
+  businesses: ['id', 'contactInfo', 'userId', 'createdAt', 'updatedAt'],
+  pets: ['id', 'userId', 'createdAt', 'updatedAt'],
+  services: ['id', 'businessId', 'createdAt', 'updatedAt'],
+  reviews: ['id', 'userId', 'businessId', 'serviceId', 'createdAt', 'updatedAt'],
+});
+
+describe('Underscore columns migration', () => {
+  it('should rename camelCase columns to the model field names', async () => {
+    const tables = camelCase();
+
+    await migration.up(fakeQueryInterface(tables));
+
+    expect(tables.businesses).toEqual(['id', 'contact_info', 'user_id', 'created_at', 'updated_at']);
+    expect(tables.reviews).toEqual(['id', 'user_id', 'business_id', 'service_id', 'created_at', 'updated_at']);
+  });
+
+  it('should leave tables created by sync() alone', async () => {
+    const tables = camelCase();
+    await migration.up(fakeQueryInterface(tables));
+    const queryInterface = fakeQueryInterface(tables);
+
+    await migration.up(queryInterface);
+
+    expect(queryInterface.renameColumn).not.toHaveBeenCalled();
+  });
+
+  it('should restore the camelCase columns on down', async () => {
+    const tables = camelCase();
+    await migration.up(fakeQueryInterface(tables));
+
+    await migration.down(fakeQueryInterface(tables));
+
+    expect(tables).toEqual(camelCase());
+  });
+});